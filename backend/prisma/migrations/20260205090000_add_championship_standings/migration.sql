@@ -0,0 +1,41 @@
+-- CreateTable
+CREATE TABLE "driver_standings" (
+    "id" TEXT NOT NULL,
+    "season" INTEGER NOT NULL,
+    "round" INTEGER NOT NULL,
+    "driver_id" TEXT NOT NULL,
+    "position" INTEGER NOT NULL,
+    "points" DOUBLE PRECISION NOT NULL,
+    "wins" INTEGER NOT NULL DEFAULT 0,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "driver_standings_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "constructor_standings" (
+    "id" TEXT NOT NULL,
+    "season" INTEGER NOT NULL,
+    "round" INTEGER NOT NULL,
+    "constructor_id" TEXT NOT NULL,
+    "position" INTEGER NOT NULL,
+    "points" DOUBLE PRECISION NOT NULL,
+    "wins" INTEGER NOT NULL DEFAULT 0,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "constructor_standings_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "driver_standings_season_round_idx" ON "driver_standings"("season", "round");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "driver_standings_season_round_driver_id_key" ON "driver_standings"("season", "round", "driver_id");
+
+-- CreateIndex
+CREATE INDEX "constructor_standings_season_round_idx" ON "constructor_standings"("season", "round");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "constructor_standings_season_round_constructor_id_key" ON "constructor_standings"("season", "round", "constructor_id");
@@ -0,0 +1,58 @@
+"""Analytics endpoints: race pace, stints and tyre degradation from stored laps."""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.config import RACE_PACE_FUEL_MS_PER_LAP
+from app.schemas.analytics import RacePaceResponse
+from app.services.fastf1_executor import ExecutorBusyError, fastf1_executor
+from app.services.single_flight import sync_flights
+import functools
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/{season}/race-pace", response_model=RacePaceResponse)
+async def get_race_pace(
+    season: int,
+    rounds: Optional[list[int]] = Query(None, alias="round"),
+    drivers: Optional[list[str]] = Query(None, alias="driver"),
+    fuel_ms_per_lap: float = Query(RACE_PACE_FUEL_MS_PER_LAP, ge=0),
+    include_laps: bool = False,
+):
+    """
+    Race pace for a season's races: per-driver pace and deficit to the fastest
+    driver in each round, the season average, per-stint pace with tyre
+    degradation slopes, and optionally every lap with its fuel-corrected time
+    and gap to the leader.
+    
+    Races not yet in the lap store are ingested from FastF1 first. Team labels
+    and ids match the synced drivers and constructors tables.
+    """
+    from app.services.race_pace import season_race_pace
+    
+    params = {
+        "season": season,
+        "rounds": sorted(rounds) if rounds else None,
+        "drivers": sorted(driver.upper() for driver in drivers) if drivers else None,
+        "fuel_ms_per_lap": fuel_ms_per_lap,
+        "include_laps": include_laps,
+    }
+    
+    async def run() -> RacePaceResponse:
+        analysed = await fastf1_executor.run(functools.partial(
+            season_race_pace, season, params["rounds"], params["drivers"], fuel_ms_per_lap, include_laps
+        ))
+        return RacePaceResponse(season=season, fuel_correction_ms_per_lap=fuel_ms_per_lap, **analysed)
+    
+    try:
+        # Concurrent identical requests share one computation
+        return await sync_flights.do(f"race_pace:{json.dumps(params, sort_keys=True)}", run)
+        
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing race pace: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
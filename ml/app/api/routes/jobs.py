@@ -0,0 +1,102 @@
+"""Background job endpoints for long-running syncs."""
+from fastapi import APIRouter, HTTPException
+from app.schemas.driver import DriverSyncRequest
+from app.schemas.team import TeamSyncRequest
+from app.schemas.lineup import LineupSyncRequest
+from app.schemas.results import ResultsSyncRequest
+from app.schemas.job import JobStatusResponse
+from app.services.jobs import Job, job_manager
+from app.api.routes.sync import (
+    driver_sync_params,
+    team_sync_params,
+    run_driver_sync,
+    run_team_sync,
+    run_lineup_sync,
+    run_results_sync,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _job_response(job: Job, created: bool = True) -> JobStatusResponse:
+    return JobStatusResponse(**job.to_dict(), deduplicated=not created)
+
+
+@router.post("/drivers", response_model=JobStatusResponse, status_code=202)
+async def submit_driver_sync_job(request: DriverSyncRequest):
+    """
+    Start a driver sync in the background and return its job id immediately.
+    Poll GET /api/sync/jobs/{job_id} for status and progress.
+    """
+    params = driver_sync_params(request)
+    job, created = job_manager.submit(
+        "drivers",
+        params,
+        lambda job: run_driver_sync(request, job),
+        seasons_total=len(params["seasons"]),
+    )
+    return _job_response(job, created)
+
+
+@router.post("/teams", response_model=JobStatusResponse, status_code=202)
+async def submit_team_sync_job(request: TeamSyncRequest):
+    """
+    Start a team sync in the background and return its job id immediately.
+    Poll GET /api/sync/jobs/{job_id} for status and progress.
+    """
+    params = team_sync_params(request)
+    job, created = job_manager.submit(
+        "teams",
+        params,
+        lambda job: run_team_sync(request, job),
+        seasons_total=len(params["seasons"]),
+    )
+    return _job_response(job, created)
+
+
+@router.post("/lineups", response_model=JobStatusResponse, status_code=202)
+async def submit_lineup_sync_job(request: LineupSyncRequest):
+    """
+    Start a lineup sync in the background and return its job id immediately.
+    Poll GET /api/sync/jobs/{job_id} for status and progress.
+    """
+    job, created = job_manager.submit(
+        "lineups",
+        {"season": request.season},
+        lambda job: run_lineup_sync(request, job),
+        seasons_total=1,
+    )
+    return _job_response(job, created)
+
+
+@router.post("/results", response_model=JobStatusResponse, status_code=202)
+async def submit_results_sync_job(request: ResultsSyncRequest):
+    """
+    Start a results sync in the background and return its job id immediately.
+    Poll GET /api/sync/jobs/{job_id} for status and progress.
+    """
+    job, created = job_manager.submit(
+        "results",
+        {"season": request.season},
+        lambda job: run_results_sync(request, job),
+        seasons_total=1,
+    )
+    return _job_response(job, created)
+
+
+@router.get("", response_model=list[JobStatusResponse])
+async def list_jobs():
+    """List known jobs, most recent first."""
+    return [_job_response(job) for job in job_manager.list()]
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """Get status and progress of a background job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _job_response(job)
@@ -0,0 +1,95 @@
+"""Lap store endpoints: ingest session laps from FastF1 and query them."""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.schemas.laps import LapIngestRequest, LapIngestResponse, LapsResponse
+from app.services.fastf1_executor import ExecutorBusyError, fastf1_executor
+from app.services.metrics import SYNC_ROWS
+from app.services.single_flight import sync_flights
+from app.services.tracing import span
+import functools
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _ingest_laps(request: LapIngestRequest) -> dict:
+    """Ingest a season's laps into the lap store (blocking)."""
+    from app.services.fastf1_service import ingest_season_laps
+    
+    return ingest_season_laps(
+        request.season,
+        request.session_types,
+        request.parallel if request.parallel is not None else True,
+        bool(request.refresh),
+    )
+
+
+def _ingest_response(season: int, ingested: dict) -> LapIngestResponse:
+    errors = ingested["errors"]
+    success = bool(ingested["sessions"] or ingested["skipped"])
+    if success:
+        SYNC_ROWS.labels(kind="laps").observe(ingested["laps"])
+    return LapIngestResponse(
+        success=success,
+        message=(
+            f"Stored {ingested['laps']} laps from {ingested['sessions']} sessions of season {season} "
+            f"({ingested['skipped']} sessions already stored)"
+            if success else f"No laps available for season {season}"
+        ),
+        sessions_stored=ingested["sessions"],
+        laps_stored=ingested["laps"],
+        sessions_skipped=ingested["skipped"],
+        errors=errors if errors else None,
+    )
+
+
+@router.post("/ingest", response_model=LapIngestResponse)
+async def ingest_laps_endpoint(request: LapIngestRequest):
+    """
+    Load a season's session laps from FastF1 and write them to the Parquet lap store,
+    partitioned by season, round and session. Sessions already stored are skipped
+    unless refresh is set.
+    """
+    params = {
+        "season": request.season,
+        "session_types": request.session_types or ["R"],
+        "refresh": bool(request.refresh),
+    }
+    
+    async def run() -> LapIngestResponse:
+        with span("lap ingest", season=request.season):
+            ingested = await fastf1_executor.run(functools.partial(_ingest_laps, request))
+        return _ingest_response(request.season, ingested)
+    
+    try:
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(f"laps:{json.dumps(params, sort_keys=True)}", run)
+        
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in lap ingest: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{season}", response_model=LapsResponse)
+def get_laps(
+    season: int,
+    rounds: Optional[list[int]] = Query(None, alias="round"),
+    session_types: Optional[list[str]] = Query(None, alias="session"),
+    drivers: Optional[list[str]] = Query(None, alias="driver"),
+):
+    """
+    Stored laps for a season, filtered by round, session type and driver code
+    (each repeatable). Filters are pushed down to the Parquet scan, so only
+    matching partitions and row groups are read.
+    """
+    from app.services.lap_store import lap_store
+    
+    laps = lap_store.read(season, rounds=rounds, session_types=session_types, drivers=drivers)
+    # Nullable columns to plain Python values with None for missing
+    records = laps.astype(object).where(laps.notna(), None).to_dict("records")
+    return LapsResponse(season=season, count=len(records), laps=records)
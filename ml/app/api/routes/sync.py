@@ -1,19 +1,22 @@
 """Sync endpoints for FastF1 data."""
+from typing import Any, Callable, Optional
 from fastapi import APIRouter, HTTPException
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from app.config import DATABASE_URL
+from app.config import DB_UPSERT_BATCH_SIZE
+from app.db import pool_stats, run_in_async_session
 from app.schemas.driver import DriverSyncRequest, DriverSyncResponse
 from app.schemas.team import TeamSyncRequest, TeamSyncResponse
 from app.schemas.lineup import LineupSyncRequest, LineupSyncResponse
-from app.services.fastf1_service import (
-    sync_drivers, 
-    sync_teams, 
-    get_season_driver_lineup,
-    get_season_constructor_lineup,
-    CURRENT_SEASON, 
-    CONFIRMED_2026_DRIVERS
-)
+from app.schemas.standings import StandingsSyncRequest, StandingsSyncResponse
+from app.schemas.results import ResultsSyncRequest, ResultsSyncResponse
+from app.services.change_detection import classify_changes
+from app.services.fastf1_executor import BACKEND_THREAD, ExecutorBusyError, fastf1_executor
+from app.services.jobs import Job, JobManager
+from app.services.metrics import DB_UPSERT_SECONDS, SYNC_ROWS
+from app.services.tracing import span, span_exporter
+from app.services.single_flight import sync_flights
+from app.services.seasons import CURRENT_SEASON, CONFIRMED_2026_DRIVERS, resolve_seasons
+import functools
+import json
 import logging
 import uuid
 
@@ -21,238 +24,386 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Database connection
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine)
+# The FastF1 service (fastf1, pandas) and SQLAlchemy are imported inside the
+# functions that use them, so importing this module stays cheap at startup.
 
 
-@router.post("/drivers", response_model=DriverSyncResponse)
-async def sync_drivers_endpoint(request: DriverSyncRequest):
-    """Sync drivers from FastF1 to database."""
-    try:
-        logger.info("Starting driver sync")
-        
-        # Fetch drivers from FastF1 (run in thread pool to avoid blocking)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, 
-            sync_drivers, 
-            request.seasons,
-            request.season,
-            request.filter_confirmed if request.filter_confirmed is not None else True
+# Set-based driver upsert: duplicate-by-code resolution and the upsert run in a
+# single statement per batch, so round trips scale with batches, not rows.
+DRIVER_BATCH_UPSERT_QUERY = """
+    WITH incoming AS (
+        SELECT DISTINCT ON (x.driver_id) x.*
+        FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS x(
+            ord integer, id text, driver_id text, code text, lookup_code text,
+            forename text, surname text, date_of_birth timestamp,
+            nationality text, permanent_number integer,
+            driver_championships integer, constructor_championships integer,
+            current_team text, is_active boolean
         )
-        drivers = result["drivers"]
-        
-        if not drivers:
-            return DriverSyncResponse(
-                success=False,
-                message="No drivers found to sync",
-                drivers_synced=0,
-            )
-        
-        # Insert/update drivers in database
-        db = SessionLocal()
-        errors = []
-        synced_count = 0
-        
-        try:
-            # First, clean up any duplicate drivers before syncing
-            # Find duplicates by code (3-letter) and keep only the one with the most recent update
-            cleanup_query = text("""
-                WITH duplicates AS (
-                    SELECT 
-                        code,
-                        COUNT(*) as count,
-                        MAX(updated_at) as latest_update
-                    FROM drivers
-                    WHERE code IS NOT NULL 
-                    AND LENGTH(code) = 3
-                    GROUP BY code
-                    HAVING COUNT(*) > 1
-                ),
-                to_delete AS (
-                    SELECT d.id
-                    FROM drivers d
-                    INNER JOIN duplicates dup ON d.code = dup.code
-                    WHERE d.updated_at < dup.latest_update
-                )
-                DELETE FROM drivers
-                WHERE id IN (SELECT id FROM to_delete)
-            """)
-            
+        ORDER BY x.driver_id, x.ord DESC
+    ),
+    replaced AS (
+        -- Rows sharing a 3-letter code under a different driver_id are superseded,
+        -- unless that driver is part of this sync (possibly unchanged and not in the batch)
+        DELETE FROM drivers d
+        USING incoming i
+        WHERE i.lookup_code IS NOT NULL
+        AND d.code = i.lookup_code
+        AND d.driver_id <> i.driver_id
+        AND d.driver_id NOT IN (SELECT jsonb_array_elements_text(CAST(:synced_ids AS jsonb)))
+        RETURNING d.id
+    ),
+    upserted AS (
+        INSERT INTO drivers (
+            id, driver_id, code, forename, surname, date_of_birth,
+            nationality, url, permanent_number,
+            driver_championships, constructor_championships,
+            current_team, is_active, created_at, updated_at
+        )
+        SELECT
+            id, driver_id, code, forename, surname, date_of_birth,
+            nationality, NULL, permanent_number,
+            driver_championships, constructor_championships,
+            current_team, is_active, NOW(), NOW()
+        FROM incoming
+        ON CONFLICT (driver_id) DO UPDATE SET
+            code = EXCLUDED.code,
+            forename = EXCLUDED.forename,
+            surname = EXCLUDED.surname,
+            date_of_birth = EXCLUDED.date_of_birth,
+            nationality = EXCLUDED.nationality,
+            url = EXCLUDED.url,
+            permanent_number = EXCLUDED.permanent_number,
+            driver_championships = EXCLUDED.driver_championships,
+            constructor_championships = EXCLUDED.constructor_championships,
+            current_team = EXCLUDED.current_team,
+            is_active = EXCLUDED.is_active,
+            updated_at = NOW()
+        RETURNING id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM upserted) AS upserted_count,
+        (SELECT COUNT(*) FROM replaced) AS replaced_count
+"""
+
+
+# Stored columns compared against incoming records; a row is only rewritten
+# (and its updated_at bumped) when one of them differs
+DRIVER_FINGERPRINT_FIELDS = (
+    "code", "forename", "surname", "date_of_birth", "nationality", "url", "permanent_number",
+    "driver_championships", "constructor_championships", "current_team", "is_active",
+)
+TEAM_FINGERPRINT_FIELDS = ("name", "nationality")
+
+
+def _stored_rows(db, table: str, key: str, fields: tuple[str, ...], keys: list[str]) -> dict[str, dict]:
+    """
+    Load the stored rows for the given keys in one query.
+    
+    Returns:
+        Dict of key -> row (id, key and fields)
+    """
+    from sqlalchemy import text
+    
+    if not keys:
+        return {}
+    query = text(f"SELECT id, {key}, {', '.join(fields)} FROM {table} WHERE {key} = ANY(:keys)")
+    with span("db read", table=table, rows=len(keys)):
+        result = db.execute(query, {"keys": list(keys)})
+    return {row[key]: dict(row) for row in result.mappings()}
+
+
+def _upsert_drivers(db, drivers: list[dict]) -> tuple[int, int, int, int]:
+    """
+    Write new and changed drivers in batches of DB_UPSERT_BATCH_SIZE rows.
+    Drivers whose stored row already matches are skipped.
+    
+    Returns:
+        Tuple of (rows inserted, rows updated, rows unchanged, duplicate rows deleted by code)
+    """
+    from sqlalchemy import text
+    
+    rows = []
+    for ord_, driver_data in enumerate(drivers):
+        driver_code = driver_data.get("code", "").upper() if driver_data.get("code") else None
+        rows.append({
+            "ord": ord_,
+            # Only used when inserting; existing rows keep their id
+            "id": str(uuid.uuid4()),
+            # Normalize driver_id to lowercase for consistency
+            "driver_id": driver_data["driver_id"].lower(),
+            "code": driver_data.get("code"),
+            "lookup_code": driver_code if driver_code and len(driver_code) == 3 else None,
+            "forename": driver_data["forename"],
+            "surname": driver_data["surname"],
+            "date_of_birth": driver_data.get("date_of_birth"),
+            "nationality": driver_data["nationality"],
+            "permanent_number": driver_data.get("permanent_number"),
+            "driver_championships": driver_data.get("driver_championships", 0),
+            "constructor_championships": driver_data.get("constructor_championships", 0),
+            "current_team": driver_data.get("current_team"),
+            "is_active": driver_data.get("is_active", True),
+        })
+    
+    driver_ids = sorted({row["driver_id"] for row in rows})
+    stored = _stored_rows(db, "drivers", "driver_id", DRIVER_FINGERPRINT_FIELDS, driver_ids)
+    inserted, updated, unchanged = classify_changes(rows, stored, "driver_id", DRIVER_FINGERPRINT_FIELDS)
+    changed = sorted(inserted + updated, key=lambda row: row["ord"])
+    
+    replaced_count = 0
+    for start in range(0, len(changed), DB_UPSERT_BATCH_SIZE):
+        batch = changed[start:start + DB_UPSERT_BATCH_SIZE]
+        with span("db upsert", table="drivers", rows=len(batch)), DB_UPSERT_SECONDS.labels(table="drivers").time():
+            result = db.execute(text(DRIVER_BATCH_UPSERT_QUERY), {
+                "rows": json.dumps(batch, default=str),
+                "synced_ids": json.dumps(driver_ids),
+            }).fetchone()
+        replaced_count += int(result[1])
+    return len(inserted), len(updated), len(unchanged), replaced_count
+
+
+def driver_sync_params(request: DriverSyncRequest) -> dict:
+    """Normalized driver sync parameters, used to recognize identical requests."""
+    return {
+        "seasons": resolve_seasons(request.seasons, request.season),
+        "filter_confirmed": request.filter_confirmed if request.filter_confirmed is not None else True,
+    }
+
+
+def team_sync_params(request: TeamSyncRequest) -> dict:
+    """Normalized team sync parameters, used to recognize identical requests."""
+    return {"seasons": resolve_seasons(request.seasons, request.season)}
+
+
+def _sync_key(kind: str, params: dict) -> str:
+    """Single-flight key of a sync; background jobs use the same one, so requests and jobs share runs."""
+    return JobManager.job_key(kind, params)
+
+
+# Each sync runs as three steps: fetch (blocking FastF1/Ergast work), store
+# (statements on a Session, inside one transaction) and respond. Request
+# handlers and background jobs alike fetch on the FastF1 executor and store
+# through the async engine. fetch is a functools.partial of a module-level
+# function so it can be sent to a worker process.
+
+def _season_attributes(seasons: list[int]) -> dict:
+    """Span attributes for the seasons a sync covers."""
+    return {"season": seasons[0]} if len(seasons) == 1 else {"seasons": seasons}
+
+
+def _database_error(label: str, error: Exception) -> HTTPException:
+    logger.error(f"Database error during {label}: {error}")
+    return HTTPException(status_code=500, detail=f"Database error: {str(error)}")
+
+
+def _progress(job: Optional[Job]) -> Optional[Job]:
+    """
+    The job fetches report progress to. Worker processes cannot call back
+    into the job, so with the process backend only rows written are counted.
+    """
+    return job if fastf1_executor.backend == BACKEND_THREAD else None
+
+
+async def _run_sync_async(fetch: Callable[[], Any], store: Callable[[Any, Any], Any], respond: Callable[[Any, Any], Any], label: str, **attributes):
+    """Run a sync's fetch on the FastF1 executor and its writes on the async engine, traced as one span."""
+    with span(label, **attributes):
+        fetched = await fastf1_executor.run(fetch)
+        stored = None
+        if fetched:
             try:
-                cleanup_result = db.execute(cleanup_query)
-                deleted_count = cleanup_result.rowcount
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} duplicate driver entries before sync")
+                stored = await run_in_async_session(lambda db: store(db, fetched))
             except Exception as e:
-                logger.warning(f"Could not clean up duplicates: {e}")
+                raise _database_error(label, e)
+        return respond(fetched, stored)
+
+
+def _fetch_drivers(request: DriverSyncRequest, job: Optional[Job] = None) -> list[dict]:
+    """Fetch drivers from FastF1 (blocking)."""
+    from app.services.fastf1_service import sync_drivers
+    
+    logger.info("Starting driver sync")
+    
+    result = sync_drivers(
+        request.seasons,
+        request.season,
+        request.filter_confirmed if request.filter_confirmed is not None else True,
+        request.parallel if request.parallel is not None else True,
+        on_season_done=job.season_done if job else None,
+    )
+    return result["drivers"]
+
+
+def _store_drivers(db, request: DriverSyncRequest, drivers: list[dict], job: Optional[Job] = None) -> tuple[int, int, int]:
+    """
+    Write fetched drivers inside the caller's transaction.
+    
+    Returns:
+        Tuple of (drivers inserted, drivers updated, drivers unchanged)
+    """
+    from sqlalchemy import text
+    
+    # First, clean up any duplicate drivers before syncing
+    # Find duplicates by code (3-letter) and keep only the one with the most recent update
+    cleanup_query = text("""
+        WITH duplicates AS (
+            SELECT 
+                code,
+                COUNT(*) as count,
+                MAX(updated_at) as latest_update
+            FROM drivers
+            WHERE code IS NOT NULL 
+            AND LENGTH(code) = 3
+            GROUP BY code
+            HAVING COUNT(*) > 1
+        ),
+        to_delete AS (
+            SELECT d.id
+            FROM drivers d
+            INNER JOIN duplicates dup ON d.code = dup.code
+            WHERE d.updated_at < dup.latest_update
+        )
+        DELETE FROM drivers
+        WHERE id IN (SELECT id FROM to_delete)
+    """)
+    
+    try:
+        with span("db cleanup", table="drivers", step="duplicate codes"):
+            cleanup_result = db.execute(cleanup_query)
+        deleted_count = cleanup_result.rowcount
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} duplicate driver entries before sync")
+    except Exception as e:
+        logger.warning(f"Could not clean up duplicates: {e}")
+    
+    # Also clean up drivers with numeric codes (old format) if we have a 3-letter code version
+    cleanup_numeric_query = text("""
+        DELETE FROM drivers d1
+        WHERE d1.code ~ '^[0-9]+$'
+        AND EXISTS (
+            SELECT 1 FROM drivers d2
+            WHERE d2.forename = d1.forename
+            AND d2.surname = d1.surname
+            AND d2.code IS NOT NULL
+            AND LENGTH(d2.code) = 3
+        )
+    """)
+    
+    try:
+        with span("db cleanup", table="drivers", step="numeric codes"):
+            cleanup_numeric_result = db.execute(cleanup_numeric_query)
+        deleted_numeric_count = cleanup_numeric_result.rowcount
+        if deleted_numeric_count > 0:
+            logger.info(f"Cleaned up {deleted_numeric_count} drivers with numeric codes (replaced by 3-letter codes)")
+    except Exception as e:
+        logger.warning(f"Could not clean up numeric code drivers: {e}")
+    
+    inserted_count, updated_count, unchanged_count, replaced_count = _upsert_drivers(db, drivers)
+    if job:
+        job.add_rows(inserted_count + updated_count)
+    if replaced_count > 0:
+        logger.info(f"Deleted {replaced_count} duplicate driver entries matched by code")
+    
+    # Mark drivers not in the confirmed lineup as inactive (only for current/future seasons with filtering enabled)
+    # This handles cases where drivers are no longer in the lineup (e.g., MAG, ZHO, TSU, DOO)
+    target_season = request.season if request.season is not None else (request.seasons[0] if request.seasons else CURRENT_SEASON)
+    should_filter = request.filter_confirmed if request.filter_confirmed is not None else True
+    
+    if target_season >= CURRENT_SEASON and should_filter:
+        confirmed_driver_codes = [code.upper() for code in CONFIRMED_2026_DRIVERS]
+        
+        # Mark drivers with codes not in confirmed list as inactive
+        # Also deactivate drivers with numeric codes (old format) or codes that don't match
+        # Build parameterized query with proper IN clause
+        if confirmed_driver_codes:
+            # Create placeholders for IN clause
+            placeholders = ', '.join([f':code_{i}' for i in range(len(confirmed_driver_codes))])
+            params = {f'code_{i}': code for i, code in enumerate(confirmed_driver_codes)}
             
-            # Also clean up drivers with numeric codes (old format) if we have a 3-letter code version
-            cleanup_numeric_query = text("""
-                DELETE FROM drivers d1
-                WHERE d1.code ~ '^[0-9]+$'
-                AND EXISTS (
-                    SELECT 1 FROM drivers d2
-                    WHERE d2.forename = d1.forename
-                    AND d2.surname = d1.surname
-                    AND d2.code IS NOT NULL
-                    AND LENGTH(d2.code) = 3
+            deactivate_query = text(f"""
+                UPDATE drivers 
+                SET is_active = false, updated_at = NOW()
+                WHERE is_active = true
+                AND (
+                    -- Code is numeric (old format, should be 3-letter)
+                    (code IS NOT NULL AND code ~ '^[0-9]+$')
+                    OR
+                    -- Code is not in confirmed list (3-letter codes only)
+                    (code IS NOT NULL AND LENGTH(code) = 3 AND UPPER(code) NOT IN ({placeholders}))
                 )
             """)
             
             try:
-                cleanup_numeric_result = db.execute(cleanup_numeric_query)
-                deleted_numeric_count = cleanup_numeric_result.rowcount
-                if deleted_numeric_count > 0:
-                    logger.info(f"Cleaned up {deleted_numeric_count} drivers with numeric codes (replaced by 3-letter codes)")
+                with span("db cleanup", table="drivers", step="deactivate unconfirmed"):
+                    result = db.execute(deactivate_query, params)
+                deactivated_count = result.rowcount
+                if deactivated_count > 0:
+                    logger.info(f"Marked {deactivated_count} drivers as inactive (not in {target_season} confirmed lineup or invalid format)")
             except Exception as e:
-                logger.warning(f"Could not clean up numeric code drivers: {e}")
-            
-            for driver_data in drivers:
-                try:
-                    driver_id_value = driver_data["driver_id"]
-                    driver_code = driver_data.get("code", "").upper() if driver_data.get("code") else None
-                    
-                    # Normalize driver_id to lowercase for consistency
-                    driver_id_value = driver_id_value.lower()
-                    
-                    # Check if driver exists by driver_id
-                    check_query = text("SELECT id FROM drivers WHERE driver_id = :driver_id")
-                    existing_row = db.execute(check_query, {"driver_id": driver_id_value}).fetchone()
-                    
-                    # Also check if there's a duplicate by code (if code is provided)
-                    duplicate_by_code = None
-                    if driver_code and len(driver_code) == 3:
-                        check_code_query = text("""
-                            SELECT id, driver_id FROM drivers 
-                            WHERE code = :code AND driver_id != :driver_id
-                        """)
-                        duplicate_row = db.execute(
-                            check_code_query, 
-                            {"code": driver_code, "driver_id": driver_id_value}
-                        ).fetchone()
-                        if duplicate_row:
-                            duplicate_by_code = duplicate_row
-                            logger.warning(
-                                f"Found duplicate driver by code {driver_code}: "
-                                f"existing driver_id={duplicate_row[1]}, new driver_id={driver_id_value}"
-                            )
-                    
-                    # Generate ID: use existing if found, otherwise generate new UUID
-                    record_id = existing_row[0] if existing_row else str(uuid.uuid4())
-                    
-                    # If we found a duplicate by code, delete it first to prevent conflicts
-                    if duplicate_by_code:
-                        delete_duplicate_query = text("DELETE FROM drivers WHERE id = :id")
-                        db.execute(delete_duplicate_query, {"id": duplicate_by_code[0]})
-                        logger.info(f"Deleted duplicate driver entry with id={duplicate_by_code[0]}")
-                    
-                    # Use raw SQL for upsert (PostgreSQL)
-                    query = text("""
-                        INSERT INTO drivers (
-                            id, driver_id, code, forename, surname, date_of_birth,
-                            nationality, url, permanent_number,
-                            driver_championships, constructor_championships,
-                            current_team, is_active, created_at, updated_at
-                        )
-                        VALUES (
-                            :id, :driver_id, :code, :forename, :surname, :date_of_birth,
-                            :nationality, :url, :permanent_number,
-                            :driver_championships, :constructor_championships,
-                            :current_team, :is_active, NOW(), NOW()
-                        )
-                        ON CONFLICT (driver_id) DO UPDATE SET
-                            code = EXCLUDED.code,
-                            forename = EXCLUDED.forename,
-                            surname = EXCLUDED.surname,
-                            date_of_birth = EXCLUDED.date_of_birth,
-                            nationality = EXCLUDED.nationality,
-                            url = EXCLUDED.url,
-                            permanent_number = EXCLUDED.permanent_number,
-                            driver_championships = EXCLUDED.driver_championships,
-                            constructor_championships = EXCLUDED.constructor_championships,
-                            current_team = EXCLUDED.current_team,
-                            is_active = EXCLUDED.is_active,
-                            updated_at = NOW()
-                    """)
-                    
-                    db.execute(query, {
-                        "id": record_id,
-                        "driver_id": driver_id_value,
-                        "code": driver_data.get("code"),
-                        "forename": driver_data["forename"],
-                        "surname": driver_data["surname"],
-                        "date_of_birth": driver_data.get("date_of_birth"),
-                        "nationality": driver_data["nationality"],
-                        "url": None,
-                        "permanent_number": driver_data.get("permanent_number"),
-                        "driver_championships": driver_data.get("driver_championships", 0),
-                        "constructor_championships": driver_data.get("constructor_championships", 0),
-                        "current_team": driver_data.get("current_team"),
-                        "is_active": driver_data.get("is_active", True),
-                    })
-                    synced_count += 1
-                except Exception as e:
-                    error_msg = f"Error syncing driver {driver_data.get('driver_id')}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-            
-            # Mark drivers not in the confirmed lineup as inactive (only for current/future seasons with filtering enabled)
-            # This handles cases where drivers are no longer in the lineup (e.g., MAG, ZHO, TSU, DOO)
-            target_season = request.season if request.season is not None else (request.seasons[0] if request.seasons else CURRENT_SEASON)
-            should_filter = request.filter_confirmed if request.filter_confirmed is not None else True
-            
-            if target_season >= CURRENT_SEASON and should_filter:
-                confirmed_driver_codes = [code.upper() for code in CONFIRMED_2026_DRIVERS]
-                
-                # Mark drivers with codes not in confirmed list as inactive
-                # Also deactivate drivers with numeric codes (old format) or codes that don't match
-                # Build parameterized query with proper IN clause
-                if confirmed_driver_codes:
-                    # Create placeholders for IN clause
-                    placeholders = ', '.join([f':code_{i}' for i in range(len(confirmed_driver_codes))])
-                    params = {f'code_{i}': code for i, code in enumerate(confirmed_driver_codes)}
-                    
-                    deactivate_query = text(f"""
-                        UPDATE drivers 
-                        SET is_active = false, updated_at = NOW()
-                        WHERE is_active = true
-                        AND (
-                            -- Code is numeric (old format, should be 3-letter)
-                            (code IS NOT NULL AND code ~ '^[0-9]+$')
-                            OR
-                            -- Code is not in confirmed list (3-letter codes only)
-                            (code IS NOT NULL AND LENGTH(code) = 3 AND UPPER(code) NOT IN ({placeholders}))
-                        )
-                    """)
-                    
-                    try:
-                        result = db.execute(deactivate_query, params)
-                        deactivated_count = result.rowcount
-                        if deactivated_count > 0:
-                            logger.info(f"Marked {deactivated_count} drivers as inactive (not in {target_season} confirmed lineup or invalid format)")
-                    except Exception as e:
-                        logger.warning(f"Could not deactivate old drivers: {e}")
-            
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Database error during sync: {e}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-        finally:
-            db.close()
-        
-        logger.info(f"Successfully synced {synced_count} drivers")
-        
+                logger.warning(f"Could not deactivate old drivers: {e}")
+    
+    return inserted_count, updated_count, unchanged_count
+
+
+def _driver_response(drivers: list[dict], stored: Optional[tuple[int, int, int]]) -> DriverSyncResponse:
+    if not drivers:
         return DriverSyncResponse(
-            success=True,
-            message=f"Synced {synced_count} drivers",
-            drivers_synced=synced_count,
-            errors=errors if errors else None,
+            success=False,
+            message="No drivers found to sync",
+            drivers_synced=0,
+        )
+    
+    inserted_count, updated_count, unchanged_count = stored
+    synced_count = inserted_count + updated_count + unchanged_count
+    SYNC_ROWS.labels(kind="drivers").observe(inserted_count + updated_count)
+    logger.info(
+        f"Successfully synced {synced_count} drivers: {inserted_count} inserted, "
+        f"{updated_count} updated, {unchanged_count} unchanged"
+    )
+    
+    return DriverSyncResponse(
+        success=True,
+        message=f"Synced {synced_count} drivers ({inserted_count} inserted, {updated_count} updated, {unchanged_count} unchanged)",
+        drivers_synced=synced_count,
+        drivers_inserted=inserted_count,
+        drivers_updated=updated_count,
+        drivers_unchanged=unchanged_count,
+    )
+
+
+def _driver_sync_steps(request: DriverSyncRequest, job: Optional[Job] = None) -> tuple:
+    return (
+        functools.partial(_fetch_drivers, request, _progress(job)),
+        lambda db, drivers: _store_drivers(db, request, drivers, job),
+        _driver_response,
+    )
+
+
+async def run_driver_sync(request: DriverSyncRequest, job: Optional[Job] = None) -> DriverSyncResponse:
+    """
+    Fetch drivers from FastF1 and write them to the database.
+    Used by the endpoint and by background jobs.
+    
+    Args:
+        request: Driver sync request
+        job: Background job to report progress to, if any
+    """
+    return await _run_sync_async(
+        *_driver_sync_steps(request, job), "driver sync", **_season_attributes(driver_sync_params(request)["seasons"])
+    )
+
+
+@router.post("/drivers", response_model=DriverSyncResponse)
+async def sync_drivers_endpoint(request: DriverSyncRequest):
+    """Sync drivers from FastF1 to database."""
+    try:
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(
+            _sync_key("drivers", driver_sync_params(request)),
+            lambda: run_driver_sync(request),
         )
         
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in driver sync: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -285,14 +436,13 @@ async def debug_fastf1_drivers(request: DriverSyncRequest):
         logger.info(f"Starting debug driver fetch from FastF1 - season: {request.season}, seasons: {request.seasons}, filter_confirmed: {request.filter_confirmed}")
         
         # Fetch drivers from FastF1 (run in thread pool to avoid blocking)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
+        from app.services.fastf1_service import sync_drivers
+        result = await fastf1_executor.run(
             sync_drivers,
             request.seasons,
             request.season,
-            request.filter_confirmed if request.filter_confirmed is not None else True
+            request.filter_confirmed if request.filter_confirmed is not None else True,
+            request.parallel if request.parallel is not None else True,
         )
         
         return {
@@ -309,131 +459,352 @@ async def debug_fastf1_drivers(request: DriverSyncRequest):
             }
         }
         
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in debug driver fetch: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/teams", response_model=TeamSyncResponse)
-async def sync_teams_endpoint(request: TeamSyncRequest):
-    """Sync teams from FastF1 to database."""
-    try:
-        logger.info("Starting team sync")
-        
-        # Fetch teams from FastF1 (run in thread pool to avoid blocking)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, 
-            sync_teams, 
-            request.seasons,
-            request.season
+def _fetch_teams(request: TeamSyncRequest, job: Optional[Job] = None) -> list[dict]:
+    """Fetch teams from FastF1 (blocking)."""
+    from app.services.fastf1_service import sync_teams
+    
+    logger.info("Starting team sync")
+    
+    result = sync_teams(
+        request.seasons,
+        request.season,
+        request.parallel if request.parallel is not None else True,
+        on_season_done=job.season_done if job else None,
+    )
+    return result["teams"]
+
+
+def _store_teams(db, teams: list[dict]) -> tuple[int, int, int, list[str]]:
+    """
+    Write new and changed teams inside the caller's transaction.
+    Teams whose stored row already matches are skipped.
+    
+    Returns:
+        Tuple of (teams inserted, teams updated, teams unchanged, per-team error messages)
+    """
+    from sqlalchemy import text
+    
+    errors = []
+    inserted_count = 0
+    updated_count = 0
+    
+    # First, clean up any duplicate constructors before syncing
+    # Find duplicates by constructor_id and keep only the most recent
+    cleanup_query = text("""
+        WITH duplicates AS (
+            SELECT 
+                constructor_id,
+                COUNT(*) as count,
+                MAX(updated_at) as latest_update
+            FROM constructors
+            GROUP BY constructor_id
+            HAVING COUNT(*) > 1
+        ),
+        to_delete AS (
+            SELECT c.id
+            FROM constructors c
+            INNER JOIN duplicates dup ON c.constructor_id = dup.constructor_id
+            WHERE c.updated_at < dup.latest_update
         )
-        teams = result["teams"]
-        
-        if not teams:
-            return TeamSyncResponse(
-                success=False,
-                message="No teams found to sync",
-                teams_synced=0,
-            )
-        
-        # Insert/update teams in database
-        db = SessionLocal()
-        errors = []
-        synced_count = 0
-        
+        DELETE FROM constructors
+        WHERE id IN (SELECT id FROM to_delete)
+    """)
+    
+    try:
+        with span("db cleanup", table="constructors", step="duplicate ids"):
+            cleanup_result = db.execute(cleanup_query)
+        deleted_count = cleanup_result.rowcount
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} duplicate constructor entries before sync")
+    except Exception as e:
+        logger.warning(f"Could not clean up duplicates: {e}")
+    
+    stored = _stored_rows(
+        db, "constructors", "constructor_id", TEAM_FINGERPRINT_FIELDS, sorted({team["constructor_id"] for team in teams})
+    )
+    inserted, updated, unchanged = classify_changes(teams, stored, "constructor_id", TEAM_FINGERPRINT_FIELDS)
+    
+    for team_data in inserted + updated:
         try:
-            # First, clean up any duplicate constructors before syncing
-            # Find duplicates by constructor_id and keep only the most recent
-            cleanup_query = text("""
-                WITH duplicates AS (
-                    SELECT 
-                        constructor_id,
-                        COUNT(*) as count,
-                        MAX(updated_at) as latest_update
-                    FROM constructors
-                    GROUP BY constructor_id
-                    HAVING COUNT(*) > 1
-                ),
-                to_delete AS (
-                    SELECT c.id
-                    FROM constructors c
-                    INNER JOIN duplicates dup ON c.constructor_id = dup.constructor_id
-                    WHERE c.updated_at < dup.latest_update
-                )
-                DELETE FROM constructors
-                WHERE id IN (SELECT id FROM to_delete)
-            """)
+            constructor_id_value = team_data["constructor_id"]
             
-            try:
-                cleanup_result = db.execute(cleanup_query)
-                deleted_count = cleanup_result.rowcount
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} duplicate constructor entries before sync")
-            except Exception as e:
-                logger.warning(f"Could not clean up duplicates: {e}")
+            # Generate ID: use existing if found, otherwise generate new UUID
+            existing_row = stored.get(constructor_id_value)
+            record_id = existing_row["id"] if existing_row else str(uuid.uuid4())
             
-            for team_data in teams:
-                try:
-                    constructor_id_value = team_data["constructor_id"]
-                    
-                    # Check if constructor exists by constructor_id
-                    check_query = text("SELECT id FROM constructors WHERE constructor_id = :constructor_id")
-                    existing_row = db.execute(check_query, {"constructor_id": constructor_id_value}).fetchone()
-                    
-                    # Generate ID: use existing if found, otherwise generate new UUID
-                    record_id = existing_row[0] if existing_row else str(uuid.uuid4())
-                    
-                    # Use raw SQL for upsert (PostgreSQL)
-                    query = text("""
-                        INSERT INTO constructors (
-                            id, constructor_id, name, nationality, url, created_at, updated_at
-                        )
-                        VALUES (
-                            :id, :constructor_id, :name, :nationality, :url, NOW(), NOW()
-                        )
-                        ON CONFLICT (constructor_id) DO UPDATE SET
-                            name = EXCLUDED.name,
-                            nationality = EXCLUDED.nationality,
-                            updated_at = NOW()
-                    """)
-                    
-                    db.execute(query, {
-                        "id": record_id,
-                        "constructor_id": constructor_id_value,
-                        "name": team_data["name"],
-                        "nationality": team_data["nationality"],
-                        "url": None,
-                    })
-                    synced_count += 1
-                except Exception as e:
-                    error_msg = f"Error syncing team {team_data.get('constructor_id')}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+            # Use raw SQL for upsert (PostgreSQL)
+            query = text("""
+                INSERT INTO constructors (
+                    id, constructor_id, name, nationality, url, created_at, updated_at
+                )
+                VALUES (
+                    :id, :constructor_id, :name, :nationality, :url, NOW(), NOW()
+                )
+                ON CONFLICT (constructor_id) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    nationality = EXCLUDED.nationality,
+                    updated_at = NOW()
+            """)
             
-            db.commit()
+            with span("db upsert", table="constructors", rows=1), DB_UPSERT_SECONDS.labels(table="constructors").time():
+                db.execute(query, {
+                    "id": record_id,
+                    "constructor_id": constructor_id_value,
+                    "name": team_data["name"],
+                    "nationality": team_data["nationality"],
+                    "url": None,
+                })
+            if existing_row:
+                updated_count += 1
+            else:
+                inserted_count += 1
         except Exception as e:
-            db.rollback()
-            logger.error(f"Database error during sync: {e}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-        finally:
-            db.close()
-        
-        logger.info(f"Successfully synced {synced_count} teams")
-        
+            error_msg = f"Error syncing team {team_data.get('constructor_id')}: {str(e)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+    
+    return inserted_count, updated_count, len(unchanged), errors
+
+
+def _team_response(teams: list[dict], stored: Optional[tuple[int, int, int, list[str]]]) -> TeamSyncResponse:
+    if not teams:
         return TeamSyncResponse(
-            success=True,
-            message=f"Synced {synced_count} teams",
-            teams_synced=synced_count,
-            errors=errors if errors else None,
+            success=False,
+            message="No teams found to sync",
+            teams_synced=0,
+        )
+    
+    inserted_count, updated_count, unchanged_count, errors = stored
+    synced_count = inserted_count + updated_count + unchanged_count
+    SYNC_ROWS.labels(kind="teams").observe(inserted_count + updated_count)
+    logger.info(
+        f"Successfully synced {synced_count} teams: {inserted_count} inserted, "
+        f"{updated_count} updated, {unchanged_count} unchanged"
+    )
+    
+    return TeamSyncResponse(
+        success=True,
+        message=f"Synced {synced_count} teams ({inserted_count} inserted, {updated_count} updated, {unchanged_count} unchanged)",
+        teams_synced=synced_count,
+        teams_inserted=inserted_count,
+        teams_updated=updated_count,
+        teams_unchanged=unchanged_count,
+        errors=errors if errors else None,
+    )
+
+
+def _team_sync_steps(request: TeamSyncRequest, job: Optional[Job] = None) -> tuple:
+    def respond(teams, stored):
+        if job and stored:
+            job.add_rows(stored[0] + stored[1])
+        return _team_response(teams, stored)
+    
+    return (
+        functools.partial(_fetch_teams, request, _progress(job)),
+        _store_teams,
+        respond,
+    )
+
+
+async def run_team_sync(request: TeamSyncRequest, job: Optional[Job] = None) -> TeamSyncResponse:
+    """
+    Fetch teams from FastF1 and write them to the database.
+    Used by the endpoint and by background jobs.
+    
+    Args:
+        request: Team sync request
+        job: Background job to report progress to, if any
+    """
+    return await _run_sync_async(
+        *_team_sync_steps(request, job), "team sync", **_season_attributes(team_sync_params(request)["seasons"])
+    )
+
+
+@router.post("/teams", response_model=TeamSyncResponse)
+async def sync_teams_endpoint(request: TeamSyncRequest):
+    """Sync teams from FastF1 to database."""
+    try:
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(
+            _sync_key("teams", team_sync_params(request)),
+            lambda: run_team_sync(request),
         )
         
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in team sync: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _fetch_lineups(request: LineupSyncRequest, job: Optional[Job] = None) -> Optional[dict]:
+    """
+    Fetch driver and constructor lineups from FastF1 and shape them for storage (blocking).
+    
+    Returns:
+        Dict with driver_lineups, driver_lineup_json and constructor_ids, or None if no data
+    """
+    from app.services.fastf1_service import get_season_driver_lineup, get_season_constructor_lineup
+    
+    logger.info(f"Starting lineup sync for season {request.season}")
+    
+    from collections import defaultdict
+    
+    # Fetch lineup data from FastF1
+    try:
+        logger.info(f"Fetching driver lineup for season {request.season}")
+        driver_lineups = get_season_driver_lineup(request.season)
+        logger.info(f"Successfully fetched {len(driver_lineups)} driver lineups")
+        
+        logger.info(f"Fetching constructor lineup for season {request.season}")
+        constructor_lineups = get_season_constructor_lineup(request.season)
+        logger.info(f"Successfully fetched {len(constructor_lineups)} constructor lineups")
+        if job:
+            job.season_done(request.season)
+    except Exception as fetch_error:
+        logger.error(f"Failed to fetch lineup data: {fetch_error}")
+        # Plain exception rather than HTTPException: fetches may run in a worker
+        # process and the error has to survive pickling
+        raise RuntimeError(f"Failed to fetch lineup data from FastF1: {str(fetch_error)}")
+    
+    if not driver_lineups and not constructor_lineups:
+        return None
+    
+    # Process driver lineups - group by team
+    teams_dict = defaultdict(list)
+    for lineup in driver_lineups:
+        team_name = lineup.get("team_name", "Unknown")
+        teams_dict[team_name].append({
+            "driverId": lineup["driver_id"],
+            "driverNumber": lineup.get("driver_number"),
+        })
+    
+    # Create JSON structure for drivers
+    driver_lineup_json = {
+        "teams": [
+            {
+                "teamName": team_name,
+                "drivers": drivers
+            }
+            for team_name, drivers in sorted(teams_dict.items())
+        ]
+    }
+    
+    return {
+        "driver_lineups": driver_lineups,
+        "driver_lineup_json": driver_lineup_json,
+        # Process constructor lineups - extract constructor IDs
+        "constructor_ids": [lineup["constructor_id"] for lineup in constructor_lineups],
+    }
+
+
+def _store_lineups(db, season: int, lineups: dict) -> tuple[int, int]:
+    """
+    Upsert the season's driver and constructor lineup rows inside the caller's transaction.
+    
+    Returns:
+        Tuple of (drivers stored, constructors stored)
+    """
+    from sqlalchemy import text
+    
+    driver_lineup_json = lineups["driver_lineup_json"]
+    constructor_ids = lineups["constructor_ids"]
+    driver_synced = 0
+    constructor_synced = 0
+    
+    # Upsert driver lineup (single row per season)
+    if driver_lineup_json["teams"]:
+        with span("db upsert", table="driver_season_lineups", season=season, rows=1), DB_UPSERT_SECONDS.labels(table="driver_season_lineups").time():
+            db.execute(text("""
+                INSERT INTO driver_season_lineups (id, season, lineup, created_at, updated_at)
+                VALUES (:id, :season, CAST(:lineup AS jsonb), NOW(), NOW())
+                ON CONFLICT (season)
+                DO UPDATE SET
+                    lineup = EXCLUDED.lineup,
+                    updated_at = NOW()
+            """), {
+                "id": str(uuid.uuid4()),
+                "season": season,
+                "lineup": json.dumps(driver_lineup_json),
+            })
+        driver_synced = len(lineups["driver_lineups"])
+        logger.info(f"Stored driver lineup for season {season} with {len(driver_lineup_json['teams'])} teams")
+    
+    # Upsert constructor lineup (single row per season)
+    if constructor_ids:
+        with span("db upsert", table="constructor_season_lineups", season=season, rows=1), DB_UPSERT_SECONDS.labels(table="constructor_season_lineups").time():
+            db.execute(text("""
+                INSERT INTO constructor_season_lineups (id, season, constructors, created_at, updated_at)
+                VALUES (:id, :season, CAST(:constructors AS jsonb), NOW(), NOW())
+                ON CONFLICT (season)
+                DO UPDATE SET
+                    constructors = EXCLUDED.constructors,
+                    updated_at = NOW()
+            """), {
+                "id": str(uuid.uuid4()),
+                "season": season,
+                "constructors": json.dumps(constructor_ids),
+            })
+        constructor_synced = len(constructor_ids)
+        logger.info(f"Stored constructor lineup for season {season} with {len(constructor_ids)} constructors")
+    
+    return driver_synced, constructor_synced
+
+
+def _lineup_response(season: int, lineups: Optional[dict], stored: Optional[tuple[int, int]]) -> LineupSyncResponse:
+    if not lineups:
+        message = f"No lineup data available for season {season}. Please ensure the season exists and drivers/constructors are available."
+        return LineupSyncResponse(
+            success=True,
+            message=message,
+            drivers_synced=0,
+            constructors_synced=0,
+        )
+    
+    driver_synced, constructor_synced = stored
+    SYNC_ROWS.labels(kind="lineups").observe(driver_synced + constructor_synced)
+    logger.info(f"Successfully synced lineup for season {season}: {driver_synced} drivers across {len(lineups['driver_lineup_json']['teams'])} teams, {constructor_synced} constructors")
+    
+    return LineupSyncResponse(
+        success=True,
+        message=f"Synced {driver_synced} drivers and {constructor_synced} constructors for season {season}",
+        drivers_synced=driver_synced,
+        constructors_synced=constructor_synced,
+    )
+
+
+def _lineup_sync_steps(request: LineupSyncRequest, job: Optional[Job] = None) -> tuple:
+    def respond(lineups, stored):
+        if job and stored:
+            job.add_rows(sum(stored))
+        return _lineup_response(request.season, lineups, stored)
+    
+    return (
+        functools.partial(_fetch_lineups, request, _progress(job)),
+        lambda db, lineups: _store_lineups(db, request.season, lineups),
+        respond,
+    )
+
+
+async def run_lineup_sync(request: LineupSyncRequest, job: Optional[Job] = None) -> LineupSyncResponse:
+    """
+    Fetch driver and constructor lineups for a season and store them as JSON (one row per season).
+    Used by the endpoint and by background jobs.
+    
+    Args:
+        request: Lineup sync request
+        job: Background job to report progress to, if any
+    """
+    return await _run_sync_async(*_lineup_sync_steps(request, job), "lineup sync", season=request.season)
+
+
 @router.post("/lineups", response_model=LineupSyncResponse)
 async def sync_lineups_endpoint(request: LineupSyncRequest):
     """
@@ -441,125 +812,738 @@ async def sync_lineups_endpoint(request: LineupSyncRequest):
     Fetches lineup data from FastF1 API and stores as JSON (one row per season).
     """
     try:
-        logger.info(f"Starting lineup sync for season {request.season}")
-        
-        import asyncio
-        import json
-        from collections import defaultdict
-        
-        loop = asyncio.get_event_loop()
-        
-        driver_lineups = []
-        constructor_lineups = []
-        errors = []
-        
-        # Fetch lineup data from FastF1
-        try:
-            logger.info(f"Fetching driver lineup for season {request.season}")
-            driver_lineups = await loop.run_in_executor(None, get_season_driver_lineup, request.season)
-            logger.info(f"Successfully fetched {len(driver_lineups)} driver lineups")
-            
-            logger.info(f"Fetching constructor lineup for season {request.season}")
-            constructor_lineups = await loop.run_in_executor(None, get_season_constructor_lineup, request.season)
-            logger.info(f"Successfully fetched {len(constructor_lineups)} constructor lineups")
-        except Exception as fetch_error:
-            logger.error(f"Failed to fetch lineup data: {fetch_error}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to fetch lineup data from FastF1: {str(fetch_error)}"
-            )
-        
-        if not driver_lineups and not constructor_lineups:
-            message = f"No lineup data available for season {request.season}. Please ensure the season exists and drivers/constructors are available."
-            return LineupSyncResponse(
-                success=True,
-                message=message,
-                drivers_synced=0,
-                constructors_synced=0,
-                errors=errors if errors else None,
-            )
-        
-        # Process driver lineups - group by team
-        teams_dict = defaultdict(list)
-        for lineup in driver_lineups:
-            team_name = lineup.get("team_name", "Unknown")
-            teams_dict[team_name].append({
-                "driverId": lineup["driver_id"],
-                "driverNumber": lineup.get("driver_number"),
-            })
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(
+            _sync_key("lineups", {"season": request.season}),
+            lambda: run_lineup_sync(request),
+        )
         
-        # Create JSON structure for drivers
-        driver_lineup_json = {
-            "teams": [
-                {
-                    "teamName": team_name,
-                    "drivers": drivers
-                }
-                for team_name, drivers in sorted(teams_dict.items())
-            ]
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in lineup sync: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Standings upsert shared by driver and constructor standings tables. Unlike
+# the results upserts, updated_at is set even when the values are unchanged:
+# it records when a round was last computed (see STORED_STANDINGS_QUERY)
+STANDINGS_BATCH_UPSERT_QUERY = """
+    INSERT INTO {table} (
+        id, season, round, {id_column}, position, points, wins, created_at, updated_at
+    )
+    SELECT DISTINCT ON (x.season, x.round, x.entity_id)
+        x.id, x.season, x.round, x.entity_id, x.position, x.points, x.wins, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS x(
+        id text, season integer, round integer, entity_id text,
+        position integer, points double precision, wins integer
+    )
+    ORDER BY x.season, x.round, x.entity_id, x.position
+    ON CONFLICT (season, round, {id_column}) DO UPDATE SET
+        position = EXCLUDED.position,
+        points = EXCLUDED.points,
+        wins = EXCLUDED.wins,
+        updated_at = NOW()
+"""
+
+
+def _upsert_standings(db, table: str, id_column: str, standings: list[dict]) -> int:
+    """
+    Upsert standings rows for all rounds in batches of DB_UPSERT_BATCH_SIZE rows.
+    
+    Returns:
+        Number of standings rows written
+    """
+    from sqlalchemy import text
+    
+    query = text(STANDINGS_BATCH_UPSERT_QUERY.format(table=table, id_column=id_column))
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "season": standing["season"],
+            "round": standing["round"],
+            "entity_id": standing[id_column],
+            "position": standing["position"],
+            "points": standing["points"],
+            "wins": standing["wins"],
         }
+        for standing in standings
+    ]
+    
+    synced_count = 0
+    for start in range(0, len(rows), DB_UPSERT_BATCH_SIZE):
+        batch = rows[start:start + DB_UPSERT_BATCH_SIZE]
+        with span("db upsert", table=table, rows=len(batch)), DB_UPSERT_SECONDS.labels(table=table).time():
+            result = db.execute(query, {"rows": json.dumps(batch)})
+        synced_count += result.rowcount
+    return synced_count
+
+
+# Stored standings of a season's rounds before the first round whose race
+# results changed after its standings were written (or that has no complete
+# standings). Only rows keyed by the source ids the race-results calculation
+# produces count, and a round only if it has one for every entity that raced
+# by then: Ergast standings may key the same drivers differently (e.g.
+# "max_verstappen" where the driver sync stored "ver"). A recalculation
+# rewrites every row of a round, so a round's latest write is when it was
+# last computed.
+STORED_STANDINGS_QUERY = """
+    WITH result_entities AS (
+        SELECT src.{id_column}, MIN(r.round) AS first_round
+        FROM race_results rr
+        JOIN races r ON rr.race_id = r.id
+        JOIN {entity_table} src ON rr.{id_column} = src.id
+        WHERE r.season = :season
+        GROUP BY src.{id_column}
+    ),
+    computed AS (
+        SELECT s.season, s.round, s.{id_column}, s.points, s.wins, s.updated_at
+        FROM {table} s
+        JOIN result_entities e ON e.{id_column} = s.{id_column} AND s.round >= e.first_round
+        WHERE s.season = :season
+    ),
+    written AS (
+        SELECT c.round, MAX(c.updated_at) AS updated_at
+        FROM computed c
+        GROUP BY c.round
+        HAVING COUNT(*) = (SELECT COUNT(*) FROM result_entities e WHERE e.first_round <= c.round)
+    ),
+    first_changed AS (
+        SELECT MIN(r.round) AS round
+        FROM races r
+        JOIN race_results rr ON rr.race_id = r.id
+        LEFT JOIN written w ON w.round = r.round
+        WHERE r.season = :season AND (w.updated_at IS NULL OR rr.updated_at > w.updated_at)
+    )
+    SELECT season, round, {id_column}, points, wins
+    FROM computed
+    WHERE round < COALESCE((SELECT round FROM first_changed), 2147483647)
+"""
+
+
+def _unchanged_standings(db, season: int, table: str, entity_table: str, id_column: str) -> list[dict]:
+    """
+    Stored standings of the rounds whose race results have not changed since they were written.
+    
+    Passed to the race-results calculators, which then only compute the
+    rounds after these, starting from their totals.
+    """
+    from sqlalchemy import text
+    
+    query = text(STORED_STANDINGS_QUERY.format(table=table, entity_table=entity_table, id_column=id_column))
+    result = db.execute(query, {"season": season})
+    return [dict(row._mapping) for row in result]
+
+
+def _fetch_standings(request: StandingsSyncRequest) -> dict:
+    """Fetch standings for every round of a season from Ergast (blocking)."""
+    from app.services.fastf1_service import fetch_driver_standings, fetch_constructor_standings
+    
+    logger.info(f"Starting standings sync for season {request.season}")
+    
+    fetched = {"driver_standings": [], "constructor_standings": [], "errors": []}
+    try:
+        fetched["driver_standings"] = fetch_driver_standings(request.season)
+    except Exception as e:
+        fetched["errors"].append(f"Ergast driver standings unavailable: {str(e)}")
+    try:
+        fetched["constructor_standings"] = fetch_constructor_standings(request.season)
+    except Exception as e:
+        fetched["errors"].append(f"Ergast constructor standings unavailable: {str(e)}")
+    return fetched
+
+
+def _store_standings(db, season: int, fetched: dict) -> dict:
+    """
+    Write standings for all rounds inside the caller's transaction, falling back
+    to standings calculated from race results in the database.
+    
+    The fallback is incremental: stored standings of rounds whose race results
+    have not changed are kept, and only later rounds are recalculated.
+    
+    Returns:
+        Dict with rows written, the source used for drivers and constructors
+        and the number of stored rows kept as they were
+    """
+    from app.services.fastf1_service import (
+        calculate_driver_standings_from_results,
+        calculate_constructor_standings_from_results,
+    )
+    
+    driver_standings = fetched["driver_standings"]
+    constructor_standings = fetched["constructor_standings"]
+    stored = {
+        "driver_source": "ergast",
+        "constructor_source": "ergast",
+        "driver_synced": 0,
+        "constructor_synced": 0,
+        "unchanged": 0,
+    }
+    
+    if not driver_standings:
+        stored["driver_source"] = "race_results"
+        unchanged = _unchanged_standings(db, season, "driver_standings", "drivers", "driver_id")
+        stored["unchanged"] += len(unchanged)
+        driver_standings = calculate_driver_standings_from_results(db, season, unchanged)
+    if not constructor_standings:
+        stored["constructor_source"] = "race_results"
+        unchanged = _unchanged_standings(db, season, "constructor_standings", "constructors", "constructor_id")
+        stored["unchanged"] += len(unchanged)
+        constructor_standings = calculate_constructor_standings_from_results(db, season, unchanged)
+    
+    if driver_standings:
+        stored["driver_synced"] = _upsert_standings(db, "driver_standings", "driver_id", driver_standings)
+    if constructor_standings:
+        stored["constructor_synced"] = _upsert_standings(
+            db, "constructor_standings", "constructor_id", constructor_standings
+        )
+    return stored
+
+
+def _standings_response(season: int, fetched: dict, stored: dict) -> StandingsSyncResponse:
+    errors = fetched["errors"]
+    driver_synced = stored["driver_synced"]
+    constructor_synced = stored["constructor_synced"]
+    driver_source = stored["driver_source"]
+    constructor_source = stored["constructor_source"]
+    SYNC_ROWS.labels(kind="standings").observe(driver_synced + constructor_synced)
+    
+    if not driver_synced and not constructor_synced and not stored["unchanged"]:
+        return StandingsSyncResponse(
+            success=False,
+            message=f"No standings data available for season {season}",
+            driver_standings_synced=0,
+            constructor_standings_synced=0,
+            errors=errors if errors else None,
+        )
+    
+    logger.info(
+        f"Successfully synced standings for season {season}: "
+        f"{driver_synced} driver rows ({driver_source}), {constructor_synced} constructor rows ({constructor_source})"
+    )
+    
+    return StandingsSyncResponse(
+        success=True,
+        message=(
+            f"Synced {driver_synced} driver standings ({driver_source}) and "
+            f"{constructor_synced} constructor standings ({constructor_source}) for season {season}"
+            + (f"; {stored['unchanged']} stored rows unchanged" if stored["unchanged"] else "")
+        ),
+        driver_standings_synced=driver_synced,
+        constructor_standings_synced=constructor_synced,
+        errors=errors if errors else None,
+    )
+
+
+def _standings_sync_steps(request: StandingsSyncRequest) -> tuple:
+    return (
+        functools.partial(_fetch_standings, request),
+        lambda db, fetched: _store_standings(db, request.season, fetched),
+        lambda fetched, stored: _standings_response(request.season, fetched, stored),
+    )
+
+
+async def run_standings_sync(request: StandingsSyncRequest) -> StandingsSyncResponse:
+    """
+    Fetch standings for every round of a season and write them in one transaction.
+    
+    Args:
+        request: Standings sync request
+    """
+    return await _run_sync_async(*_standings_sync_steps(request), "standings sync", season=request.season)
+
+
+@router.post("/standings", response_model=StandingsSyncResponse)
+async def sync_standings_endpoint(request: StandingsSyncRequest):
+    """
+    Sync driver and constructor championship standings for a season.
+    Fetches every round from Ergast, falling back to standings computed from
+    stored race results, and writes all rounds in a single transaction.
+    """
+    try:
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(
+            _sync_key("standings", {"season": request.season}),
+            lambda: run_standings_sync(request),
+        )
         
-        # Process constructor lineups - extract constructor IDs
-        constructor_ids = [lineup["constructor_id"] for lineup in constructor_lineups]
-        
-        # Upsert to database
-        db = SessionLocal()
-        driver_synced = 0
-        constructor_synced = 0
-        
-        try:
-            # Upsert driver lineup (single row per season)
-            if driver_lineup_json["teams"]:
-                db.execute(text("""
-                    INSERT INTO driver_season_lineups (id, season, lineup, created_at, updated_at)
-                    VALUES (:id, :season, CAST(:lineup AS jsonb), NOW(), NOW())
-                    ON CONFLICT (season)
-                    DO UPDATE SET
-                        lineup = EXCLUDED.lineup,
-                        updated_at = NOW()
-                """), {
-                    "id": str(uuid.uuid4()),
-                    "season": request.season,
-                    "lineup": json.dumps(driver_lineup_json),
-                })
-                driver_synced = len(driver_lineups)
-                logger.info(f"Stored driver lineup for season {request.season} with {len(driver_lineup_json['teams'])} teams")
-            
-            # Upsert constructor lineup (single row per season)
-            if constructor_ids:
-                db.execute(text("""
-                    INSERT INTO constructor_season_lineups (id, season, constructors, created_at, updated_at)
-                    VALUES (:id, :season, CAST(:constructors AS jsonb), NOW(), NOW())
-                    ON CONFLICT (season)
-                    DO UPDATE SET
-                        constructors = EXCLUDED.constructors,
-                        updated_at = NOW()
-                """), {
-                    "id": str(uuid.uuid4()),
-                    "season": request.season,
-                    "constructors": json.dumps(constructor_ids),
-                })
-                constructor_synced = len(constructor_ids)
-                logger.info(f"Stored constructor lineup for season {request.season} with {len(constructor_ids)} constructors")
-            
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Database error during lineup sync: {e}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-        finally:
-            db.close()
-        
-        logger.info(f"Successfully synced lineup for season {request.season}: {driver_synced} drivers across {len(driver_lineup_json['teams'])} teams, {constructor_synced} constructors")
-        
-        return LineupSyncResponse(
-            success=True,
-            message=f"Synced {driver_synced} drivers and {constructor_synced} constructors for season {request.season}",
-            drivers_synced=driver_synced,
-            constructors_synced=constructor_synced,
+    except HTTPException:
+        raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in standings sync: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Results are keyed by a deterministic id per (race, driver), so re-syncing a
+# season upserts in place and rewrites only rows whose values changed.
+RESULT_ID_NAMESPACE = uuid.UUID("0b7c1b1e-8a53-4c1e-9d3e-6f1d2f0c5a21")
+
+CIRCUIT_BATCH_INSERT_QUERY = """
+    INSERT INTO circuits (id, circuit_id, name, location, country, created_at, updated_at)
+    SELECT x.id, x.circuit_id, x.name, x.location, x.country, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+        AS x(id text, circuit_id text, name text, location text, country text)
+    ON CONFLICT (circuit_id) DO NOTHING
+"""
+
+# Existing races (e.g. synced from Ergast by the backend) are kept as they are
+RACE_BATCH_INSERT_QUERY = """
+    INSERT INTO races (id, season, round, race_name, circuit_id, date, created_at, updated_at)
+    SELECT x.id, :season, x.round, x.race_name, c.id, x.date, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+        AS x(id text, round integer, race_name text, circuit_id text, date timestamp)
+    JOIN circuits c ON c.circuit_id = x.circuit_id
+    ON CONFLICT (season, round) DO NOTHING
+"""
+
+DRIVER_BATCH_INSERT_QUERY = """
+    INSERT INTO drivers (id, driver_id, code, forename, surname, nationality, permanent_number, created_at, updated_at)
+    SELECT x.id, x.driver_id, x.code, x.forename, x.surname, x.nationality, x.permanent_number, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+        AS x(id text, driver_id text, code text, forename text, surname text, nationality text, permanent_number integer)
+    ON CONFLICT (driver_id) DO NOTHING
+"""
+
+CONSTRUCTOR_BATCH_INSERT_QUERY = """
+    INSERT INTO constructors (id, constructor_id, name, nationality, created_at, updated_at)
+    SELECT x.id, x.constructor_id, x.name, x.nationality, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+        AS x(id text, constructor_id text, name text, nationality text)
+    ON CONFLICT (constructor_id) DO NOTHING
+"""
+
+RACE_RESULT_BATCH_UPSERT_QUERY = """
+    INSERT INTO race_results (
+        id, race_id, driver_id, constructor_id, position, points, grid, laps,
+        status, time, milliseconds, created_at, updated_at
+    )
+    SELECT
+        x.id, x.race_id, x.driver_id, x.constructor_id, x.position, x.points, x.grid, x.laps,
+        x.status, x.time, x.milliseconds, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS x(
+        id text, race_id text, driver_id text, constructor_id text, position integer,
+        points double precision, grid integer, laps integer, status text, time text, milliseconds integer
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        constructor_id = EXCLUDED.constructor_id,
+        position = EXCLUDED.position,
+        points = EXCLUDED.points,
+        grid = EXCLUDED.grid,
+        laps = EXCLUDED.laps,
+        status = EXCLUDED.status,
+        time = EXCLUDED.time,
+        milliseconds = EXCLUDED.milliseconds,
+        updated_at = NOW()
+    WHERE (
+        race_results.constructor_id, race_results.position, race_results.points, race_results.grid,
+        race_results.laps, race_results.status, race_results.time, race_results.milliseconds
+    ) IS DISTINCT FROM (
+        EXCLUDED.constructor_id, EXCLUDED.position, EXCLUDED.points, EXCLUDED.grid,
+        EXCLUDED.laps, EXCLUDED.status, EXCLUDED.time, EXCLUDED.milliseconds
+    )
+"""
+
+QUALIFYING_RESULT_BATCH_UPSERT_QUERY = """
+    INSERT INTO qualifying_results (
+        id, race_id, driver_id, constructor_id, position, q1, q2, q3, created_at, updated_at
+    )
+    SELECT
+        x.id, x.race_id, x.driver_id, x.constructor_id, x.position, x.q1, x.q2, x.q3, NOW(), NOW()
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS x(
+        id text, race_id text, driver_id text, constructor_id text, position integer,
+        q1 text, q2 text, q3 text
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        constructor_id = EXCLUDED.constructor_id,
+        position = EXCLUDED.position,
+        q1 = EXCLUDED.q1,
+        q2 = EXCLUDED.q2,
+        q3 = EXCLUDED.q3,
+        updated_at = NOW()
+    WHERE (
+        qualifying_results.constructor_id, qualifying_results.position,
+        qualifying_results.q1, qualifying_results.q2, qualifying_results.q3
+    ) IS DISTINCT FROM (
+        EXCLUDED.constructor_id, EXCLUDED.position, EXCLUDED.q1, EXCLUDED.q2, EXCLUDED.q3
+    )
+"""
+
+
+def _execute_batches(db, table: str, query: str, rows: list[dict], **params) -> int:
+    """
+    Run a jsonb_to_recordset statement over rows in batches of DB_UPSERT_BATCH_SIZE.
+    
+    Returns:
+        Total rows affected
+    """
+    from sqlalchemy import text
+    
+    affected = 0
+    for start in range(0, len(rows), DB_UPSERT_BATCH_SIZE):
+        batch = rows[start:start + DB_UPSERT_BATCH_SIZE]
+        with span("db upsert", table=table, rows=len(batch)), DB_UPSERT_SECONDS.labels(table=table).time():
+            result = db.execute(text(query), {"rows": json.dumps(batch, default=str), **params})
+        affected += max(result.rowcount, 0)
+    return affected
+
+
+def _resolve_driver_ids(db, results: list[dict]) -> dict[str, str]:
+    """
+    Map 3-letter codes to drivers.id, inserting drivers that are not stored yet.
+    Stored drivers are matched by Ergast driver id, then by our code-based
+    driver_id, then by code, so rows created by other syncs are reused.
+    """
+    from sqlalchemy import text
+    
+    incoming = {row["code"]: row for row in results}
+    codes = sorted(incoming)
+    candidates = {code.lower() for code in codes} | {row["ergast_driver_id"] for row in incoming.values()}
+    with span("db read", table="drivers", rows=len(codes)):
+        stored = db.execute(text("""
+            SELECT id, driver_id, UPPER(code) AS code
+            FROM drivers
+            WHERE driver_id = ANY(:driver_ids) OR UPPER(code) = ANY(:codes)
+            ORDER BY updated_at DESC
+        """), {"driver_ids": sorted(candidates - {""}), "codes": codes}).mappings().all()
+    
+    by_driver_id = {row["driver_id"]: row["id"] for row in stored}
+    by_code = {}
+    for row in stored:
+        by_code.setdefault(row["code"], row["id"])
+    ids = {}
+    for code, row in incoming.items():
+        found = by_driver_id.get(row["ergast_driver_id"]) or by_driver_id.get(code.lower()) or by_code.get(code)
+        if found:
+            ids[code] = found
+    
+    missing = [incoming[code] for code in codes if code not in ids]
+    if missing:
+        new_rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "driver_id": row["driver_id"],
+                "code": row["code"],
+                "forename": row["forename"],
+                "surname": row["surname"],
+                "nationality": row["nationality"],
+                "permanent_number": row["permanent_number"],
+            }
+            for row in missing
+        ]
+        _execute_batches(db, "drivers", DRIVER_BATCH_INSERT_QUERY, new_rows)
+        ids.update({row["code"]: row["id"] for row in new_rows})
+        logger.info(f"Added {len(new_rows)} drivers referenced by results")
+    return ids
+
+
+def _resolve_constructor_ids(db, results: list[dict]) -> dict[str, str]:
+    """
+    Map constructor_id values to constructors.id, inserting constructors that are not stored yet.
+    Stored constructors are matched by Ergast constructor id first.
+    """
+    from sqlalchemy import text
+    from app.services.fastf1_service import get_team_nationality
+    
+    incoming = {row["constructor_id"]: row for row in results if row["constructor_id"]}
+    candidates = set(incoming) | {row["ergast_constructor_id"] for row in incoming.values()}
+    with span("db read", table="constructors", rows=len(incoming)):
+        stored = db.execute(
+            text("SELECT id, constructor_id FROM constructors WHERE constructor_id = ANY(:ids)"),
+            {"ids": sorted(candidates - {""})},
+        ).mappings().all()
+    by_constructor_id = {row["constructor_id"]: row["id"] for row in stored}
+    ids = {}
+    for constructor_id, row in incoming.items():
+        found = by_constructor_id.get(row["ergast_constructor_id"]) or by_constructor_id.get(constructor_id)
+        if found:
+            ids[constructor_id] = found
+    
+    new_rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "constructor_id": constructor_id,
+            "name": row["team_name"],
+            "nationality": get_team_nationality(row["team_name"]),
+        }
+        for constructor_id, row in incoming.items()
+        if constructor_id not in ids
+    ]
+    if new_rows:
+        _execute_batches(db, "constructors", CONSTRUCTOR_BATCH_INSERT_QUERY, new_rows)
+        ids.update({row["constructor_id"]: row["id"] for row in new_rows})
+        logger.info(f"Added {len(new_rows)} constructors referenced by results")
+    return ids
+
+
+def _result_id(race_id: str, driver_id: str) -> str:
+    """Deterministic id of the result row this service writes for a race and driver."""
+    return str(uuid.uuid5(RESULT_ID_NAMESPACE, f"{race_id}|{driver_id}"))
+
+
+def _result_rows(results: list[dict], race_ids: dict, driver_ids: dict, constructor_ids: dict,
+                 columns: tuple[str, ...], errors: list[str], skipped: list[tuple[str, str]]) -> list[dict]:
+    """
+    Attach database keys to result records, skipping records whose race or constructor is unknown.
+    (race_id, driver_id) pairs of skipped records with a known race are appended to skipped.
+    """
+    rows = []
+    for result in results:
+        race_id = race_ids.get(result["round"])
+        constructor_id = constructor_ids.get(result["constructor_id"])
+        if race_id is None or constructor_id is None:
+            errors.append(f"Skipped result for {result['code']} in round {result['round']}: unknown race or team")
+            if race_id is not None:
+                skipped.append((race_id, driver_ids[result["code"]]))
+            continue
+        driver_id = driver_ids[result["code"]]
+        rows.append({
+            "id": _result_id(race_id, driver_id),
+            "race_id": race_id,
+            "driver_id": driver_id,
+            "constructor_id": constructor_id,
+            **{column: result[column] for column in columns},
+        })
+    return rows
+
+
+def _replace_results(db, table: str, query: str, rows: list[dict], race_ids: list[str],
+                     skipped: list[tuple[str, str]]) -> int:
+    """
+    Upsert result rows of the given races and delete this service's rows for
+    drivers no longer classified in them.
+    
+    A row already stored for a race and driver under another id (e.g. written
+    by the backend's Ergast sync) is updated in place rather than duplicated.
+    Only rows with this service's deterministic ids are deleted, and rows of
+    records skipped by _result_rows are kept.
+    
+    Args:
+        race_ids: Races whose session produced rows for this table; other races are not touched
+        skipped: (race_id, driver_id) pairs of records that could not be written
+    
+    Returns:
+        Rows inserted or changed
+    """
+    from sqlalchemy import text
+    
+    with span("db read", table=table, rows=len(race_ids)):
+        stored = db.execute(
+            text(f"SELECT id, race_id, driver_id FROM {table} WHERE race_id = ANY(:race_ids) ORDER BY created_at"),
+            {"race_ids": race_ids},
+        ).mappings().all()
+    stored_ids = {row["id"] for row in stored}
+    existing = {}
+    for row in stored:
+        existing.setdefault((row["race_id"], row["driver_id"]), row["id"])
+    for row in rows:
+        if row["id"] not in stored_ids:
+            row["id"] = existing.get((row["race_id"], row["driver_id"]), row["id"])
+    
+    keep = {row["id"] for row in rows} | {existing[pair] for pair in skipped if pair in existing}
+    stale = [
+        row["id"] for row in stored
+        if row["id"] not in keep and row["id"] == _result_id(row["race_id"], row["driver_id"])
+    ]
+    if stale:
+        with span("db cleanup", table=table, step="stale results"):
+            db.execute(text(f"DELETE FROM {table} WHERE id = ANY(:ids)"), {"ids": stale})
+    return _execute_batches(db, table, query, rows)
+
+
+def _fetch_results(request: ResultsSyncRequest) -> dict:
+    """Fetch race and qualifying results for a season from FastF1 (blocking)."""
+    from app.services.fastf1_service import fetch_season_results
+    
+    logger.info(f"Starting results sync for season {request.season}")
+    
+    return fetch_season_results(request.season, request.parallel if request.parallel is not None else True)
+
+
+def _store_results(db, season: int, fetched: dict) -> dict:
+    """
+    Write a season's races, race results and qualifying results inside the
+    caller's transaction, using multi-row statements.
+    
+    Returns:
+        Dict with races, race_results and qualifying_results counts and skipped-row errors
+    """
+    from sqlalchemy import text
+    
+    stored = {"races": 0, "race_results": 0, "qualifying_results": 0, "errors": []}
+    races = fetched["races"]
+    if not races:
+        return stored
+    
+    db.execute(text("""
+        INSERT INTO seasons (id, year, created_at, updated_at)
+        VALUES (:id, :year, NOW(), NOW())
+        ON CONFLICT (year) DO NOTHING
+    """), {"id": str(uuid.uuid4()), "year": season})
+    
+    circuits = {
+        race["circuit_id"]: {
+            "id": str(uuid.uuid4()),
+            "circuit_id": race["circuit_id"],
+            "name": race["circuit_name"],
+            "location": race["location"],
+            "country": race["country"],
+        }
+        for race in races
+    }
+    _execute_batches(db, "circuits", CIRCUIT_BATCH_INSERT_QUERY, list(circuits.values()))
+    race_rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "round": race["round"],
+            "race_name": race["race_name"],
+            "circuit_id": race["circuit_id"],
+            "date": race["date"],
+        }
+        for race in races
+    ]
+    _execute_batches(db, "races", RACE_BATCH_INSERT_QUERY, race_rows, season=season)
+    
+    rounds = [race["round"] for race in races]
+    race_ids = {
+        row["round"]: row["id"]
+        for row in db.execute(
+            text("SELECT id, round FROM races WHERE season = :season AND round = ANY(:rounds)"),
+            {"season": season, "rounds": rounds},
+        ).mappings()
+    }
+    stored["races"] = len(race_ids)
+    
+    results = fetched["race_results"] + fetched["qualifying_results"]
+    driver_ids = _resolve_driver_ids(db, results)
+    constructor_ids = _resolve_constructor_ids(db, results)
+    
+    skipped_race, skipped_qualifying = [], []
+    race_result_rows = _result_rows(
+        fetched["race_results"], race_ids, driver_ids, constructor_ids,
+        ("position", "points", "grid", "laps", "status", "time", "milliseconds"), stored["errors"], skipped_race,
+    )
+    qualifying_rows = _result_rows(
+        fetched["qualifying_results"], race_ids, driver_ids, constructor_ids,
+        ("position", "q1", "q2", "q3"), stored["errors"], skipped_qualifying,
+    )
+    # Each table is only cleaned up for races whose session loaded, so a failed
+    # race or qualifying load leaves that session's stored rows alone
+    stored["race_results"] = _replace_results(
+        db, "race_results", RACE_RESULT_BATCH_UPSERT_QUERY, race_result_rows,
+        _synced_race_ids(fetched["race_results"], race_ids), skipped_race,
+    )
+    stored["qualifying_results"] = _replace_results(
+        db, "qualifying_results", QUALIFYING_RESULT_BATCH_UPSERT_QUERY, qualifying_rows,
+        _synced_race_ids(fetched["qualifying_results"], race_ids), skipped_qualifying,
+    )
+    return stored
+
+
+def _synced_race_ids(results: list[dict], race_ids: dict) -> list[str]:
+    """Ids of the races that have at least one fetched result record."""
+    return sorted({race_ids[result["round"]] for result in results if result["round"] in race_ids})
+
+
+def _results_response(season: int, fetched: dict, stored: dict) -> ResultsSyncResponse:
+    errors = fetched["errors"] + stored["errors"]
+    if not stored["races"]:
+        return ResultsSyncResponse(
+            success=False,
+            message=f"No results available for season {season}",
+            races_synced=0,
+            race_results_synced=0,
+            qualifying_results_synced=0,
             errors=errors if errors else None,
         )
+    
+    SYNC_ROWS.labels(kind="results").observe(stored["race_results"] + stored["qualifying_results"])
+    logger.info(
+        f"Successfully synced results for season {season}: {stored['races']} races, "
+        f"{stored['race_results']} race and {stored['qualifying_results']} qualifying rows written"
+    )
+    
+    return ResultsSyncResponse(
+        success=True,
+        message=(
+            f"Synced {stored['races']} races for season {season}: {stored['race_results']} race results and "
+            f"{stored['qualifying_results']} qualifying results written"
+        ),
+        races_synced=stored["races"],
+        race_results_synced=stored["race_results"],
+        qualifying_results_synced=stored["qualifying_results"],
+        errors=errors if errors else None,
+    )
+
+
+def _results_sync_steps(request: ResultsSyncRequest, job: Optional[Job] = None) -> tuple:
+    def respond(fetched, stored):
+        if job:
+            job.season_done(request.season)
+            job.add_rows(stored["race_results"] + stored["qualifying_results"])
+        return _results_response(request.season, fetched, stored)
+    
+    return (
+        functools.partial(_fetch_results, request),
+        lambda db, fetched: _store_results(db, request.season, fetched),
+        respond,
+    )
+
+
+async def run_results_sync(request: ResultsSyncRequest, job: Optional[Job] = None) -> ResultsSyncResponse:
+    """
+    Fetch a season's race and qualifying results and write them in one transaction.
+    Used by the endpoint and by background jobs.
+    
+    Args:
+        request: Results sync request
+        job: Background job to report progress to, if any
+    """
+    return await _run_sync_async(*_results_sync_steps(request, job), "results sync", season=request.season)
+
+
+@router.post("/results", response_model=ResultsSyncResponse)
+async def sync_results_endpoint(request: ResultsSyncRequest):
+    """
+    Sync race and qualifying results for a season from FastF1.
+    Each event's R and Q sessions are loaded once, events are fetched
+    concurrently, and the whole season is written in a single transaction.
+    These rows back the race-results fallback of /standings.
+    """
+    try:
+        # Concurrent identical requests share one in-flight run
+        return await sync_flights.do(
+            _sync_key("results", {"season": request.season}),
+            lambda: run_results_sync(request),
+        )
         
+    except HTTPException:
+        raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.error(f"Error in lineup sync: {e}")
+        logger.error(f"Error in results sync: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/traces")
+async def get_traces(limit: int = 20):
+    """
+    Recent sync traces, newest first. Each trace lists its spans (schedule fetch,
+    session discovery, session load, extraction, normalization, DB cleanup,
+    upsert, commit) with offsets, durations and season/event attributes.
+    """
+    return span_exporter.traces(limit)
+
+
+@router.get("/executor")
+async def get_executor_stats():
+    """Concurrency limit and queue depth of the FastF1 executor."""
+    return fastf1_executor.stats()
+
+
+@router.get("/db/pool")
+async def get_db_pool_stats():
+    """Connection pool statistics for the sync and async database engines."""
+    return pool_stats()
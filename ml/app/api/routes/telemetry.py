@@ -0,0 +1,57 @@
+"""Telemetry endpoints: downsampled, chart-ready car data traces."""
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+from app.config import TELEMETRY_MAX_POINTS
+from app.schemas.telemetry import TelemetryTraceResponse
+from app.services.fastf1_executor import ExecutorBusyError, fastf1_executor
+from app.services.single_flight import sync_flights
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/{season}/{round_number}/{session_type}/{driver}", response_model=TelemetryTraceResponse)
+async def get_telemetry_traces(
+    season: int,
+    round_number: int,
+    session_type: str,
+    driver: str,
+    lap: Optional[int] = None,
+    points: int = Query(500, ge=3, le=TELEMETRY_MAX_POINTS),
+    method: Literal["lttb", "minmax"] = "lttb",
+    axis: Literal["distance", "time"] = "distance",
+):
+    """
+    Speed, throttle and brake traces for a driver's lap (or whole session if
+    lap is omitted), downsampled to about `points` samples per channel with
+    LTTB or min-max bucketing.
+    
+    Traces are cached on disk per session, driver, lap and resolution; cached
+    traces are served without loading telemetry or waiting for the FastF1
+    executor.
+    """
+    from app.services.telemetry import LapNotFoundError, cached_lap_traces, get_lap_traces
+    
+    key = (season, round_number, session_type, driver.upper(), lap, points, method, axis)
+    try:
+        trace = await run_in_threadpool(cached_lap_traces, *key)
+        if trace is not None:
+            return trace
+        
+        # Concurrent requests for the same trace share one build
+        return await sync_flights.do(
+            f"telemetry:{':'.join(str(part) for part in key)}",
+            lambda: fastf1_executor.run(functools.partial(get_lap_traces, *key)),
+        )
+        
+    except LapNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error building telemetry traces: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -7,12 +7,77 @@ load_dotenv()
 
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost/f1_insight_hub")
+DB_UPSERT_BATCH_SIZE = int(os.getenv("DB_UPSERT_BATCH_SIZE", "500"))
+
+# Connection pool (applies to both the sync and the async engine)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
 # FastF1
-FASTF1_CACHE_DIR = os.getenv("FASTF1_CACHE_DIR", "./cache")
-Path(FASTF1_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+FASTF1_CACHE_DIR = os.getenv("FASTF1_CACHE_DIR", "./cache")  # Created on first FastF1 use
+
+# Session discovery index (which sessions have drivers/results, per season)
+SESSION_INDEX_PATH = os.getenv(
+    "SESSION_INDEX_PATH", str(Path(FASTF1_CACHE_DIR) / "session_index.json")
+)
+# Sessions of events this recent that lacked drivers/results are re-probed once
+# their entry is older than SESSION_INDEX_RETRY_SECONDS (data may still be published)
+SESSION_INDEX_RECENT_DAYS = int(os.getenv("SESSION_INDEX_RECENT_DAYS", "3"))
+SESSION_INDEX_RETRY_SECONDS = int(os.getenv("SESSION_INDEX_RETRY_SECONDS", "3600"))
+
+# Parquet snapshots of each season's extracted drivers and teams
+SEASON_SNAPSHOT_DIR = os.getenv("SEASON_SNAPSHOT_DIR", str(Path(FASTF1_CACHE_DIR) / "snapshots"))
+
+# Parquet lap store, partitioned by season, round and session
+LAP_STORE_DIR = os.getenv("LAP_STORE_DIR", str(Path(FASTF1_CACHE_DIR) / "laps"))
+# Sessions whose laps could not be ingested are not retried for this long
+LAP_INGEST_RETRY_SECONDS = int(os.getenv("LAP_INGEST_RETRY_SECONDS", "21600"))
+
+# Downsampled telemetry traces, cached on disk per session, driver, lap and resolution
+TELEMETRY_CACHE_DIR = os.getenv("TELEMETRY_CACHE_DIR", str(Path(FASTF1_CACHE_DIR) / "telemetry"))
+TELEMETRY_MAX_POINTS = int(os.getenv("TELEMETRY_MAX_POINTS", "5000"))
+# Raw car telemetry as memory-mapped .npy channels, one directory per session
+TELEMETRY_ARRAY_DIR = os.getenv("TELEMETRY_ARRAY_DIR", str(Path(FASTF1_CACHE_DIR) / "telemetry_arrays"))
+TELEMETRY_ARRAY_OPEN_SESSIONS = int(os.getenv("TELEMETRY_ARRAY_OPEN_SESSIONS", "16"))
+# Sessions loaded with telemetry are large; keep only a few in memory
+TELEMETRY_SESSION_CACHE_ENTRIES = int(os.getenv("TELEMETRY_SESSION_CACHE_ENTRIES", "2"))
+
+# Race pace fuel correction: lap time gained per lap of fuel burned, in ms
+RACE_PACE_FUEL_MS_PER_LAP = float(os.getenv("RACE_PACE_FUEL_MS_PER_LAP", "35"))
+
+# Persistent Ergast response cache; the current season is refetched after ERGAST_REFRESH_SECONDS
+ERGAST_CACHE_DIR = os.getenv("ERGAST_CACHE_DIR", str(Path(FASTF1_CACHE_DIR) / "ergast"))
+ERGAST_REFRESH_SECONDS = int(os.getenv("ERGAST_REFRESH_SECONDS", "3600"))
+
+# In-process cache of loaded sessions and schedules
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "32"))
+SESSION_CACHE_TTL_SECONDS = int(os.getenv("SESSION_CACHE_TTL_SECONDS", "1800"))
+
+# Maximum seasons fetched concurrently during multi-season syncs
+SYNC_SEASON_WORKERS = int(os.getenv("SYNC_SEASON_WORKERS", "4"))
+# Maximum events whose sessions are loaded concurrently during a results sync
+SYNC_EVENT_WORKERS = int(os.getenv("SYNC_EVENT_WORKERS", "4"))
+
+# Executor for blocking FastF1/Ergast work in request handlers and background jobs:
+# "thread" or "process" (process avoids GIL contention from pandas parsing)
+FASTF1_EXECUTOR = os.getenv("FASTF1_EXECUTOR", "thread").lower()
+FASTF1_WORKERS = int(os.getenv("FASTF1_WORKERS", "2"))
+# Calls allowed to wait for a worker before new ones are rejected with 503
+FASTF1_MAX_QUEUE = int(os.getenv("FASTF1_MAX_QUEUE", "8"))
+
+# Background sync jobs (JOB_WORKERS run at once, the rest wait as queued)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", "100"))
+
+# Finished tracing spans kept in memory for /api/sync/traces
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "2000"))
 
 # Server
+# Warm up FastF1, pandas and the DB engine in the background after startup
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
 PORT = int(os.getenv("PORT", "8000"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -0,0 +1,141 @@
+"""Database engines and sessions, created on first use."""
+from typing import Any, Callable, TypeVar
+from app.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from app.services.lazy import Lazy
+from app.services.tracing import span
+
+T = TypeVar("T")
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+
+def _create_engine():
+    from sqlalchemy import create_engine
+    return create_engine(DATABASE_URL, **POOL_OPTIONS)
+
+
+def _create_session_factory():
+    from sqlalchemy.orm import sessionmaker
+    return sessionmaker(bind=engine.get())
+
+
+def _async_url_and_connect_args() -> tuple[Any, dict]:
+    """
+    Rewrite DATABASE_URL for asyncpg.
+
+    asyncpg does not understand libpq's sslmode query parameter, so it is
+    passed through as the ssl connect argument instead.
+    """
+    from sqlalchemy.engine import make_url
+
+    url = make_url(DATABASE_URL)
+    connect_args = {}
+    query = dict(url.query)
+    sslmode = query.pop("sslmode", None)
+    if sslmode:
+        connect_args["ssl"] = sslmode
+    return url.set(drivername="postgresql+asyncpg", query=query), connect_args
+
+
+def _create_async_engine():
+    from sqlalchemy.ext.asyncio import create_async_engine
+    url, connect_args = _async_url_and_connect_args()
+    return create_async_engine(url, connect_args=connect_args, **POOL_OPTIONS)
+
+
+def _create_async_session_factory():
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    return async_sessionmaker(bind=async_engine.get(), expire_on_commit=False)
+
+
+# Blocking engine, used from worker threads and standalone scripts
+engine = Lazy("database engine", _create_engine)
+session_factory = Lazy("database session factory", _create_session_factory)
+
+# asyncio engine, used by sync requests and jobs so DB writes never block the event loop
+async_engine = Lazy("async database engine", _create_async_engine)
+async_session_factory = Lazy("async database session factory", _create_async_session_factory)
+
+
+def get_db_session():
+    """Open a new SQLAlchemy session (the engine is created on first call)."""
+    return session_factory.get()()
+
+
+def run_in_session(work: Callable[[Any], T]) -> T:
+    """
+    Run work(session) in one transaction on the blocking engine.
+
+    Commits if work returns, rolls back and re-raises if it raises.
+    """
+    db = get_db_session()
+    try:
+        result = work(db)
+        with span("db commit"):
+            db.commit()
+        return result
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def run_in_async_session(work: Callable[[Any], T]) -> T:
+    """
+    Run work(session) in one transaction on the async engine.
+
+    work receives a regular (synchronous) Session, so the same persistence
+    code serves both engines; SQLAlchemy drives it over asyncpg without
+    blocking the event loop.
+    """
+    async with async_session_factory.get()() as session:
+        try:
+            result = await session.run_sync(work)
+            with span("db commit"):
+                await session.commit()
+            return result
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def _pool_status(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
+def pool_stats() -> dict:
+    """
+    Connection pool statistics for each engine created so far.
+
+    Engines that have not been used yet are reported as not initialized
+    rather than being created just to be inspected.
+    """
+    stats = {"config": dict(POOL_OPTIONS)}
+    for name, lazy_engine, get_pool in (
+        ("sync", engine, lambda e: e.pool),
+        ("async", async_engine, lambda e: e.sync_engine.pool),
+    ):
+        if lazy_engine.initialized:
+            stats[name] = {"initialized": True, **_pool_status(get_pool(lazy_engine.get()))}
+        else:
+            stats[name] = {"initialized": False}
+    return stats
@@ -1,8 +1,9 @@
 """FastAPI application bootstrap."""
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import ALLOWED_ORIGINS, SERVICE_NAME, SERVICE_VERSION
-from app.api.routes import sync
+from app.config import ALLOWED_ORIGINS, SERVICE_NAME, SERVICE_VERSION, WARMUP_ON_STARTUP
+from app.api.routes import analytics, jobs, laps, sync, telemetry
 import logging
 
 logging.basicConfig(
@@ -12,10 +13,23 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the FastF1 and database warm-up in the background, if enabled, and stop the FastF1 worker pool on shutdown."""
+    if WARMUP_ON_STARTUP:
+        from app.services.warmup import start_warm_up
+        start_warm_up()
+    yield
+    from app.services.fastf1_executor import fastf1_executor
+    fastf1_executor.shutdown()
+
+
 app = FastAPI(
     title=SERVICE_NAME,
     version=SERVICE_VERSION,
     description="F1 Insight Hub ML Service - FastF1 data synchronization",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -29,6 +43,10 @@ app.add_middleware(
 
 # Include routers
 app.include_router(sync.router, prefix="/api/sync", tags=["sync"])
+app.include_router(jobs.router, prefix="/api/sync/jobs", tags=["jobs"])
+app.include_router(laps.router, prefix="/api/laps", tags=["laps"])
+app.include_router(telemetry.router, prefix="/api/telemetry", tags=["telemetry"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 
 
 @app.get("/health")
@@ -41,6 +59,15 @@ async def health_check():
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics."""
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+    from app.services.metrics import prometheus_metrics
+    prometheus_metrics.get()
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -49,9 +76,19 @@ async def root():
         "version": SERVICE_VERSION,
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "sync_drivers": "/api/sync/drivers",
             "sync_teams": "/api/sync/teams",
             "sync_lineups": "/api/sync/lineups",
+            "sync_standings": "/api/sync/standings",
+            "sync_results": "/api/sync/results",
+            "sync_jobs": "/api/sync/jobs",
+            "laps_ingest": "/api/laps/ingest",
+            "laps": "/api/laps/{season}",
+            "telemetry": "/api/telemetry/{season}/{round}/{session}/{driver}",
+            "race_pace": "/api/analytics/{season}/race-pace",
+            "executor": "/api/sync/executor",
+            "db_pool": "/api/sync/db/pool",
             "info": "/api/sync/info",
         },
     }
@@ -0,0 +1,76 @@
+"""Pydantic schemas for race pace analytics."""
+from pydantic import BaseModel
+from typing import Optional
+
+
+class RacePace(BaseModel):
+    """A driver's race pace in one round. Times are in milliseconds."""
+    round: int
+    driver: str
+    driver_id: str  # drivers.driver_id
+    team: Optional[str] = None
+    constructor_id: Optional[str] = None  # constructors.constructor_id
+    laps: Optional[int] = None
+    clean_laps: int
+    position: Optional[int] = None
+    final_gap_ms: Optional[float] = None
+    pace_ms: Optional[float] = None  # Median fuel-corrected clean lap
+    pace_delta_ms: Optional[float] = None  # To the round's fastest driver
+    pace_delta_pct: Optional[float] = None
+
+
+class SeasonPace(BaseModel):
+    """A driver's average race pace deficit over the season."""
+    driver: str
+    driver_id: str
+    team: Optional[str] = None
+    constructor_id: Optional[str] = None
+    rounds: int
+    mean_pace_delta_pct: float
+    median_pace_delta_ms: float
+
+
+class StintPace(BaseModel):
+    """A stint's pace and tyre degradation. Times are in milliseconds."""
+    round: int
+    driver: str
+    driver_id: str
+    stint: int
+    team: Optional[str] = None
+    constructor_id: Optional[str] = None
+    compound: Optional[str] = None
+    start_lap: int
+    end_lap: int
+    laps: int
+    clean_laps: int
+    mean_pace_ms: Optional[float] = None
+    median_pace_ms: Optional[float] = None
+    best_pace_ms: Optional[float] = None
+    degradation_ms_per_lap: Optional[float] = None  # Per lap of tyre life
+
+
+class LapPace(BaseModel):
+    """A lap with its fuel-corrected time and gap to the leader."""
+    round: int
+    driver: str
+    team: Optional[str] = None
+    lap_number: int
+    stint: Optional[int] = None
+    compound: Optional[str] = None
+    tyre_life: Optional[int] = None
+    position: Optional[int] = None
+    lap_time_ms: Optional[float] = None
+    fuel_corrected_ms: Optional[float] = None
+    gap_to_leader_ms: Optional[float] = None
+    clean: bool  # Used for pace and degradation figures
+
+
+class RacePaceResponse(BaseModel):
+    """Response schema for season race pace analytics."""
+    season: int
+    fuel_correction_ms_per_lap: float
+    rounds: list[int]
+    race_pace: list[RacePace]
+    season_pace: list[SeasonPace]
+    stints: list[StintPace]
+    laps: Optional[list[LapPace]] = None
@@ -9,6 +9,7 @@ class DriverSyncRequest(BaseModel):
     seasons: Optional[list[int]] = None  # If None, syncs current season only
     season: Optional[int] = None  # Single season to sync (takes precedence over seasons if provided)
     filter_confirmed: Optional[bool] = True  # Whether to filter to confirmed drivers (only for current/future seasons)
+    parallel: Optional[bool] = True  # Whether to fetch multiple seasons concurrently
 
 
 class DriverData(BaseModel):
@@ -32,4 +33,7 @@ class DriverSyncResponse(BaseModel):
     success: bool
     message: str
     drivers_synced: int
+    drivers_inserted: int = 0
+    drivers_updated: int = 0
+    drivers_unchanged: int = 0  # Already stored with identical data; not rewritten
     errors: Optional[list[str]] = None
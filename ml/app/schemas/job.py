@@ -0,0 +1,26 @@
+"""Pydantic schemas for background sync jobs."""
+from pydantic import BaseModel
+from typing import Any, Optional
+from datetime import datetime
+
+
+class JobProgress(BaseModel):
+    """Progress counters for a sync job."""
+    seasons_total: int
+    seasons_done: int
+    rows_written: int
+
+
+class JobStatusResponse(BaseModel):
+    """Response schema for job submission and status polling."""
+    job_id: str
+    kind: str
+    status: str  # queued, running, succeeded or failed
+    params: dict[str, Any]
+    progress: JobProgress
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    deduplicated: bool = False  # True if the request was attached to an identical running job
@@ -0,0 +1,56 @@
+"""Pydantic schemas for the lap store."""
+from pydantic import BaseModel
+from typing import Optional
+
+
+class LapIngestRequest(BaseModel):
+    """Request schema for lap ingestion."""
+    season: int
+    session_types: Optional[list[str]] = None  # Defaults to ["R"]
+    parallel: Optional[bool] = True  # Whether to load events concurrently
+    refresh: Optional[bool] = False  # Reload sessions that are already stored
+
+
+class LapIngestResponse(BaseModel):
+    """Response schema for lap ingestion."""
+    success: bool
+    message: str
+    sessions_stored: int
+    laps_stored: int
+    sessions_skipped: int  # Already in the lap store
+    errors: Optional[list[str]] = None
+
+
+class LapData(BaseModel):
+    """Stored lap schema. Times are in milliseconds."""
+    season: int
+    round: int
+    session: str
+    driver: str
+    driver_number: Optional[str] = None
+    team: Optional[str] = None
+    lap_number: Optional[int] = None
+    stint: Optional[int] = None
+    lap_time_ms: Optional[int] = None
+    sector1_ms: Optional[int] = None
+    sector2_ms: Optional[int] = None
+    sector3_ms: Optional[int] = None
+    lap_start_ms: Optional[int] = None
+    session_time_ms: Optional[int] = None
+    compound: Optional[str] = None
+    tyre_life: Optional[int] = None
+    fresh_tyre: Optional[bool] = None
+    pit_in: Optional[bool] = None
+    pit_out: Optional[bool] = None
+    track_status: Optional[str] = None
+    position: Optional[int] = None
+    is_accurate: Optional[bool] = None
+    is_personal_best: Optional[bool] = None
+    deleted: Optional[bool] = None
+
+
+class LapsResponse(BaseModel):
+    """Response schema for lap queries."""
+    season: int
+    count: int
+    laps: list[LapData]
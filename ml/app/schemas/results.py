@@ -0,0 +1,19 @@
+"""Pydantic schemas for race and qualifying results sync."""
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ResultsSyncRequest(BaseModel):
+    """Request schema for results sync."""
+    season: int
+    parallel: Optional[bool] = True  # Whether to load events concurrently
+
+
+class ResultsSyncResponse(BaseModel):
+    """Response schema for results sync."""
+    success: bool
+    message: str
+    races_synced: int
+    race_results_synced: int  # Rows inserted or changed; identical rows are not rewritten
+    qualifying_results_synced: int
+    errors: Optional[list[str]] = None
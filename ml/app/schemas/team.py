@@ -7,6 +7,7 @@ class TeamSyncRequest(BaseModel):
     """Request schema for team sync."""
     seasons: Optional[list[int]] = None  # If None, syncs current season only
     season: Optional[int] = None  # Single season to sync (takes precedence over seasons if provided)
+    parallel: Optional[bool] = True  # Whether to fetch multiple seasons concurrently
 
 
 class TeamData(BaseModel):
@@ -21,4 +22,7 @@ class TeamSyncResponse(BaseModel):
     success: bool
     message: str
     teams_synced: int
+    teams_inserted: int = 0
+    teams_updated: int = 0
+    teams_unchanged: int = 0  # Already stored with identical data; not rewritten
     errors: Optional[list[str]] = None
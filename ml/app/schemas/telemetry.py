@@ -0,0 +1,25 @@
+"""Pydantic schemas for telemetry traces."""
+from pydantic import BaseModel
+from typing import Optional
+
+
+class TraceData(BaseModel):
+    """One downsampled channel. x is metres or seconds, depending on the axis."""
+    x: list[float]
+    y: list[float]
+
+
+class TelemetryTraceResponse(BaseModel):
+    """Response schema for lap telemetry traces."""
+    season: int
+    round: int
+    session: str
+    driver: str
+    lap: Optional[int] = None  # None for the driver's whole session
+    method: str
+    axis: str
+    points: int
+    samples: int  # Raw car data samples the traces were reduced from
+    lap_time_ms: Optional[int] = None
+    compound: Optional[str] = None
+    traces: dict[str, TraceData]  # speed, throttle, brake
@@ -0,0 +1,72 @@
+"""Fingerprint-based change detection for sync writes."""
+import hashlib
+import json
+import math
+from datetime import date, datetime
+from typing import Any, Hashable, Sequence
+
+
+def _normalize(value: Any) -> Any:
+    """Reduce a value to a JSON-stable form that matches what the database returns."""
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        # numpy/pandas scalars
+        value = value.item()
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def fingerprint(record: dict, fields: Sequence[str]) -> str:
+    """
+    Stable hash of a record's tracked fields.
+
+    Args:
+        record: Normalized record, as written to or read from the database
+        fields: Columns that make up the record's content
+
+    Returns:
+        Hex digest that changes only when one of the fields changes
+    """
+    payload = json.dumps([_normalize(record.get(field)) for field in fields], separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def classify_changes(
+    incoming: list[dict],
+    stored: dict[Hashable, dict],
+    key: str,
+    fields: Sequence[str],
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Split incoming records by comparing their fingerprints with the stored rows.
+
+    Records sharing a key are collapsed to the last one, as the upserts do.
+
+    Args:
+        incoming: Normalized records about to be written
+        stored: Stored rows for the incoming keys, by key
+        key: Field identifying a record
+        fields: Columns compared between incoming and stored rows
+
+    Returns:
+        Tuple of (records to insert, records to update, unchanged records)
+    """
+    latest = {record[key]: record for record in incoming}
+
+    inserted, updated, unchanged = [], [], []
+    for record_key, record in latest.items():
+        existing = stored.get(record_key)
+        if existing is None:
+            inserted.append(record)
+        elif fingerprint(existing, fields) != fingerprint(record, fields):
+            updated.append(record)
+        else:
+            unchanged.append(record)
+    return inserted, updated, unchanged
@@ -0,0 +1,88 @@
+"""Downsampling of dense telemetry channels to chart-sized traces."""
+import numpy as np
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick the sample of each bucket that forms
+    the largest triangle with the previously picked sample and the average of
+    the next bucket. Keeps the visual shape of a line with few points.
+
+    Args:
+        x: Monotonic sample positions
+        y: Sample values
+        points: Number of samples to keep (at least 3)
+
+    Returns:
+        Sorted indices of the kept samples, including the first and last
+    """
+    n = len(x)
+    if points >= n:
+        return np.arange(n)
+    if points < 3:
+        raise ValueError("LTTB needs at least 3 points")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # points - 2 buckets between the fixed first and last samples
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    # Average of each bucket (and of the final sample), for the third triangle corner
+    next_x = np.append(np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / np.diff(edges), x[-1])
+    next_y = np.append(np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / np.diff(edges), y[-1])
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        avg_x, avg_y = next_x[bucket + 1], next_y[bucket + 1]
+        px, py = x[previous], y[previous]
+        area = np.abs((px - avg_x) * (y[start:end] - py) - (px - x[start:end]) * (avg_y - py))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def min_max_indices(y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Min-max bucketing: keep the lowest and highest sample of each of
+    points // 2 equal-width buckets. Never drops a peak, which suits on/off
+    channels such as the brake.
+
+    Returns:
+        Sorted, de-duplicated indices of the kept samples
+    """
+    n = len(y)
+    if points >= n:
+        return np.arange(n)
+    buckets = max(1, points // 2)
+    size = -(-n // buckets)
+    # Pad with the last value so every bucket is a full row of a 2-D view
+    grid = np.pad(np.asarray(y, dtype=np.float64), (0, buckets * size - n), mode="edge").reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate([offsets + grid.argmin(axis=1), offsets + grid.argmax(axis=1)])
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def downsample(x: np.ndarray, y: np.ndarray, points: int, method: str = "lttb") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a channel to about `points` samples.
+
+    Args:
+        x: Monotonic sample positions (distance or time)
+        y: Sample values
+        points: Target number of samples
+        method: "lttb" or "minmax"
+
+    Returns:
+        Tuple of (x, y) arrays of the kept samples
+    """
+    if method == "lttb":
+        indices = lttb_indices(x, y, points)
+    elif method == "minmax":
+        indices = min_max_indices(y, points)
+    else:
+        raise ValueError(f"Unknown downsampling method {method!r}, expected one of {DOWNSAMPLING_METHODS}")
+    return x[indices], y[indices]
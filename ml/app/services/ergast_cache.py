@@ -0,0 +1,132 @@
+"""Persistent cache of Ergast responses, keyed by endpoint and season."""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from app.config import ERGAST_CACHE_DIR, ERGAST_REFRESH_SECONDS
+from app.services.metrics import CACHE_REQUESTS
+from app.services.seasons import CURRENT_SEASON
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class ErgastResponseCache:
+    """
+    On-disk cache of converted Ergast responses, one JSON file per (endpoint, season).
+
+    Completed seasons are cached indefinitely. The current (and any future)
+    season is refetched once its entry is older than refresh_seconds; if that
+    refetch fails, the stale entry is served instead. Entries are also kept in
+    memory, so repeated lookups do not touch the disk.
+    """
+
+    def __init__(self, directory: str, refresh_seconds: float):
+        self.directory = Path(directory)
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, int], threading.Lock] = {}
+        self._entries: dict[tuple[str, int], dict] = {}
+
+    def path(self, endpoint: str, season: int) -> Path:
+        return self.directory / endpoint / f"{season}.json"
+
+    @staticmethod
+    def is_final(season: int) -> bool:
+        """Whether a season is over, so its responses never change."""
+        return season < CURRENT_SEASON
+
+    def _read(self, endpoint: str, season: int) -> Optional[dict]:
+        """Load an entry from memory or disk. Caller must hold the key lock."""
+        key = (endpoint, season)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        path = self.path(endpoint, season)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read Ergast cache entry {path}: {e}")
+            return None
+        if entry.get("version") != CACHE_VERSION:
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _write(self, endpoint: str, season: int, records: list[dict]) -> dict:
+        """Store an entry in memory and atomically on disk. Caller must hold the key lock."""
+        entry = {
+            "version": CACHE_VERSION,
+            "endpoint": endpoint,
+            "season": season,
+            "fetched_at": time.time(),
+            "records": records,
+        }
+        self._entries[(endpoint, season)] = entry
+        path = self.path(endpoint, season)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write Ergast cache entry {path}: {e}")
+        return entry
+
+    def _is_fresh(self, entry: dict, season: int) -> bool:
+        return self.is_final(season) or time.time() - entry["fetched_at"] < self.refresh_seconds
+
+    def get_or_fetch(self, endpoint: str, season: int, fetch: Callable[[], list[dict]]) -> list[dict]:
+        """
+        Return the cached records for an endpoint and season, fetching them when missing or due.
+
+        Concurrent callers for the same key share one fetch. Empty responses
+        are returned but not cached.
+
+        Args:
+            endpoint: Ergast endpoint name (e.g. "driver_standings")
+            season: Season year
+            fetch: Downloads and converts the response
+
+        Returns:
+            List of record dicts
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault((endpoint, season), threading.Lock())
+
+        with key_lock:
+            entry = self._read(endpoint, season)
+            if entry is not None and self._is_fresh(entry, season):
+                CACHE_REQUESTS.labels(cache="ergast", result="hit").inc()
+                return entry["records"]
+
+            CACHE_REQUESTS.labels(cache="ergast", result="miss").inc()
+            try:
+                with span("ergast fetch", season=season, endpoint=endpoint, refresh=entry is not None):
+                    records = fetch()
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Refreshing Ergast {endpoint} for {season} failed, serving cached response: {e}")
+                return entry["records"]
+
+            if not records:
+                return entry["records"] if entry is not None else records
+            return self._write(endpoint, season, records)["records"]
+
+    def clear(self) -> None:
+        """Drop in-memory entries; files on disk are kept."""
+        with self._lock:
+            self._entries.clear()
+
+
+ergast_cache = ErgastResponseCache(ERGAST_CACHE_DIR, ERGAST_REFRESH_SECONDS)
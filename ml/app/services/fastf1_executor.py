@@ -0,0 +1,123 @@
+"""Dedicated, bounded executor for blocking FastF1/Ergast work."""
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+from app.config import FASTF1_EXECUTOR, FASTF1_MAX_QUEUE, FASTF1_WORKERS
+from app.services.lazy import Lazy
+from app.services.tracing import bind_context
+
+logger = logging.getLogger(__name__)
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when the FastF1 executor's queue is full."""
+
+
+class FastF1Executor:
+    """
+    Runs blocking FastF1 work on its own pool, separate from the event loop's
+    default executor.
+
+    At most max_workers calls run at once; up to max_queue more wait for a
+    worker, and further submissions are rejected with ExecutorBusyError rather
+    than piling up. The process backend sidesteps the GIL for pandas-heavy
+    parsing, but callables and their arguments must be picklable and each
+    worker process keeps its own session caches. Metrics and spans recorded
+    inside a worker process stay in that process, so they are missing from
+    /metrics and /api/sync/traces.
+    """
+
+    def __init__(self, backend: str, max_workers: int, max_queue: int):
+        if backend not in (BACKEND_THREAD, BACKEND_PROCESS):
+            raise ValueError(f"Unknown FastF1 executor backend: {backend}")
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._executor = Lazy(f"FastF1 {backend} pool", self._create_pool)
+
+    def _create_pool(self) -> Executor:
+        if self.backend == BACKEND_PROCESS:
+            # spawn, not fork: the parent has threads (warm-up, FastF1 fetches) whose
+            # locks must not be copied into the children
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fastf1")
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorBusyError(
+                    f"FastF1 executor is busy ({self._in_flight} calls in flight, "
+                    f"{self.max_workers} workers, queue limit {self.max_queue})"
+                )
+            self._in_flight += 1
+            self._submitted += 1
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Submit fn(*args, **kwargs), raising ExecutorBusyError if the queue is full."""
+        self._reserve()
+        if self.backend == BACKEND_THREAD:
+            # Keep spans started by fn in the caller's trace
+            fn = bind_context(fn)
+        try:
+            future = self._executor.get().submit(fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+                self._failed += 1
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await fn(*args, **kwargs) on the FastF1 pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(functools.partial(fn, *args, **kwargs)))
+
+    def stats(self) -> dict:
+        """Concurrency settings and queue-depth counters."""
+        with self._lock:
+            in_flight = self._in_flight
+            running = min(in_flight, self.max_workers)
+            return {
+                "backend": self.backend,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": in_flight,
+                "running": running,
+                "queued": in_flight - running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool if it was started, letting running calls finish."""
+        if self._executor.initialized:
+            self._executor.get().shutdown(wait=False, cancel_futures=True)
+
+
+fastf1_executor = FastF1Executor(FASTF1_EXECUTOR, FASTF1_WORKERS, FASTF1_MAX_QUEUE)
@@ -1,17 +1,42 @@
 """FastF1 data fetching service."""
 import logging
-from typing import Optional
-import fastf1
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional
 from fastf1.core import Session
 from fastf1.ergast import Ergast
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from app.config import FASTF1_CACHE_DIR
+from app.config import SYNC_EVENT_WORKERS, SYNC_SEASON_WORKERS
+from app.services.seasons import CURRENT_SEASON, CONFIRMED_2026_DRIVERS, resolve_seasons
+from app.services.session_index import session_index
+from app.services.ergast_cache import ergast_cache
+from app.services.lazy import Lazy
+from app.services.season_snapshots import season_snapshots
+from app.services.lap_store import lap_store
+from app.services.metrics import (
+    CACHE_REQUESTS,
+    FIND_BEST_SESSION_SECONDS,
+    LAPS_FALLBACK_SECONDS,
+    SESSIONS_PROBED,
+    TEAM_FALLBACKS,
+)
+from app.services.tracing import bind_context, span
+from app.services.session_cache import (
+    cached_session,
+    discovery_cache,
+    fastf1_cache,
+    get_event_schedule,
+    load_session,
+    load_session_laps,
+)
 
 logger = logging.getLogger(__name__)
 
-# Set FastF1 cache directory
-fastf1.Cache.enable_cache(FASTF1_CACHE_DIR)
+# One Ergast client for the process; its requests go through FastF1's pooled, HTTP-cached session
+ergast_client = Lazy("Ergast client", lambda: Ergast())
 
 # Championship winners data (hardcoded for now, can be enhanced with FastF1 historical data)
 DRIVER_CHAMPIONSHIPS = {
@@ -37,48 +62,6 @@ DRIVER_CHAMPIONSHIPS = {
     # Add more as needed
 }
 
-# Current season year
-CURRENT_SEASON = 2026
-
-# Confirmed 2026 F1 driver lineup (official race drivers only)
-# This is used to filter out test/reserve drivers from sessions
-# Updated based on official 2026 lineup - excludes MAG, ZHO, TSU, DOO
-CONFIRMED_2026_DRIVERS = {
-    # Alpine
-    "GAS",  # Pierre Gasly
-    "COL",  # Franco Colapinto
-    # Aston Martin
-    "ALO",  # Fernando Alonso
-    "STR",  # Lance Stroll
-    # Audi (formerly Sauber)
-    "BOR",  # Gabriel Bortoleto
-    "HUL",  # Nico Hulkenberg
-    # Cadillac
-    "PER",  # Sergio Pérez
-    "BOT",  # Valtteri Bottas
-    # Ferrari
-    "LEC",  # Charles Leclerc
-    "HAM",  # Lewis Hamilton
-    # Haas
-    "BEA",  # Oliver Bearman
-    "OCO",  # Esteban Ocon
-    # McLaren
-    "NOR",  # Lando Norris
-    "PIA",  # Oscar Piastri
-    # Mercedes
-    "RUS",  # George Russell
-    "ANT",  # Kimi Antonelli
-    # Racing Bulls
-    "LAW",  # Liam Lawson
-    "LIN",  # Arvid Lindblad (confirmed for 2026)
-    # Red Bull Racing
-    "VER",  # Max Verstappen
-    "HAD",  # Isack Hadjar
-    # Williams
-    "SAI",  # Carlos Sainz
-    "ALB",  # Alexander Albon
-}
-
 
 def normalize_driver_name(name: str) -> str:
     """Normalize driver name for lookup."""
@@ -101,6 +84,22 @@ def get_constructor_championships(driver_name: str, team_name: str) -> int:
 def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Session], Optional[str], Optional[str]]:
     """
     Find the best available session for extracting driver/team data.
+    The result is shared through the in-process discovery cache, so driver and
+    team fetches for the same season run discovery only once.
+    
+    Returns: (session, session_type, event_name) or (None, None, None)
+    """
+    with span("session discovery", season=year) as current, FIND_BEST_SESSION_SECONDS.time():
+        session, session_type, event_name = discovery_cache.get_or_load(
+            year, lambda: _discover_best_session(year, schedule)
+        )
+        current.set_attributes({"event": event_name or "", "session_type": session_type or ""})
+        return session, session_type, event_name
+
+
+def _discover_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Session], Optional[str], Optional[str]]:
+    """
+    Probe the schedule for the best available session.
     Prioritizes completed sessions with results data.
     
     Returns: (session, session_type, event_name) or (None, None, None)
@@ -110,6 +109,7 @@ def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Sess
     # For current/future seasons, also allow testing/shakedown sessions
     # as they may be the only available data
     allow_testing = year >= CURRENT_SEASON
+    probed = 0
     
     # Try to find a session with results, starting from most recent events
     for idx in range(len(schedule) - 1, -1, -1):
@@ -121,20 +121,31 @@ def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Sess
             if not allow_testing and ("Testing" in event_name or "Test" in event_name or "Shakedown" in event_name):
                 continue
             
+            # Events after the last index build must be probed again
+            refresh = session_index.needs_refresh(year, event.get("EventDate"))
+            
             # Try each session type in priority order
             for sess_type in session_types:
+                # Skip sessions the index already knows lack drivers or results
+                indexed = None if refresh else session_index.lookup(year, event_name, sess_type)
+                if indexed is not None and not (indexed["has_drivers"] and indexed["has_results"]):
+                    continue
+                
                 try:
-                    test_session = fastf1.get_session(year, event_name, sess_type)
                     # Load minimal data first to check if session is valid
-                    test_session.load(weather=False, messages=False, telemetry=False, laps=False)
+                    probed += 1
+                    test_session = load_session(year, event_name, sess_type)
                     
                     # Check if session has drivers and results
                     has_drivers = len(test_session.drivers) > 0
                     has_results = hasattr(test_session, 'results') and not test_session.results.empty
+                    session_index.record(year, event_name, sess_type, has_drivers, has_results, event.get("EventDate"))
                     
                     if has_drivers and has_results:
                         # This is ideal - we have both drivers and results with team info
                         logger.info(f"Found ideal session: {event_name} {sess_type} with {len(test_session.drivers)} drivers")
+                        session_index.mark_built(year)
+                        SESSIONS_PROBED.observe(probed)
                         return test_session, sess_type, event_name
                     elif has_drivers:
                         # Has drivers but no results - might still be useful
@@ -148,6 +159,8 @@ def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Sess
             logger.debug(f"Error processing event: {e}")
             continue
     
+    session_index.mark_built(year)
+    
     # Fallback: try first event if no completed session found
     logger.warning("No completed session with results found, trying first event (including testing)")
     try:
@@ -157,10 +170,11 @@ def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Sess
         fallback_types = ["R", "Q", "FP3", "FP2", "FP1"] if year >= CURRENT_SEASON else ["R", "Q"]
         for sess_type in fallback_types:
             try:
-                session = fastf1.get_session(year, event_name, sess_type)
-                session.load(weather=False, messages=False, telemetry=False, laps=False)
+                probed += 1
+                session = load_session(year, event_name, sess_type)
                 if len(session.drivers) > 0:
                     logger.info(f"Using fallback session: {event_name} {sess_type} with {len(session.drivers)} drivers")
+                    SESSIONS_PROBED.observe(probed)
                     return session, sess_type, event_name
             except Exception as e:
                 logger.debug(f"Fallback session {event_name} {sess_type} failed: {e}")
@@ -168,9 +182,177 @@ def _find_best_session(year: int, schedule: pd.DataFrame) -> tuple[Optional[Sess
     except Exception as e:
         logger.error(f"Failed to load fallback session: {e}")
     
+    SESSIONS_PROBED.observe(probed)
     return None, None, None
 
 
+# Sessions of an event whose results can lend team names to each other, in order of preference
+EVENT_SESSION_TYPES = ["R", "Q", "S", "SQ", "FP3", "FP2", "FP1"]
+
+
+def _team_names(frame: pd.DataFrame, code_column: str, team_column: str) -> pd.Series:
+    """Map of 3-letter code -> team name from a results-like frame, skipping blanks."""
+    if frame is None or frame.empty or code_column not in frame or team_column not in frame:
+        return pd.Series(dtype=object)
+    names = frame[[code_column, team_column]].replace('', pd.NA).dropna()
+    codes = names[code_column].astype(str).str.strip().str.upper()
+    return pd.Series(names[team_column].astype(str).to_numpy(), index=codes.to_numpy()).groupby(level=0).first()
+
+
+def _teams_from_cached_sessions(year: int, event_name: str, session_type: str) -> pd.Series:
+    """Team names from other sessions of the same event that are already in the session cache."""
+    lookups = []
+    for other_type in EVENT_SESSION_TYPES:
+        if other_type == session_type:
+            continue
+        other = cached_session(year, event_name, other_type)
+        if other is not None and hasattr(other, 'results'):
+            lookups.append(_team_names(other.results, 'Abbreviation', 'TeamName'))
+    if not lookups:
+        return pd.Series(dtype=object)
+    # Earlier (preferred) sessions win
+    return pd.concat(lookups).groupby(level=0).first()
+
+
+def _teams_from_driver_info(session: Session) -> pd.Series:
+    """Team names from the session's driver list (a small, HTTP-cached request)."""
+    from fastf1 import api as fastf1_api
+    
+    driver_info = pd.DataFrame(list(fastf1_api.driver_info(session.api_path).values()))
+    return _team_names(driver_info, 'Tla', 'TeamName')
+
+
+def _teams_from_laps(year: int, event_name: str, session_type: str) -> pd.Series:
+    """
+    Team names from the session's lap table. Loads every lap, so it is only a last resort.
+    
+    The laps are loaded into a separate Session rather than the shared cached one,
+    which other threads may be reading results from.
+    """
+    logger.warning(f"Loading laps for {year} {event_name} {session_type} to recover team names")
+    with LAPS_FALLBACK_SECONDS.time():
+        session = load_session_laps(year, event_name, session_type)
+    laps = session.laps if hasattr(session, 'laps') else pd.DataFrame()
+    # Keep the laps we paid for in the lap store
+    try:
+        round_number = _round_number(year, event_name)
+        if round_number and not lap_store.has(year, round_number, session_type):
+            store_session_laps(session, year, round_number, event_name, session_type)
+    except Exception as e:
+        logger.warning(f"Could not store laps for {year} {event_name} {session_type}: {e}")
+    return _team_names(laps, 'Driver', 'Team')
+
+
+def _fallback_team_names(
+    session: Session, year: int, event_name: str, session_type: str, codes: Optional[pd.Index] = None
+) -> pd.Series:
+    """
+    Recover team names for a session whose results lack them.
+    
+    Sources are tried from cheapest to most expensive: other cached sessions of
+    the same event, the session's driver list, and finally a full laps load.
+    Later sources only run while codes are still missing a team.
+    
+    Args:
+        session: Loaded session with incomplete team names
+        codes: 3-letter codes that need a team; if None, the first source with any teams wins
+    
+    Returns:
+        Series of team names indexed by 3-letter code
+    """
+    sources = (
+        ("cached_sessions", lambda: _teams_from_cached_sessions(year, event_name, session_type)),
+        ("driver_info", lambda: _teams_from_driver_info(session)),
+        ("laps", lambda: _teams_from_laps(year, event_name, session_type)),
+    )
+    
+    found = pd.Series(dtype=object)
+    with span("team fallback", season=year, event=event_name, session_type=session_type) as current:
+        for source, load in sources:
+            missing = codes.difference(found.index) if codes is not None else None
+            if (missing is not None and missing.empty) or (missing is None and not found.empty):
+                break
+            try:
+                names = load()
+            except Exception as e:
+                logger.debug(f"Could not get team names from {source} for {event_name} {session_type}: {e}")
+                continue
+            if codes is not None:
+                names = names[names.index.isin(missing)]
+            if names.empty:
+                continue
+            TEAM_FALLBACKS.labels(source=source).inc()
+            current.set_attribute("source", source)
+            logger.info(f"Recovered team names for {len(names)} drivers from {source}")
+            found = pd.concat([found, names[~names.index.isin(found.index)]])
+    return found
+
+
+def _drivers_from_session(
+    session: Session, year: int, session_type: str, event_name: str, filter_confirmed: bool
+) -> Optional[list[dict]]:
+    """
+    Extract driver records from a loaded session's results, column-wise.
+    
+    Returns:
+        List of driver dicts, or None if the results have no driver abbreviations
+    """
+    results = session.results if hasattr(session, 'results') else pd.DataFrame()
+    if results.empty or 'Abbreviation' not in results:
+        logger.warning(f"No abbreviations found in results for {event_name} {session_type}, cannot extract drivers")
+        return None
+    
+    # Column-wise extraction from session.results (most reliable source). Columns include
+    # Abbreviation, TeamName, DriverNumber, FirstName, LastName, CountryCode, etc.
+    codes = results['Abbreviation'].fillna('').astype(str).str.strip().str.upper()
+    frame = results.assign(code=codes)
+    # Only use 3-letter codes, one row per driver
+    frame = frame[frame['code'].str.len() == 3].drop_duplicates('code')
+    
+    numbers = pd.to_numeric(frame.reindex(columns=['DriverNumber'])['DriverNumber'], errors='coerce')
+    teams = frame.reindex(columns=['TeamName'])['TeamName'].replace('', pd.NA)
+    logger.info(f"Extracted team mappings for {int(teams.notna().sum())} drivers from results")
+    
+    # Fallback: fill in team names missing from the results
+    if teams.isna().any():
+        missing_codes = pd.Index(frame.loc[teams.isna(), 'code'])
+        teams = teams.fillna(frame['code'].map(
+            _fallback_team_names(session, year, event_name, session_type, missing_codes)
+        ))
+    
+    # Filter to only confirmed race drivers for current/future seasons (if requested)
+    # This prevents test/reserve drivers from being included
+    if filter_confirmed and year >= CURRENT_SEASON:
+        # Convert to uppercase for case-insensitive comparison
+        confirmed_drivers = {code.upper() for code in CONFIRMED_2026_DRIVERS}
+        logger.info(f"Filtering to {len(confirmed_drivers)} confirmed {year} race drivers: {sorted(confirmed_drivers)}")
+        keep = frame['code'].isin(confirmed_drivers)
+        if not keep.all():
+            logger.debug(f"Filtering out unconfirmed/test drivers: {sorted(frame.loc[~keep, 'code'])} (not in {year} confirmed lineup)")
+        frame, numbers, teams = frame[keep], numbers[keep], teams[keep]
+    
+    info = frame.reindex(columns=['FirstName', 'LastName', 'CountryCode']).fillna('')
+    with span("normalization"):
+        current_team = _map_distinct(teams, normalize_team_name)
+    
+    drivers_frame = pd.DataFrame({
+        "driver_id": frame['code'].str.lower(),  # Use 3-letter code for driver_id
+        "code": frame['code'],  # Store uppercase 3-letter code
+        "forename": info['FirstName'],
+        "surname": info['LastName'],
+        "nationality": info['CountryCode'],
+        "permanent_number": numbers.astype('Int64'),
+        "current_team": current_team,
+        "is_active": True,
+        "driver_championships": _map_distinct(info['LastName'], get_driver_championships),
+    })
+    drivers_frame["constructor_championships"] = [
+        get_constructor_championships(surname, team if isinstance(team, str) else "")
+        for surname, team in zip(info['LastName'], current_team)
+    ]
+    return _records(drivers_frame)
+
+
 def fetch_current_season_drivers(year: int = CURRENT_SEASON, filter_confirmed: bool = True) -> list[dict]:
     """
     Fetch drivers from a specific season using FastF1 with improved team extraction.
@@ -188,7 +370,7 @@ def fetch_current_season_drivers(year: int = CURRENT_SEASON, filter_confirmed: b
         logger.info(f"Fetching drivers for season {year}")
         
         # Get schedule for the season
-        schedule = fastf1.get_event_schedule(year)
+        schedule = get_event_schedule(year)
         
         if schedule.empty:
             logger.warning(f"No events found for season {year}")
@@ -231,187 +413,10 @@ def fetch_current_season_drivers(year: int = CURRENT_SEASON, filter_confirmed: b
             logger.warning(f"Could not fetch drivers for season {year} - no data available")
             return []
         
-        # Build comprehensive driver-to-team mapping from session.results (most reliable source)
-        driver_team_map = {}
-        driver_number_map = {}  # Map driver code to permanent number
-        number_to_abbrev_map = {}  # Map permanent number to abbreviation (3-letter code)
-        abbrev_to_number_map = {}  # Map abbreviation to permanent number
-        
-        try:
-            if hasattr(session, 'results') and not session.results.empty:
-                # session.results is a DataFrame with columns like:
-                # Abbreviation, TeamName, DriverNumber, FullName, etc.
-                for _, row in session.results.iterrows():
-                    abbrev = str(row.get('Abbreviation', '')).strip().upper()
-                    team = row.get('TeamName', '')
-                    driver_number = row.get('DriverNumber', None)
-                    
-                    if abbrev and len(abbrev) == 3:  # Only use 3-letter codes
-                        if team:
-                            driver_team_map[abbrev] = team
-                        if driver_number is not None:
-                            driver_num = int(driver_number)
-                            driver_number_map[abbrev] = driver_num
-                            number_to_abbrev_map[driver_num] = abbrev
-                            abbrev_to_number_map[abbrev] = driver_num
-                
-                logger.info(f"Extracted team mappings for {len(driver_team_map)} drivers from results")
-                logger.info(f"Abbreviation mapping: {sorted(abbrev_to_number_map.items())}")
-        except Exception as e:
-            logger.warning(f"Could not extract team mapping from results: {e}")
-        
-        # Fallback: try to get team info from laps if results didn't have it
-        if len(driver_team_map) < len(session.drivers):
-            try:
-                # Load laps data (minimal) to get team info for missing drivers
-                session.load(laps=True)
-                if hasattr(session, 'laps') and not session.laps.empty:
-                    for driver_code in session.drivers:
-                        if driver_code not in driver_team_map:
-                            try:
-                                driver_laps = session.laps.pick_drivers([driver_code])
-                                if not driver_laps.empty:
-                                    team = driver_laps.iloc[0].get("Team", None)
-                                    if team:
-                                        driver_team_map[driver_code] = team
-                            except Exception:
-                                pass
-            except Exception as e:
-                logger.debug(f"Could not extract team from laps: {e}")
-        
-        # Extract driver data
-        drivers_data = []
-        drivers_seen = set()  # Track drivers we've already processed to avoid duplicates (by code)
-        driver_ids_seen = set()  # Track by driver_id to prevent duplicates
-        
-        # Filter to only confirmed race drivers for current/future seasons (if requested)
-        # This prevents test/reserve drivers from being included
-        confirmed_drivers = None
-        if filter_confirmed and year >= CURRENT_SEASON:
-            # Convert to uppercase for case-insensitive comparison
-            confirmed_drivers = {code.upper() for code in CONFIRMED_2026_DRIVERS}
-            logger.info(f"Filtering to {len(confirmed_drivers)} confirmed {year} race drivers: {sorted(confirmed_drivers)}")
-        
-        # Process drivers from results DataFrame first (has proper abbreviations)
-        # Then fallback to session.drivers if needed
-        drivers_to_process = []
-        
-        # First, try to get drivers from results DataFrame (has proper 3-letter codes)
-        if hasattr(session, 'results') and not session.results.empty:
-            for _, row in session.results.iterrows():
-                abbrev = str(row.get('Abbreviation', '')).strip().upper()
-                driver_number = row.get('DriverNumber', None)
-                
-                # Only use 3-letter abbreviations
-                if abbrev and len(abbrev) == 3:
-                    drivers_to_process.append(abbrev)
-                elif driver_number is not None:
-                    # If we have a number but no abbrev, try to get abbrev from map
-                    driver_num = int(driver_number)
-                    if driver_num in number_to_abbrev_map:
-                        abbrev_from_map = number_to_abbrev_map[driver_num]
-                        if abbrev_from_map not in drivers_to_process:
-                            drivers_to_process.append(abbrev_from_map)
-        
-        # Fallback: use session.drivers if results didn't have abbreviations
-        if not drivers_to_process:
-            drivers_to_process = list(session.drivers)
-            logger.warning("No abbreviations found in results, using session.drivers (may contain numbers)")
-        
-        for driver_code in drivers_to_process:
-            # Convert to string and normalize
-            driver_code_str = str(driver_code).strip().upper()
-            
-            # If it's a number, try to map it to abbreviation
-            if driver_code_str.isdigit():
-                driver_num = int(driver_code_str)
-                if driver_num in number_to_abbrev_map:
-                    driver_code_str = number_to_abbrev_map[driver_num]
-                else:
-                    logger.warning(f"Driver number {driver_num} not found in abbreviation map, skipping")
-                    continue
-            
-            # Skip if not a 3-letter code
-            if len(driver_code_str) != 3:
-                logger.debug(f"Skipping invalid driver code format: {driver_code_str}")
-                continue
-            
-            # Skip if we've already processed this driver (safety check)
-            if driver_code_str in drivers_seen:
-                logger.debug(f"Skipping duplicate driver code: {driver_code_str}")
-                continue
-            
-            # Filter out test/reserve drivers for current season
-            if confirmed_drivers and driver_code_str not in confirmed_drivers:
-                logger.debug(f"Filtering out unconfirmed/test driver: {driver_code_str} (not in {year} confirmed lineup)")
-                continue
-            
-            drivers_seen.add(driver_code_str)
-            
-            try:
-                # Try to get driver info using the code, fallback to number if needed
-                try:
-                    driver_info = session.get_driver(driver_code_str)
-                except:
-                    # If code doesn't work, try using the permanent number
-                    if driver_code_str in abbrev_to_number_map:
-                        driver_num = abbrev_to_number_map[driver_code_str]
-                        driver_info = session.get_driver(str(driver_num))
-                    else:
-                        raise
-                
-                # Get team name - use abbreviation from results
-                team_name = driver_team_map.get(driver_code_str)
-                
-                # If still no team, try direct lookup in results
-                if not team_name and hasattr(session, 'results') and not session.results.empty:
-                    try:
-                        # Try case-insensitive match on Abbreviation column
-                        driver_result = session.results[
-                            session.results['Abbreviation'].str.upper().str.strip() == driver_code_str
-                        ]
-                        if not driver_result.empty:
-                            team_name = driver_result.iloc[0].get('TeamName', None)
-                    except Exception:
-                        pass
-                
-                # Normalize team name
-                if team_name:
-                    team_name = normalize_team_name(team_name)
-                
-                # Get permanent number - prioritize results mapping, then driver_info
-                permanent_number = driver_number_map.get(driver_code_str)
-                if permanent_number is None:
-                    permanent_number = driver_info.get("DriverNumber")
-                
-                driver_id = driver_code_str.lower()  # Use 3-letter code for driver_id
-                
-                # Final duplicate check by driver_id before adding
-                if driver_id in driver_ids_seen:
-                    logger.debug(f"Skipping duplicate driver_id: {driver_id} (already processed)")
-                    continue
-                
-                driver_ids_seen.add(driver_id)
-                
-                driver_data = {
-                    "driver_id": driver_id,
-                    "code": driver_code_str,  # Store uppercase 3-letter code
-                    "forename": driver_info.get("FirstName", ""),
-                    "surname": driver_info.get("LastName", ""),
-                    "nationality": driver_info.get("CountryCode", ""),
-                    "permanent_number": permanent_number,
-                    "current_team": team_name,
-                    "is_active": True,
-                    "driver_championships": get_driver_championships(driver_info.get("LastName", "")),
-                    "constructor_championships": get_constructor_championships(
-                        driver_info.get("LastName", ""), team_name or ""
-                    ),
-                }
-                
-                drivers_data.append(driver_data)
-            except Exception as e:
-                logger.warning(f"Error fetching driver {driver_code}: {e}")
-                continue
+        with span("extraction", season=year, event=event_name, session_type=session_type):
+            drivers_data = _drivers_from_session(session, year, session_type, event_name, filter_confirmed)
+        if drivers_data is None:
+            return []
         
         logger.info(
             f"Fetched {len(drivers_data)} drivers for season {year} from {event_name} {session_type}. "
@@ -424,115 +429,142 @@ def fetch_current_season_drivers(year: int = CURRENT_SEASON, filter_confirmed: b
         return []
 
 
+# Team name mappings - includes 2026 season teams
+TEAM_NAME_MAPPINGS = {
+    # Red Bull Racing
+    "Red Bull Racing": "Red Bull Racing",
+    "Red Bull Racing RBPT": "Red Bull Racing",
+    "Red Bull": "Red Bull Racing",
+    "Red Bull Racing Honda RBPT": "Red Bull Racing",
+    
+    # Ferrari
+    "Scuderia Ferrari": "Ferrari",
+    "Ferrari": "Ferrari",
+    
+    # Mercedes
+    "Mercedes": "Mercedes",
+    "Mercedes-AMG": "Mercedes",
+    "Mercedes-AMG Petronas": "Mercedes",
+    "Mercedes Petronas": "Mercedes",
+    
+    # McLaren
+    "McLaren": "McLaren",
+    "McLaren F1 Team": "McLaren",
+    "McLaren Mercedes": "McLaren",
+    
+    # Aston Martin
+    "Aston Martin": "Aston Martin",
+    "Aston Martin F1 Team": "Aston Martin",
+    "Aston Martin Aramco": "Aston Martin",
+    
+    # Alpine
+    "Alpine": "Alpine",
+    "Alpine F1 Team": "Alpine",
+    "Alpine Renault": "Alpine",
+    
+    # Williams
+    "Williams": "Williams",
+    "Williams Racing": "Williams",
+    "Williams Mercedes": "Williams",
+    
+    # Haas
+    "Haas": "Haas F1 Team",
+    "Haas F1 Team": "Haas F1 Team",
+    "Haas Ferrari": "Haas F1 Team",
+    
+    # Racing Bulls (formerly AlphaTauri)
+    "AlphaTauri": "Racing Bulls",
+    "RB": "Racing Bulls",
+    "Racing Bulls": "Racing Bulls",
+    "Visa Cash App RB": "Racing Bulls",
+    "Visa Cash App RB F1 Team": "Racing Bulls",
+    
+    # Sauber/Audi (2026)
+    "Sauber": "Audi",
+    "Stake F1 Team": "Audi",
+    "Kick Sauber": "Audi",
+    "Audi": "Audi",
+    "Audi F1 Team": "Audi",
+    "Sauber F1 Team": "Audi",
+    
+    # Cadillac (2026)
+    "Cadillac": "Cadillac",
+    "Cadillac F1 Team": "Cadillac",
+}
+
+# Case-insensitive lookup, built once
+_TEAM_NAME_MAPPINGS_CASEFOLD = {key.lower(): value for key, value in TEAM_NAME_MAPPINGS.items()}
+
+# Partial-match rules for names missing from TEAM_NAME_MAPPINGS, in priority order.
+# Each rule is a regex matched against the lowercased name; ".*x" is a substring
+# check and "x\Z" an exact match, so names spanning lines behave the same.
+TEAM_NAME_ALIAS_RULES = [
+    (r".*red bull", "Red Bull Racing"),
+    (r".*ferrari", "Ferrari"),
+    (r".*mercedes", "Mercedes"),
+    (r".*mclaren", "McLaren"),
+    (r".*aston martin", "Aston Martin"),
+    (r".*alpine", "Alpine"),
+    (r".*williams", "Williams"),
+    (r".*haas", "Haas F1 Team"),
+    (r".*racing bulls|rb\Z|.*alphatauri", "Racing Bulls"),
+    (r".*sauber|.*audi", "Audi"),
+    (r".*cadillac", "Cadillac"),
+]
+
+# All alias rules compiled into one regex: an ordered alternation of lookaheads
+# anchored at the start, so the first matching rule wins (not the leftmost hit)
+# and the named group of the winning branch identifies the canonical name.
+# DOTALL lets ".*" cross newlines, matching the substring checks it replaced.
+_TEAM_ALIAS_PATTERN = re.compile("|".join(
+    f"(?=(?:{pattern}))(?P<alias_{i}>)" for i, (pattern, _) in enumerate(TEAM_NAME_ALIAS_RULES)
+), re.DOTALL)
+_TEAM_ALIAS_CANONICAL = {f"alias_{i}": canonical for i, (_, canonical) in enumerate(TEAM_NAME_ALIAS_RULES)}
+
+TEAM_NATIONALITIES = {
+    "Ferrari": "Italian",
+    "Mercedes": "German",
+    "Red Bull Racing": "Austrian",
+    "McLaren": "British",
+    "Aston Martin": "British",
+    "Alpine": "French",
+    "Williams": "British",
+    "Haas F1 Team": "American",
+    "Racing Bulls": "Italian",
+    "Audi": "German",
+    "Cadillac": "American",
+}
+
+
+@lru_cache(maxsize=1024)
 def normalize_team_name(team_name: str) -> str:
     """
     Normalize team name to standard format.
     Maps various team name variations to canonical names.
+    Results are memoized, so each distinct raw name is resolved once per process.
     """
     if not team_name:
         return team_name
     
-    # Team name mappings - includes 2026 season teams
-    team_mappings = {
-        # Red Bull Racing
-        "Red Bull Racing": "Red Bull Racing",
-        "Red Bull Racing RBPT": "Red Bull Racing",
-        "Red Bull": "Red Bull Racing",
-        "Red Bull Racing Honda RBPT": "Red Bull Racing",
-        
-        # Ferrari
-        "Scuderia Ferrari": "Ferrari",
-        "Ferrari": "Ferrari",
-        
-        # Mercedes
-        "Mercedes": "Mercedes",
-        "Mercedes-AMG": "Mercedes",
-        "Mercedes-AMG Petronas": "Mercedes",
-        "Mercedes Petronas": "Mercedes",
-        
-        # McLaren
-        "McLaren": "McLaren",
-        "McLaren F1 Team": "McLaren",
-        "McLaren Mercedes": "McLaren",
-        
-        # Aston Martin
-        "Aston Martin": "Aston Martin",
-        "Aston Martin F1 Team": "Aston Martin",
-        "Aston Martin Aramco": "Aston Martin",
-        
-        # Alpine
-        "Alpine": "Alpine",
-        "Alpine F1 Team": "Alpine",
-        "Alpine Renault": "Alpine",
-        
-        # Williams
-        "Williams": "Williams",
-        "Williams Racing": "Williams",
-        "Williams Mercedes": "Williams",
-        
-        # Haas
-        "Haas": "Haas F1 Team",
-        "Haas F1 Team": "Haas F1 Team",
-        "Haas Ferrari": "Haas F1 Team",
-        
-        # Racing Bulls (formerly AlphaTauri)
-        "AlphaTauri": "Racing Bulls",
-        "RB": "Racing Bulls",
-        "Racing Bulls": "Racing Bulls",
-        "Visa Cash App RB": "Racing Bulls",
-        "Visa Cash App RB F1 Team": "Racing Bulls",
-        
-        # Sauber/Audi (2026)
-        "Sauber": "Audi",
-        "Stake F1 Team": "Audi",
-        "Kick Sauber": "Audi",
-        "Audi": "Audi",
-        "Audi F1 Team": "Audi",
-        "Sauber F1 Team": "Audi",
-        
-        # Cadillac (2026)
-        "Cadillac": "Cadillac",
-        "Cadillac F1 Team": "Cadillac",
-    }
-    
     # Try exact match first
-    if team_name in team_mappings:
-        return team_mappings[team_name]
+    if team_name in TEAM_NAME_MAPPINGS:
+        return TEAM_NAME_MAPPINGS[team_name]
     
     # Try case-insensitive match
     team_name_lower = team_name.lower()
-    for key, value in team_mappings.items():
-        if key.lower() == team_name_lower:
-            return value
+    if team_name_lower in _TEAM_NAME_MAPPINGS_CASEFOLD:
+        return _TEAM_NAME_MAPPINGS_CASEFOLD[team_name_lower]
     
     # Try partial match for common patterns
-    if "red bull" in team_name_lower:
-        return "Red Bull Racing"
-    if "ferrari" in team_name_lower:
-        return "Ferrari"
-    if "mercedes" in team_name_lower:
-        return "Mercedes"
-    if "mclaren" in team_name_lower:
-        return "McLaren"
-    if "aston martin" in team_name_lower:
-        return "Aston Martin"
-    if "alpine" in team_name_lower:
-        return "Alpine"
-    if "williams" in team_name_lower:
-        return "Williams"
-    if "haas" in team_name_lower:
-        return "Haas F1 Team"
-    if "racing bulls" in team_name_lower or "rb" == team_name_lower or "alphatauri" in team_name_lower:
-        return "Racing Bulls"
-    if "sauber" in team_name_lower or "audi" in team_name_lower:
-        return "Audi"
-    if "cadillac" in team_name_lower:
-        return "Cadillac"
+    match = _TEAM_ALIAS_PATTERN.match(team_name_lower)
+    if match:
+        return _TEAM_ALIAS_CANONICAL[match.lastgroup]
     
     # Return original if no mapping found
     return team_name
 
 
+@lru_cache(maxsize=1024)
 def normalize_constructor_id(team_name: str) -> str:
     """
     Normalize team name to constructor_id format (lowercase, spaces to underscores).
@@ -555,22 +587,38 @@ def get_team_nationality(team_name: str) -> str:
     Get nationality for a team based on team name.
     Returns country code or team name if unknown.
     """
-    team_nationalities = {
-        "Ferrari": "Italian",
-        "Mercedes": "German",
-        "Red Bull Racing": "Austrian",
-        "McLaren": "British",
-        "Aston Martin": "British",
-        "Alpine": "French",
-        "Williams": "British",
-        "Haas F1 Team": "American",
-        "Racing Bulls": "Italian",
-        "Audi": "German",
-        "Cadillac": "American",
-    }
-    
     normalized = normalize_team_name(team_name)
-    return team_nationalities.get(normalized, "Unknown")
+    return TEAM_NATIONALITIES.get(normalized, "Unknown")
+
+
+def _map_distinct(values: pd.Series, fn: Callable) -> pd.Series:
+    """Apply fn once per distinct non-null value and map the results back onto the column."""
+    distinct = values.dropna().unique()
+    lookup = pd.Series([fn(value) for value in distinct], index=distinct, dtype=object)
+    return values.map(lookup)
+
+
+def _records(frame: pd.DataFrame) -> list[dict]:
+    """Convert a DataFrame to a list of dicts with missing values as None."""
+    if frame.isna().to_numpy().any():
+        frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict('records')
+
+
+def _teams_from_names(team_names: pd.Series) -> list[dict]:
+    """
+    Build unique team records (constructor_id, name, nationality) from a column of raw team names.
+    Each distinct name is normalized once; the first occurrence of each constructor_id wins.
+    """
+    names = team_names.replace('', pd.NA).dropna().astype(str)
+    with span("normalization"):
+        normalized = _map_distinct(names, normalize_team_name)
+    teams = pd.DataFrame({
+        "constructor_id": _map_distinct(normalized, normalize_constructor_id),
+        "name": normalized,
+        "nationality": _map_distinct(normalized, get_team_nationality),
+    })
+    return _records(teams.drop_duplicates('constructor_id'))
 
 
 def fetch_current_season_teams(year: int = CURRENT_SEASON) -> list[dict]:
@@ -584,7 +632,7 @@ def fetch_current_season_teams(year: int = CURRENT_SEASON) -> list[dict]:
         logger.info(f"Fetching teams for season {year}")
         
         # Get schedule for the season
-        schedule = fastf1.get_event_schedule(year)
+        schedule = get_event_schedule(year)
         
         if schedule.empty:
             logger.warning(f"No events found for season {year}")
@@ -605,65 +653,27 @@ def fetch_current_season_teams(year: int = CURRENT_SEASON) -> list[dict]:
                 return fetch_current_season_teams(year - 1)
             return []
         
-        # Extract teams from session results
+        # Extract unique teams from session results
         teams_data = []
-        teams_seen = set()  # Track by normalized name to avoid duplicates
         
         try:
             if hasattr(session, 'results') and not session.results.empty:
-                # Get unique teams from results
-                for _, row in session.results.iterrows():
-                    team_name = row.get('TeamName', '')
-                    if not team_name:
-                        continue
-                    
-                    normalized_team = normalize_team_name(team_name)
-                    constructor_id = normalize_constructor_id(normalized_team)
-                    
-                    # Skip if we've already seen this constructor_id
-                    if constructor_id in teams_seen:
-                        continue
-                    
-                    teams_seen.add(constructor_id)
-                    
-                    nationality = get_team_nationality(normalized_team)
-                    
-                    teams_data.append({
-                        "constructor_id": constructor_id,
-                        "name": normalized_team,
-                        "nationality": nationality,
-                    })
-                
+                with span("extraction", season=year, event=event_name, session_type=session_type):
+                    teams_data = _teams_from_names(session.results['TeamName'])
                 logger.info(f"Extracted {len(teams_data)} teams from {event_name} {session_type}")
         except Exception as e:
             logger.warning(f"Could not extract teams from results: {e}")
         
-        # Fallback: extract from laps if results didn't work
+        # Fallback: recover team names from cheaper sources before loading laps
         if not teams_data:
-            try:
-                session.load(laps=True)
-                if hasattr(session, 'laps') and not session.laps.empty:
-                    unique_teams = session.laps['Team'].dropna().unique()
-                    for team_name in unique_teams:
-                        if not team_name:
-                            continue
-                        
-                        normalized_team = normalize_team_name(team_name)
-                        constructor_id = normalize_constructor_id(normalized_team)
-                        
-                        if constructor_id in teams_seen:
-                            continue
-                        
-                        teams_seen.add(constructor_id)
-                        nationality = get_team_nationality(normalized_team)
-                        
-                        teams_data.append({
-                            "constructor_id": constructor_id,
-                            "name": normalized_team,
-                            "nationality": nationality,
-                        })
-            except Exception as e:
-                logger.debug(f"Could not extract teams from laps: {e}")
+            codes = None
+            if hasattr(session, 'results') and 'Abbreviation' in session.results:
+                abbreviations = session.results['Abbreviation'].replace('', pd.NA).dropna()
+                codes = pd.Index(abbreviations.astype(str).str.strip().str.upper().unique()) if not abbreviations.empty else None
+            team_names = _fallback_team_names(session, year, event_name, session_type, codes)
+            if not team_names.empty:
+                with span("extraction", season=year, event=event_name, session_type=session_type, source="fallback"):
+                    teams_data = _teams_from_names(team_names)
         
         return teams_data
         
@@ -672,31 +682,72 @@ def fetch_current_season_teams(year: int = CURRENT_SEASON) -> list[dict]:
         return []
 
 
-def sync_teams(seasons: Optional[list[int]] = None, season: Optional[int] = None) -> dict:
+def _fetch_seasons(
+    fetch: Callable[[int], list[dict]],
+    seasons_to_sync: list[int],
+    parallel: bool,
+    on_season_done: Optional[Callable[[int], None]] = None,
+) -> list[tuple[int, list[dict]]]:
+    """
+    Fetch data for several seasons, optionally in parallel.
+    
+    Seasons are I/O-bound FastF1/Ergast work, so a bounded thread pool lets a
+    multi-season backfill take roughly as long as its slowest season. Results
+    are always returned in the order of seasons_to_sync, so callers can merge
+    them exactly as they would after a sequential fetch.
+    
+    Args:
+        fetch: Function fetching records for a single season
+        seasons_to_sync: Seasons to fetch
+        parallel: Whether to fetch seasons concurrently
+        on_season_done: Called with each season as soon as it has been fetched
+    
+    Returns:
+        List of (season, records) tuples in seasons_to_sync order
+    """
+    def fetch_one(season_year: int) -> list[dict]:
+        with span("season fetch", season=season_year):
+            records = fetch(season_year)
+        if on_season_done:
+            on_season_done(season_year)
+        return records
+    
+    if not parallel or len(seasons_to_sync) <= 1:
+        return [(season_year, fetch_one(season_year)) for season_year in seasons_to_sync]
+    
+    max_workers = max(1, min(SYNC_SEASON_WORKERS, len(seasons_to_sync)))
+    logger.info(f"Fetching {len(seasons_to_sync)} seasons with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="season-sync") as executor:
+        # Each season gets its own copy of the caller's context, keeping its spans in the caller's trace
+        futures = [executor.submit(bind_context(fetch_one), season_year) for season_year in seasons_to_sync]
+        return [(season_year, future.result()) for season_year, future in zip(seasons_to_sync, futures)]
+
+
+def sync_teams(
+    seasons: Optional[list[int]] = None,
+    season: Optional[int] = None,
+    parallel: bool = True,
+    on_season_done: Optional[Callable[[int], None]] = None,
+) -> dict:
     """
     Sync teams from FastF1 to database.
     
     Args:
         seasons: List of seasons to sync. If None and season is None, syncs only the current season.
         season: Single season to sync (takes precedence over seasons if provided).
+        parallel: Whether to fetch multiple seasons concurrently.
+        on_season_done: Optional progress callback, called with each fetched season.
     
     Returns:
         Dictionary with teams list and seasons_processed count.
     """
     # Determine which seasons to sync
-    if season is not None:
-        seasons_to_sync = [season]
-    elif seasons is None:
-        # Default: only current season (most common use case)
-        seasons_to_sync = [CURRENT_SEASON]
-    else:
-        seasons_to_sync = seasons
+    seasons_to_sync = resolve_seasons(seasons, season)
     
     all_teams = {}
     all_constructor_ids = set()  # Track by constructor_id to prevent duplicates across seasons
     
-    for season_year in seasons_to_sync:
-        teams = fetch_current_season_teams(season_year)
+    for season_year, teams in _fetch_seasons(fetch_current_season_teams, seasons_to_sync, parallel, on_season_done):
         for team in teams:
             constructor_id = team["constructor_id"]
             
@@ -721,7 +772,13 @@ def sync_teams(seasons: Optional[list[int]] = None, season: Optional[int] = None
     }
 
 
-def sync_drivers(seasons: Optional[list[int]] = None, season: Optional[int] = None, filter_confirmed: bool = True) -> dict:
+def sync_drivers(
+    seasons: Optional[list[int]] = None,
+    season: Optional[int] = None,
+    filter_confirmed: bool = True,
+    parallel: bool = True,
+    on_season_done: Optional[Callable[[int], None]] = None,
+) -> dict:
     """
     Sync drivers from FastF1 to database.
     
@@ -731,25 +788,27 @@ def sync_drivers(seasons: Optional[list[int]] = None, season: Optional[int] = No
                  To sync historical data, pass a list like list(range(2016, 2027)).
         season: Single season to sync (takes precedence over seasons if provided).
         filter_confirmed: Whether to filter to confirmed drivers for current/future seasons.
+        parallel: Whether to fetch multiple seasons concurrently.
+        on_season_done: Optional progress callback, called with each fetched season.
     
     Returns:
         Dictionary with drivers list and seasons_processed count.
     """
     # Determine which seasons to sync
-    if season is not None:
-        seasons_to_sync = [season]
-    elif seasons is None:
-        # Default: only current season (most common use case)
-        seasons_to_sync = [CURRENT_SEASON]
-    else:
-        seasons_to_sync = seasons
+    seasons_to_sync = resolve_seasons(seasons, season)
     
     all_drivers = {}
     all_driver_codes = set()  # Track by code to prevent duplicates across seasons
     
-    for season_year in seasons_to_sync:
-        # Only apply confirmed driver filtering for current/future seasons if requested
-        drivers = fetch_current_season_drivers(season_year, filter_confirmed=filter_confirmed)
+    # Only apply confirmed driver filtering for current/future seasons if requested
+    fetched = _fetch_seasons(
+        lambda season_year: fetch_current_season_drivers(season_year, filter_confirmed=filter_confirmed),
+        seasons_to_sync,
+        parallel,
+        on_season_done,
+    )
+    
+    for season_year, drivers in fetched:
         for driver in drivers:
             driver_id = driver["driver_id"]
             driver_code = driver.get("code", "").upper()
@@ -776,10 +835,492 @@ def sync_drivers(seasons: Optional[list[int]] = None, season: Optional[int] = No
     }
 
 
+# Driver/constructor columns carried on every race and qualifying result record
+RESULT_DRIVER_COLUMNS = [
+    "round", "code", "driver_id", "forename", "surname", "nationality", "permanent_number",
+    "team_name", "constructor_id", "ergast_driver_id", "ergast_constructor_id",
+]
+
+
+def _format_timedelta(values: pd.Series, prefix: str = "") -> pd.Series:
+    """Format timedeltas as Ergast-style strings ("1:31:44.742", "1:29.708", "+5.476")."""
+    millis = (values.dt.total_seconds() * 1000).round().astype('Int64')
+    
+    def fmt(ms) -> Optional[str]:
+        if pd.isna(ms):
+            return None
+        hours, rest = divmod(int(ms), 3_600_000)
+        minutes, rest = divmod(rest, 60_000)
+        seconds, millis_part = divmod(rest, 1000)
+        if hours:
+            return f"{prefix}{hours}:{minutes:02d}:{seconds:02d}.{millis_part:03d}"
+        if minutes:
+            return f"{prefix}{minutes}:{seconds:02d}.{millis_part:03d}"
+        return f"{prefix}{seconds}.{millis_part:03d}"
+    
+    return pd.Series([fmt(ms) for ms in millis], index=values.index, dtype=object)
+
+
+def _results_frame(
+    session: Session, year: int, round_number: int, event_name: str, session_type: str, columns: list[str]
+) -> pd.DataFrame:
+    """
+    Driver and constructor columns shared by race and qualifying results, one row per driver.
+    Team names missing from the results are recovered with the same fallbacks as driver extraction.
+    """
+    results = session.results.reindex(columns=[
+        'Abbreviation', 'DriverNumber', 'DriverId', 'FirstName', 'LastName', 'CountryCode', 'TeamName', 'TeamId',
+        *columns,
+    ])
+    codes = results['Abbreviation'].fillna('').astype(str).str.strip().str.upper()
+    keep = codes.str.len() == 3
+    results, codes = results[keep], codes[keep]
+    
+    teams = results['TeamName'].replace('', pd.NA)
+    if teams.isna().any():
+        teams = teams.fillna(codes.map(
+            _fallback_team_names(session, year, event_name, session_type, pd.Index(codes[teams.isna()]))
+        ))
+    with span("normalization"):
+        team_names = _map_distinct(teams, normalize_team_name)
+    
+    frame = pd.DataFrame({
+        "round": round_number,
+        "code": codes,
+        "driver_id": codes.str.lower(),
+        "forename": results['FirstName'].fillna(''),
+        "surname": results['LastName'].fillna(''),
+        "nationality": results['CountryCode'].fillna(''),
+        "permanent_number": pd.to_numeric(results['DriverNumber'], errors='coerce').astype('Int64'),
+        "team_name": team_names,
+        "constructor_id": _map_distinct(team_names, normalize_constructor_id),
+        # Ergast ids, for matching rows created by Ergast-based syncs
+        "ergast_driver_id": results['DriverId'].fillna(''),
+        "ergast_constructor_id": results['TeamId'].fillna(''),
+    })
+    return pd.concat([frame, results[columns]], axis=1)
+
+
+def _race_results(session: Session, year: int, round_number: int, event_name: str) -> list[dict]:
+    """Race classification, column-wise. FastF1 gives the winner's total time and the others' gaps."""
+    frame = _results_frame(
+        session, year, round_number, event_name, "R", ['Position', 'GridPosition', 'Laps', 'Status', 'Points', 'Time']
+    )
+    position = pd.to_numeric(frame['Position'], errors='coerce').astype('Int64')
+    gaps = pd.to_timedelta(frame['Time'])
+    is_winner = (position == 1).fillna(False).to_numpy()
+    winner_time = gaps[is_winner].iloc[0] if is_winner.any() else pd.NaT
+    total_time = gaps.where(is_winner, winner_time + gaps)
+    
+    return _records(pd.DataFrame({
+        **{column: frame[column] for column in RESULT_DRIVER_COLUMNS},
+        "position": position,
+        "points": pd.to_numeric(frame['Points'], errors='coerce').fillna(0.0),
+        "grid": pd.to_numeric(frame['GridPosition'], errors='coerce').astype('Int64'),
+        "laps": pd.to_numeric(frame['Laps'], errors='coerce').astype('Int64'),
+        "status": frame['Status'].fillna('').astype(str),
+        "time": _format_timedelta(gaps).where(is_winner, _format_timedelta(gaps, prefix="+")),
+        "milliseconds": (total_time.dt.total_seconds() * 1000).round().astype('Int64'),
+    }))
+
+
+def _qualifying_results(session: Session, year: int, round_number: int, event_name: str) -> list[dict]:
+    """Qualifying classification with Q1-Q3 lap times, column-wise."""
+    frame = _results_frame(session, year, round_number, event_name, "Q", ['Position', 'Q1', 'Q2', 'Q3'])
+    frame = frame[pd.to_numeric(frame['Position'], errors='coerce').notna()]
+    
+    return _records(pd.DataFrame({
+        **{column: frame[column] for column in RESULT_DRIVER_COLUMNS},
+        "position": pd.to_numeric(frame['Position']).astype(int),
+        "q1": _format_timedelta(pd.to_timedelta(frame['Q1'])),
+        "q2": _format_timedelta(pd.to_timedelta(frame['Q2'])),
+        "q3": _format_timedelta(pd.to_timedelta(frame['Q3'])),
+    }))
+
+
+def _started_events(schedule: pd.DataFrame, rounds: Optional[list[int]] = None) -> list[pd.Series]:
+    """Championship events of a schedule that have started, skipping testing (round 0), optionally only the given rounds."""
+    selected = (schedule["RoundNumber"] > 0) & (pd.to_datetime(schedule["EventDate"]) <= pd.Timestamp(datetime.now()))
+    if rounds is not None:
+        selected &= schedule["RoundNumber"].isin(rounds)
+    return [event for _, event in schedule[selected].iterrows()]
+
+
+def _map_events(year: int, events: list[pd.Series], fetch_one: Callable[[pd.Series], dict], parallel: bool) -> list[dict]:
+    """
+    Run fetch_one for each event, concurrently on a bounded thread pool when parallel.
+    Event work is dominated by I/O-bound session loads; results come back in schedule order.
+    """
+    if not parallel or len(events) <= 1:
+        return [fetch_one(event) for event in events]
+    
+    max_workers = max(1, min(SYNC_EVENT_WORKERS, len(events)))
+    logger.info(f"Fetching {len(events)} events of {year} with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="event-sync") as executor:
+        futures = [executor.submit(bind_context(fetch_one), event) for event in events]
+        return [future.result() for future in futures]
+
+
+def _fetch_event_results(year: int, event: pd.Series) -> dict:
+    """
+    Load an event's race and qualifying sessions (once each, through the session cache)
+    and extract their results.
+    """
+    round_number = int(event["RoundNumber"])
+    event_name = event["EventName"]
+    location = str(event.get("Location") or event_name)
+    event_results = {
+        "race": {
+            "round": round_number,
+            "race_name": event_name,
+            "circuit_id": re.sub(r"[^a-z0-9]+", "_", location.lower()).strip("_"),
+            "circuit_name": location,
+            "location": location,
+            "country": str(event.get("Country") or ""),
+            "date": pd.Timestamp(event["EventDate"]).to_pydatetime(),
+        },
+        "race_results": [],
+        "qualifying_results": [],
+        "errors": [],
+    }
+    
+    for session_type, key, extract in (
+        ("R", "race_results", _race_results),
+        ("Q", "qualifying_results", _qualifying_results),
+    ):
+        try:
+            session = load_session(year, event_name, session_type)
+            if hasattr(session, 'results') and not session.results.empty:
+                with span("extraction", season=year, event=event_name, session_type=session_type):
+                    event_results[key] = extract(session, year, round_number, event_name)
+        except Exception as e:
+            logger.warning(f"Could not extract {session_type} results for {year} {event_name}: {e}")
+            event_results["errors"].append(f"{event_name} {session_type}: {str(e)}")
+    return event_results
+
+
+def fetch_season_results(
+    year: int,
+    parallel: bool = True,
+    on_event_done: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """
+    Fetch race and qualifying results for every completed event of a season.
+    
+    Events are fetched concurrently on a bounded thread pool; results come
+    back in schedule order.
+    
+    Args:
+        year: Season to fetch
+        parallel: Whether to fetch events concurrently
+        on_event_done: Called with each event name once its sessions are extracted
+    
+    Returns:
+        Dict with races, race_results, qualifying_results and errors
+    """
+    logger.info(f"Fetching race and qualifying results for season {year}")
+    
+    schedule = get_event_schedule(year)
+    if schedule.empty:
+        logger.warning(f"No events found for season {year}")
+        return {"races": [], "race_results": [], "qualifying_results": [], "errors": []}
+    
+    def fetch_one(event: pd.Series) -> dict:
+        with span("event fetch", season=year, event=event["EventName"]):
+            event_results = _fetch_event_results(year, event)
+        if on_event_done:
+            on_event_done(event["EventName"])
+        return event_results
+    
+    fetched = _map_events(year, _started_events(schedule), fetch_one, parallel)
+    # Errors of every event, including those whose sessions all failed
+    errors = [error for event in fetched for error in event["errors"]]
+    
+    # Events without any results (e.g. cancelled or not yet published) get no race row
+    fetched = [event for event in fetched if event["race_results"] or event["qualifying_results"]]
+    result = {
+        "races": [event["race"] for event in fetched],
+        "race_results": [row for event in fetched for row in event["race_results"]],
+        "qualifying_results": [row for event in fetched for row in event["qualifying_results"]],
+        "errors": errors,
+    }
+    logger.info(
+        f"Fetched {len(result['race_results'])} race and {len(result['qualifying_results'])} "
+        f"qualifying results from {len(result['races'])} events of {year}"
+    )
+    return result
+
+
+# FastF1 lap columns read by the lap store; others (telemetry-derived speeds,
+# dates) are not stored
+FASTF1_LAP_COLUMNS = [
+    'Driver', 'DriverNumber', 'Team', 'LapNumber', 'Stint', 'LapTime',
+    'Sector1Time', 'Sector2Time', 'Sector3Time', 'LapStartTime', 'Time',
+    'Compound', 'TyreLife', 'FreshTyre', 'PitInTime', 'PitOutTime',
+    'TrackStatus', 'Position', 'IsAccurate', 'IsPersonalBest', 'Deleted',
+]
+
+
+def _milliseconds(values: pd.Series) -> pd.Series:
+    """Timedeltas as nullable int32 milliseconds."""
+    return (pd.to_timedelta(values).dt.total_seconds() * 1000).round().astype('Int32')
+
+
+def _flags(values: pd.Series) -> pd.Series:
+    """Nullable booleans with missing values as False."""
+    return values.astype('boolean').fillna(False).astype(bool)
+
+
+def _lap_frame(laps: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact, column-wise copy of FastF1 laps in the lap store's schema.
+    Team names are normalized like synced drivers and constructors.
+    """
+    laps = laps.reindex(columns=FASTF1_LAP_COLUMNS)
+    with span("normalization"):
+        teams = _map_distinct(laps['Team'].replace('', pd.NA), normalize_team_name)
+    
+    def number(column: str, dtype: str) -> pd.Series:
+        return pd.to_numeric(laps[column], errors='coerce').round().astype(dtype)
+    
+    return pd.DataFrame({
+        "driver": laps['Driver'].astype(str).str.upper().astype('category'),
+        "driver_number": laps['DriverNumber'].astype(str).astype('category'),
+        "team": teams.astype('category'),
+        "lap_number": number('LapNumber', 'Int16'),
+        "stint": number('Stint', 'Int8'),
+        "lap_time_ms": _milliseconds(laps['LapTime']),
+        "sector1_ms": _milliseconds(laps['Sector1Time']),
+        "sector2_ms": _milliseconds(laps['Sector2Time']),
+        "sector3_ms": _milliseconds(laps['Sector3Time']),
+        "lap_start_ms": _milliseconds(laps['LapStartTime']),
+        "session_time_ms": _milliseconds(laps['Time']),
+        "compound": laps['Compound'].astype('category'),
+        "tyre_life": number('TyreLife', 'Int16'),
+        "fresh_tyre": _flags(laps['FreshTyre']),
+        "pit_in": laps['PitInTime'].notna(),
+        "pit_out": laps['PitOutTime'].notna(),
+        "track_status": laps['TrackStatus'].astype('string').astype('category'),
+        "position": number('Position', 'Int8'),
+        "is_accurate": _flags(laps['IsAccurate']),
+        "is_personal_best": _flags(laps['IsPersonalBest']),
+        "deleted": _flags(laps['Deleted']),
+    })
+
+
+def _round_number(year: int, event_name: str) -> Optional[int]:
+    """Round number of an event in the season's schedule."""
+    schedule = get_event_schedule(year)
+    rounds = schedule.loc[schedule["EventName"] == event_name, "RoundNumber"]
+    return int(rounds.iloc[0]) if not rounds.empty else None
+
+
+def store_session_laps(session: Session, year: int, round_number: int, event_name: str, session_type: str) -> int:
+    """
+    Write a session's loaded laps to the lap store.
+    
+    Returns:
+        Number of laps stored (0 if the session has none)
+    """
+    laps = session.laps if hasattr(session, 'laps') else None
+    if laps is None or laps.empty:
+        return 0
+    with span("extraction", season=year, event=event_name, session_type=session_type):
+        frame = _lap_frame(laps)
+    return lap_store.write(year, round_number, session_type, frame, {"event": event_name, "session_type": session_type})
+
+
+def _ingest_event_laps(year: int, event: pd.Series, session_types: list[str], refresh: bool) -> dict:
+    """
+    Load and store the laps of an event's sessions that are not stored yet (or all, with refresh).
+    Sessions that failed or had no laps are marked, and not retried until the lap store's retry time passes.
+    """
+    round_number = int(event["RoundNumber"])
+    event_name = event["EventName"]
+    ingested = {"sessions": 0, "laps": 0, "skipped": 0, "errors": []}
+    
+    for session_type in session_types:
+        if not refresh and lap_store.has(year, round_number, session_type):
+            CACHE_REQUESTS.labels(cache="laps", result="hit").inc()
+            ingested["skipped"] += 1
+            continue
+        if not refresh and lap_store.recently_failed(year, round_number, session_type):
+            ingested["errors"].append(f"{event_name} {session_type}: failed recently, not retried yet")
+            continue
+        CACHE_REQUESTS.labels(cache="laps", result="miss").inc()
+        try:
+            session = load_session_laps(year, event_name, session_type)
+            rows = store_session_laps(session, year, round_number, event_name, session_type)
+        except Exception as e:
+            logger.warning(f"Could not ingest {session_type} laps for {year} {event_name}: {e}")
+            ingested["errors"].append(f"{event_name} {session_type}: {str(e)}")
+            lap_store.mark_failed(year, round_number, session_type, str(e))
+            continue
+        if rows:
+            ingested["sessions"] += 1
+            ingested["laps"] += rows
+        else:
+            lap_store.mark_failed(year, round_number, session_type, "no laps")
+    return ingested
+
+
+def ingest_season_laps(
+    year: int,
+    session_types: Optional[list[str]] = None,
+    parallel: bool = True,
+    refresh: bool = False,
+    on_event_done: Optional[Callable[[str], None]] = None,
+    rounds: Optional[list[int]] = None,
+) -> dict:
+    """
+    Load the laps of every started event of a season and write them to the lap store.
+    
+    Sessions already in the store are skipped unless refresh is set, so
+    re-running an ingest only loads new events. Sessions that recently failed
+    to load are skipped too, unless refresh is set.
+    
+    Args:
+        year: Season to ingest
+        session_types: Session types to ingest (default: race only)
+        parallel: Whether to load events concurrently
+        refresh: Reload and rewrite sessions that are already stored or recently failed
+        on_event_done: Called with each event name once its sessions are stored
+        rounds: Only ingest these rounds (all started rounds if None)
+    
+    Returns:
+        Dict with sessions and laps written, sessions skipped and errors
+    """
+    session_types = session_types or ["R"]
+    logger.info(f"Ingesting {', '.join(session_types)} laps for season {year}")
+    
+    schedule = get_event_schedule(year)
+    
+    def ingest_one(event: pd.Series) -> dict:
+        with span("event fetch", season=year, event=event["EventName"]):
+            ingested = _ingest_event_laps(year, event, session_types, refresh)
+        if on_event_done:
+            on_event_done(event["EventName"])
+        return ingested
+    
+    events = _started_events(schedule, rounds) if not schedule.empty else []
+    ingested = _map_events(year, events, ingest_one, parallel)
+    result = {
+        "sessions": sum(event["sessions"] for event in ingested),
+        "laps": sum(event["laps"] for event in ingested),
+        "skipped": sum(event["skipped"] for event in ingested),
+        "errors": [error for event in ingested for error in event["errors"]],
+    }
+    logger.info(
+        f"Stored {result['laps']} laps from {result['sessions']} sessions of {year} "
+        f"({result['skipped']} already stored)"
+    )
+    return result
+
+
+def _concat_standings_rounds(results) -> pd.DataFrame:
+    """
+    Concatenate per-round Ergast standings frames into one frame with a 'round' column.
+    
+    Args:
+        results: Ergast multi-response (description has one row per round, content one
+            DataFrame per round), or a list of them, e.g. one response per round
+    """
+    if not isinstance(results, (list, tuple)):
+        results = [results]
+    frames = []
+    rounds = []
+    for result in results:
+        for round_number, df in zip(result.description['round'].astype(int).to_numpy(), result.content):
+            if not df.empty:
+                frames.append(df)
+                rounds.append(np.full(len(df), round_number))
+    if not frames:
+        return pd.DataFrame()
+    combined = pd.concat(frames, ignore_index=True)
+    combined['round'] = np.concatenate(rounds)
+    return combined
+
+
+def fetch_standings_rounds(get_standings: Callable, season: int) -> list:
+    """
+    Ergast standings after every round of a season.
+    
+    Without a round Ergast only returns the standings after the latest round,
+    so that response gives the round count and each earlier round is fetched
+    with its own request.
+    
+    Args:
+        get_standings: Ergast.get_driver_standings or Ergast.get_constructor_standings
+        season: The season year
+    
+    Returns:
+        Ergast responses ordered by round (empty if the season has no standings)
+    """
+    latest = get_standings(season=season)
+    if latest is None or not hasattr(latest, 'content') or not hasattr(latest, 'description') or latest.description.empty:
+        return []
+    last_round = int(latest.description['round'].astype(int).max())
+    earlier = [get_standings(season=season, round=round_number) for round_number in range(1, last_round)]
+    return [result for result in earlier if result is not None and hasattr(result, 'content')] + [latest]
+
+
+def driver_standings_records(result, season: int) -> list[dict]:
+    """
+    Convert an Ergast driver standings response into standings records.
+    
+    Args:
+        result: Ergast multi-response (description has season/round info,
+            content is a list of DataFrames, one per round), or a list of them
+        season: The season year the standings belong to
+    """
+    combined = _concat_standings_rounds(result)
+    if combined.empty:
+        return []
+    
+    return _records(pd.DataFrame({
+        "season": season,
+        "round": combined['round'].astype(int),
+        # Normalize driver_id to lowercase to match database format
+        "driver_id": combined['driverId'].astype(str).str.lower(),
+        "position": combined['position'].astype(int),
+        "points": combined['points'].astype(float),
+        "wins": combined['wins'].astype(int),
+    }))
+
+
+def constructor_standings_records(result, season: int) -> list[dict]:
+    """
+    Convert an Ergast constructor standings response into standings records.
+    
+    Args:
+        result: Ergast multi-response (description has season/round info,
+            content is a list of DataFrames, one per round), or a list of them
+        season: The season year the standings belong to
+    """
+    combined = _concat_standings_rounds(result)
+    if combined.empty:
+        return []
+    
+    # Normalize constructor_id to match database format
+    # Use the constructorName field to get the team name
+    name_column = 'constructorName' if 'constructorName' in combined else 'constructorId'
+    constructor_names = combined[name_column].astype(str)
+    
+    return _records(pd.DataFrame({
+        "season": season,
+        "round": combined['round'].astype(int),
+        "constructor_id": _map_distinct(constructor_names, normalize_constructor_id),
+        "position": combined['position'].astype(int),
+        "points": combined['points'].astype(float),
+        "wins": combined['wins'].astype(int),
+    }))
+
+
 def fetch_driver_standings(season: int) -> list[dict]:
     """
     Fetch driver championship standings for a season from Ergast API.
     Returns historical standings after each race.
+    Responses are kept in the persistent Ergast cache; only the current season is refetched.
     
     Args:
         season: The season year to fetch standings for
@@ -789,36 +1330,18 @@ def fetch_driver_standings(season: int) -> list[dict]:
     """
     logger.info(f"Fetching driver standings from Ergast for season {season}")
     
-    try:
-        ergast = Ergast()
-        result = ergast.get_driver_standings(season=season)
+    def fetch() -> list[dict]:
+        fastf1_cache.get()
+        results = fetch_standings_rounds(ergast_client.get().get_driver_standings, season)
         
-        if result is None or not hasattr(result, 'content') or not hasattr(result, 'description'):
+        if not results:
             logger.warning(f"No driver standings data available for season {season}")
             return []
         
-        standings_data = []
-        
-        # result.description has season/round info
-        # result.content is list of DataFrames, one per round
-        for i, standings_df in enumerate(result.content):
-            if standings_df.empty:
-                continue
-                
-            round_num = int(result.description.iloc[i]['round'])
-            
-            for _, row in standings_df.iterrows():
-                # Normalize driver_id to lowercase to match database format
-                driver_id = str(row['driverId']).lower()
-                
-                standings_data.append({
-                    "season": season,
-                    "round": round_num,
-                    "driver_id": driver_id,
-                    "position": int(row['position']),
-                    "points": float(row['points']),
-                    "wins": int(row['wins']),
-                })
+        return driver_standings_records(results, season)
+    
+    try:
+        standings_data = ergast_cache.get_or_fetch("driver_standings", season, fetch)
         
         logger.info(f"Fetched {len(standings_data)} driver standing records for season {season}")
         return standings_data
@@ -832,6 +1355,7 @@ def fetch_constructor_standings(season: int) -> list[dict]:
     """
     Fetch constructor championship standings for a season from Ergast API.
     Returns historical standings after each race.
+    Responses are kept in the persistent Ergast cache; only the current season is refetched.
     
     Args:
         season: The season year to fetch standings for
@@ -841,36 +1365,18 @@ def fetch_constructor_standings(season: int) -> list[dict]:
     """
     logger.info(f"Fetching constructor standings from Ergast for season {season}")
     
-    try:
-        ergast = Ergast()
-        result = ergast.get_constructor_standings(season=season)
+    def fetch() -> list[dict]:
+        fastf1_cache.get()
+        results = fetch_standings_rounds(ergast_client.get().get_constructor_standings, season)
         
-        if result is None or not hasattr(result, 'content') or not hasattr(result, 'description'):
+        if not results:
             logger.warning(f"No constructor standings data available for season {season}")
             return []
         
-        standings_data = []
-        
-        for i, standings_df in enumerate(result.content):
-            if standings_df.empty:
-                continue
-                
-            round_num = int(result.description.iloc[i]['round'])
-            
-            for _, row in standings_df.iterrows():
-                # Normalize constructor_id to match database format
-                # Use the constructorName field to get the team name
-                constructor_name = str(row.get('constructorName', row.get('constructorId', '')))
-                constructor_id = normalize_constructor_id(constructor_name)
-                
-                standings_data.append({
-                    "season": season,
-                    "round": round_num,
-                    "constructor_id": constructor_id,
-                    "position": int(row['position']),
-                    "points": float(row['points']),
-                    "wins": int(row['wins']),
-                })
+        return constructor_standings_records(results, season)
+    
+    try:
+        standings_data = ergast_cache.get_or_fetch("constructor_standings", season, fetch)
         
         logger.info(f"Fetched {len(standings_data)} constructor standing records for season {season}")
         return standings_data
@@ -880,14 +1386,144 @@ def fetch_constructor_standings(season: int) -> list[dict]:
         raise
 
 
-def calculate_driver_standings_from_results(db_session, season: int) -> list[dict]:
+# Cumulative standings for every round of a season in one pass. A dense
+# (round x entity) grid starting at each entity's first scored round lets the
+# window sums carry totals through rounds an entity did not score in.
+# An optional baseline (totals after :after_round) supports incremental mode.
+# race_results reference drivers/constructors by surrogate id; entities are
+# keyed by their source driver_id / constructor_id, as in the Ergast path.
+STANDINGS_WINDOW_QUERY = """
+    WITH season_rounds AS (
+        SELECT DISTINCT round
+        FROM races
+        WHERE season = :season AND round > :after_round
+    ),
+    per_round AS (
+        SELECT
+            r.round,
+            src.{entity_column} AS entity_id,
+            COALESCE(SUM(rr.points), 0) AS points,
+            COUNT(CASE WHEN rr.position = 1 THEN 1 END) AS wins
+        FROM race_results rr
+        JOIN races r ON rr.race_id = r.id
+        JOIN {entity_table} src ON rr.{entity_column} = src.id
+        WHERE r.season = :season AND r.round > :after_round
+        GROUP BY r.round, src.{entity_column}
+    ),
+    baseline AS (
+        SELECT *
+        FROM jsonb_to_recordset(CAST(:baseline AS jsonb))
+            AS b(entity_id text, points double precision, wins integer)
+    ),
+    entities AS (
+        SELECT entity_id, MIN(first_round) AS first_round
+        FROM (
+            SELECT entity_id, :after_round AS first_round FROM baseline
+            UNION ALL
+            SELECT entity_id, MIN(round) AS first_round FROM per_round GROUP BY entity_id
+        ) e
+        GROUP BY entity_id
+    ),
+    cumulative AS (
+        SELECT
+            sr.round,
+            e.entity_id,
+            COALESCE(b.points, 0) + SUM(COALESCE(p.points, 0)) OVER w AS points,
+            COALESCE(b.wins, 0) + SUM(COALESCE(p.wins, 0)) OVER w AS wins
+        FROM season_rounds sr
+        JOIN entities e ON sr.round >= e.first_round
+        LEFT JOIN per_round p ON p.round = sr.round AND p.entity_id = e.entity_id
+        LEFT JOIN baseline b ON b.entity_id = e.entity_id
+        WINDOW w AS (
+            PARTITION BY e.entity_id ORDER BY sr.round
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+        )
+    )
+    SELECT
+        round,
+        entity_id,
+        points,
+        wins,
+        RANK() OVER (PARTITION BY round ORDER BY points DESC, wins DESC) AS position
+    FROM cumulative
+    ORDER BY round ASC, position ASC, entity_id ASC
+"""
+
+
+def _calculate_standings_from_results(
+    db_session,
+    season: int,
+    entity_table: str,
+    entity_column: str,
+    id_key: str,
+    previous_standings: Optional[list[dict]] = None,
+) -> list[dict]:
+    """
+    Calculate cumulative standings for every round of a season with a single query.
+    
+    Args:
+        db_session: SQLAlchemy database session
+        season: The season year to calculate standings for
+        entity_table: Table race_results references ("drivers" or "constructors")
+        entity_column: race_results column referencing it, and the source id column
+            of that table ("driver_id" or "constructor_id")
+        id_key: Key used for the entity id in the returned dicts
+        previous_standings: Previously stored standings for this season. When given,
+            only rounds after the latest stored round are computed, on top of the
+            totals stored for that round.
+    
+    Returns:
+        List of standings dicts for each computed round
+    """
+    from sqlalchemy import text
+    import json
+    
+    after_round = 0
+    baseline = []
+    stored = [row for row in previous_standings or [] if row["season"] == season]
+    if stored:
+        after_round = max(int(row["round"]) for row in stored)
+        baseline = [
+            {"entity_id": row[id_key], "points": float(row["points"]), "wins": int(row["wins"])}
+            for row in stored
+            if int(row["round"]) == after_round
+        ]
+        logger.info(f"Incremental standings for season {season}: computing rounds after {after_round}")
+    
+    query = text(STANDINGS_WINDOW_QUERY.format(entity_table=entity_table, entity_column=entity_column))
+    result = db_session.execute(query, {
+        "season": season,
+        "after_round": after_round,
+        "baseline": json.dumps(baseline),
+    })
+    
+    return [
+        {
+            "season": season,
+            "round": int(row[0]),
+            id_key: row[1],
+            "position": int(row[4]),
+            "points": float(row[2]),
+            "wins": int(row[3]),
+        }
+        for row in result.fetchall()
+    ]
+
+
+def calculate_driver_standings_from_results(
+    db_session,
+    season: int,
+    previous_standings: Optional[list[dict]] = None,
+) -> list[dict]:
     """
     Calculate driver standings from race results when Ergast data unavailable.
-    Queries race results from database, groups by driver, sums points, counts wins.
+    Computes cumulative points, wins and RANK() positions for every round in one query.
     
     Args:
         db_session: SQLAlchemy database session
         season: The season year to calculate standings for
+        previous_standings: Previously stored driver standings for the season; if given,
+            only newly added rounds are calculated
         
     Returns:
         List of dicts with calculated driver standings data for each round
@@ -895,60 +1531,11 @@ def calculate_driver_standings_from_results(db_session, season: int) -> list[dic
     logger.info(f"Calculating driver standings from race results for season {season}")
     
     try:
-        from sqlalchemy import text
-        
-        # Query to get race results and calculate standings per round
-        # We need to get all races for the season, then calculate cumulative standings after each round
-        races_query = text("""
-            SELECT DISTINCT round 
-            FROM races 
-            WHERE season = :season 
-            ORDER BY round ASC
-        """)
-        races_result = db_session.execute(races_query, {"season": season})
-        rounds = [row[0] for row in races_result.fetchall()]
-        
-        if not rounds:
-            logger.warning(f"No races found for season {season}")
-            return []
-        
-        standings_data = []
-        
-        # Calculate standings after each round
-        for round_num in rounds:
-            # Get cumulative points and wins for each driver up to this round
-            query = text("""
-                SELECT 
-                    rr.driver_id,
-                    COALESCE(SUM(rr.points), 0) as total_points,
-                    COUNT(CASE WHEN rr.position = 1 THEN 1 END) as total_wins
-                FROM race_results rr
-                JOIN races r ON rr.race_id = r.id
-                WHERE r.season = :season AND r.round <= :round
-                GROUP BY rr.driver_id
-                ORDER BY total_points DESC, total_wins DESC
-            """)
-            
-            result = db_session.execute(query, {"season": season, "round": round_num})
-            rows = result.fetchall()
-            
-            if not rows:
-                continue
-            
-            # Assign positions based on sorted order
-            for position, row in enumerate(rows, start=1):
-                driver_id = row[0]
-                points = float(row[1])
-                wins = int(row[2])
-                
-                standings_data.append({
-                    "season": season,
-                    "round": round_num,
-                    "driver_id": driver_id,
-                    "position": position,
-                    "points": points,
-                    "wins": wins,
-                })
+        standings_data = _calculate_standings_from_results(
+            db_session, season, "drivers", "driver_id", "driver_id", previous_standings
+        )
+        if not standings_data:
+            logger.warning(f"No race results found for season {season}")
         
         logger.info(f"Calculated {len(standings_data)} driver standing records for season {season}")
         return standings_data
@@ -958,14 +1545,20 @@ def calculate_driver_standings_from_results(db_session, season: int) -> list[dic
         raise
 
 
-def calculate_constructor_standings_from_results(db_session, season: int) -> list[dict]:
+def calculate_constructor_standings_from_results(
+    db_session,
+    season: int,
+    previous_standings: Optional[list[dict]] = None,
+) -> list[dict]:
     """
     Calculate constructor standings from race results when Ergast data unavailable.
-    Queries race results from database, groups by constructor, sums points, counts wins.
+    Computes cumulative points, wins and RANK() positions for every round in one query.
     
     Args:
         db_session: SQLAlchemy database session
         season: The season year to calculate standings for
+        previous_standings: Previously stored constructor standings for the season; if given,
+            only newly added rounds are calculated
         
     Returns:
         List of dicts with calculated constructor standings data for each round
@@ -973,60 +1566,11 @@ def calculate_constructor_standings_from_results(db_session, season: int) -> lis
     logger.info(f"Calculating constructor standings from race results for season {season}")
     
     try:
-        from sqlalchemy import text
-        
-        # Query to get race results and calculate standings per round
-        # We need to get all races for the season, then calculate cumulative standings after each round
-        races_query = text("""
-            SELECT DISTINCT round 
-            FROM races 
-            WHERE season = :season 
-            ORDER BY round ASC
-        """)
-        races_result = db_session.execute(races_query, {"season": season})
-        rounds = [row[0] for row in races_result.fetchall()]
-        
-        if not rounds:
-            logger.warning(f"No races found for season {season}")
-            return []
-        
-        standings_data = []
-        
-        # Calculate standings after each round
-        for round_num in rounds:
-            # Get cumulative points and wins for each constructor up to this round
-            query = text("""
-                SELECT 
-                    rr.constructor_id,
-                    COALESCE(SUM(rr.points), 0) as total_points,
-                    COUNT(CASE WHEN rr.position = 1 THEN 1 END) as total_wins
-                FROM race_results rr
-                JOIN races r ON rr.race_id = r.id
-                WHERE r.season = :season AND r.round <= :round
-                GROUP BY rr.constructor_id
-                ORDER BY total_points DESC, total_wins DESC
-            """)
-            
-            result = db_session.execute(query, {"season": season, "round": round_num})
-            rows = result.fetchall()
-            
-            if not rows:
-                continue
-            
-            # Assign positions based on sorted order
-            for position, row in enumerate(rows, start=1):
-                constructor_id = row[0]
-                points = float(row[1])
-                wins = int(row[2])
-                
-                standings_data.append({
-                    "season": season,
-                    "round": round_num,
-                    "constructor_id": constructor_id,
-                    "position": position,
-                    "points": points,
-                    "wins": wins,
-                })
+        standings_data = _calculate_standings_from_results(
+            db_session, season, "constructors", "constructor_id", "constructor_id", previous_standings
+        )
+        if not standings_data:
+            logger.warning(f"No race results found for season {season}")
         
         logger.info(f"Calculated {len(standings_data)} constructor standing records for season {season}")
         return standings_data
@@ -1036,11 +1580,37 @@ def calculate_constructor_standings_from_results(db_session, season: int) -> lis
         raise
 
 
+def _snapshot_source(year: int) -> dict:
+    """The session a season's records were extracted from, as found by session discovery."""
+    _, session_type, event_name = discovery_cache.peek(year) or (None, None, None)
+    return {"season": year, "event": event_name, "session_type": session_type}
+
+
+def _season_drivers_snapshot(season: int) -> list[dict]:
+    """All drivers of a season (unfiltered), served from the snapshot store for completed seasons."""
+    def build() -> tuple[list[dict], dict]:
+        drivers = fetch_current_season_drivers(season, filter_confirmed=False)
+        return drivers, _snapshot_source(season)
+    
+    return season_snapshots.get_or_build(season, "drivers", build)
+
+
+def _season_teams_snapshot(season: int) -> list[dict]:
+    """All teams of a season, served from the snapshot store for completed seasons."""
+    def build() -> tuple[list[dict], dict]:
+        teams = fetch_current_season_teams(season)
+        return teams, _snapshot_source(season)
+    
+    return season_snapshots.get_or_build(season, "teams", build)
+
+
 def get_season_driver_lineup(season: int) -> list[dict]:
     """
     Get driver lineup for a season with team information.
     Returns list of dicts with: season, driver_id, team_name, driver_number
     
+    Completed seasons are read from their snapshot; only the current season is re-extracted.
+    
     Args:
         season: The season year to get lineup for
         
@@ -1050,7 +1620,7 @@ def get_season_driver_lineup(season: int) -> list[dict]:
     logger.info(f"Getting driver lineup for season {season}")
     
     try:
-        drivers = fetch_current_season_drivers(season, filter_confirmed=False)
+        drivers = _season_drivers_snapshot(season)
         
         lineup_data = []
         for driver in drivers:
@@ -1074,6 +1644,8 @@ def get_season_constructor_lineup(season: int) -> list[dict]:
     Get constructor lineup for a season.
     Returns list of dicts with: season, constructor_id
     
+    Completed seasons are read from their snapshot; only the current season is re-extracted.
+    
     Args:
         season: The season year to get lineup for
         
@@ -1083,7 +1655,7 @@ def get_season_constructor_lineup(season: int) -> list[dict]:
     logger.info(f"Getting constructor lineup for season {season}")
     
     try:
-        teams = fetch_current_season_teams(season)
+        teams = _season_teams_snapshot(season)
         
         lineup_data = []
         for team in teams:
@@ -0,0 +1,176 @@
+"""Background job manager for long-running sync operations."""
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+from app.config import JOB_HISTORY_SIZE, JOB_WORKERS
+from app.services.single_flight import SingleFlight, sync_flights
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class Job:
+    """A single background sync with its status and progress counters."""
+
+    def __init__(self, kind: str, key: str, params: dict, seasons_total: int):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.params = params
+        self.status = JOB_QUEUED
+        self.seasons_total = seasons_total
+        self.seasons_done = 0
+        self.rows_written = 0
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def season_done(self, season: int) -> None:
+        """Progress callback: one more season has been fetched."""
+        with self._lock:
+            self.seasons_done += 1
+        logger.debug(f"Job {self.id}: season {season} done ({self.seasons_done}/{self.seasons_total})")
+
+    def add_rows(self, count: int) -> None:
+        """Progress callback: rows written to the database."""
+        with self._lock:
+            self.rows_written += count
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    def to_dict(self) -> dict:
+        """Snapshot of the job for API responses."""
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "params": self.params,
+                "progress": {
+                    "seasons_total": self.seasons_total,
+                    "seasons_done": self.seasons_done,
+                    "rows_written": self.rows_written,
+                },
+                "result": self.result,
+                "error": self.error,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobManager:
+    """
+    Runs jobs as tasks on the event loop, at most max_workers at a time.
+
+    Jobs run the same async sync steps as the request handlers, so their
+    FastF1 fetches go through the FastF1 executor and their writes through
+    the async engine. Submitting a job identical (same kind and parameters)
+    to one that is still queued or running returns the existing job instead
+    of starting another. Runs also go through flights under the job key,
+    which sync requests use too, so a job and an identical request share one
+    run (a job joining a request's run reports no progress until it ends).
+    Finished jobs are kept for polling, up to history_size entries. Must be
+    used from a single event loop.
+    """
+
+    def __init__(self, max_workers: int, history_size: int, flights: SingleFlight):
+        self.max_workers = max_workers
+        self._flights = flights
+        self._slots = asyncio.Semaphore(max_workers)
+        self._history_size = history_size
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._active_by_key: dict[str, Job] = {}
+        # Running tasks, referenced so they are not garbage collected mid-run
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def job_key(kind: str, params: dict) -> str:
+        """Key identifying identical jobs and sync requests."""
+        return f"{kind}:{json.dumps(params, sort_keys=True, default=str)}"
+
+    def submit(
+        self,
+        kind: str,
+        params: dict,
+        run: Callable[[Job], Awaitable[Any]],
+        seasons_total: int = 1,
+    ) -> tuple[Job, bool]:
+        """
+        Submit a job, or attach to an identical active one.
+
+        Args:
+            kind: Job type, e.g. "drivers"
+            params: Normalized request parameters (used for de-duplication)
+            run: Coroutine function run on the event loop; receives the job
+                and returns its result (a pydantic model or dict)
+            seasons_total: Number of seasons the job will process
+
+        Returns:
+            Tuple of (job, created) where created is False for a de-duplicated submit
+        """
+        key = self.job_key(kind, params)
+        existing = self._active_by_key.get(key)
+        if existing is not None:
+            logger.info(f"Reusing active {kind} job {existing.id} for identical request")
+            return existing, False
+
+        job = Job(kind, key, params, seasons_total)
+        self._jobs[job.id] = job
+        self._active_by_key[key] = job
+        self._prune()
+
+        task = asyncio.ensure_future(self._run(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info(f"Queued {kind} job {job.id}")
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[Job]:
+        return list(reversed(self._jobs.values()))
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[Any]]) -> None:
+        try:
+            async with self._slots:
+                job.status = JOB_RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                result = await self._flights.do(job.key, lambda: run(job))
+            job.result = result.model_dump() if hasattr(result, "model_dump") else result
+            job.status = JOB_SUCCEEDED
+            logger.info(f"Job {job.id} ({job.kind}) succeeded")
+        except Exception as e:
+            job.error = str(getattr(e, "detail", None) or e)
+            job.status = JOB_FAILED
+            logger.error(f"Job {job.id} ({job.kind}) failed: {job.error}")
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            if self._active_by_key.get(job.key) is job:
+                del self._active_by_key[job.key]
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond the history size."""
+        excess = len(self._jobs) - self._history_size
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if not job.is_active][:excess]:
+            del self._jobs[job_id]
+
+
+job_manager = JobManager(JOB_WORKERS, JOB_HISTORY_SIZE, sync_flights)
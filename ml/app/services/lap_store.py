@@ -0,0 +1,246 @@
+"""Parquet store of session laps, partitioned by season, event and session."""
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Sequence
+from app.config import LAP_INGEST_RETRY_SECONDS, LAP_STORE_DIR
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Bump when LAP_COLUMNS changes; each version lives in its own directory tree
+LAP_STORE_VERSION = 1
+METADATA_KEY = b"f1_laps"
+# Marker of a session that could not be ingested; the underscore prefix keeps
+# it out of dataset discovery
+FAILED_FILE = "_failed.json"
+
+# Column name -> Arrow type name. Strings repeated on every lap are dictionary
+# encoded (pandas categoricals); times are integer milliseconds.
+LAP_COLUMNS = {
+    "driver": "category",
+    "driver_number": "category",
+    "team": "category",
+    "lap_number": "int16",
+    "stint": "int8",
+    "lap_time_ms": "int32",
+    "sector1_ms": "int32",
+    "sector2_ms": "int32",
+    "sector3_ms": "int32",
+    "lap_start_ms": "int32",
+    "session_time_ms": "int32",
+    "compound": "category",
+    "tyre_life": "int16",
+    "fresh_tyre": "bool",
+    "pit_in": "bool",
+    "pit_out": "bool",
+    "track_status": "category",
+    "position": "int8",
+    "is_accurate": "bool",
+    "is_personal_best": "bool",
+    "deleted": "bool",
+}
+
+# Partition keys, encoded in the directory names rather than the files
+PARTITION_COLUMNS = {"season": "int16", "round": "int8", "session": "string"}
+
+
+def _arrow_type(name: str):
+    import pyarrow as pa
+
+    if name == "category":
+        return pa.dictionary(pa.int16(), pa.string())
+    if name == "bool":
+        return pa.bool_()
+    return getattr(pa, name)()
+
+
+def _nullable_types() -> dict:
+    import pandas as pd
+    import pyarrow as pa
+
+    return {
+        pa.int8(): pd.Int8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+
+
+def lap_schema():
+    """Arrow schema of the stored lap files (partition keys excluded)."""
+    import pyarrow as pa
+
+    return pa.schema([(column, _arrow_type(kind)) for column, kind in LAP_COLUMNS.items()])
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(
+        pa.schema([(column, _arrow_type(kind)) for column, kind in PARTITION_COLUMNS.items()]),
+        flavor="hive",
+    )
+
+
+class LapStore:
+    """
+    Hive-partitioned Parquet dataset of laps: one file per
+    season=<year>/round=<round>/session=<type> partition.
+
+    Files are written with a fixed, compact schema (see LAP_COLUMNS) and sorted
+    by driver and lap, so reads filtered on the partition keys only open the
+    matching files, and driver filters are checked against row-group
+    statistics before rows are decoded.
+
+    Sessions that failed to load are marked in their partition, so ingests
+    skip them for retry_seconds instead of reloading them on every request.
+    """
+
+    def __init__(self, directory: str, retry_seconds: int = LAP_INGEST_RETRY_SECONDS):
+        self.root = Path(directory) / f"v{LAP_STORE_VERSION}"
+        self.retry_seconds = retry_seconds
+        self._lock = threading.Lock()
+
+    def path(self, year: int, round_number: int, session_type: str) -> Path:
+        return self.root / f"season={year}" / f"round={round_number}" / f"session={session_type}" / "laps.parquet"
+
+    def has(self, year: int, round_number: int, session_type: str) -> bool:
+        return self.path(year, round_number, session_type).exists()
+
+    def write(self, year: int, round_number: int, session_type: str, laps, source: dict) -> int:
+        """
+        Write one session's laps atomically, replacing any earlier file.
+
+        Args:
+            laps: DataFrame with the LAP_COLUMNS columns
+            source: Event and session the laps were loaded from, kept in the file metadata
+
+        Returns:
+            Number of laps written
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        frame = laps.reindex(columns=list(LAP_COLUMNS)).sort_values(["driver", "lap_number"], kind="stable")
+        table = pa.Table.from_pandas(frame, schema=lap_schema(), preserve_index=False)
+        metadata = {
+            "version": LAP_STORE_VERSION,
+            "season": year,
+            "round": round_number,
+            "session": session_type,
+            "rows": table.num_rows,
+            "built_at": datetime.now().isoformat(),
+            "source": source,
+        }
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: json.dumps(metadata)})
+
+        path = self.path(year, round_number, session_type)
+        # Dot-prefixed, so dataset discovery never picks up a partial file
+        tmp_path = path.parent / f".{path.name}.tmp"
+        with self._lock, span("laps write", season=year, round=round_number, session_type=session_type, rows=table.num_rows):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Small row groups keep per-driver reads from decoding whole sessions
+            pq.write_table(table, tmp_path, compression="zstd", row_group_size=256)
+            os.replace(tmp_path, path)
+            path.with_name(FAILED_FILE).unlink(missing_ok=True)
+        return table.num_rows
+
+    def mark_failed(self, year: int, round_number: int, session_type: str, error: str) -> None:
+        """Remember that a session's laps could not be loaded or were empty."""
+        path = self.path(year, round_number, session_type).with_name(FAILED_FILE)
+        tmp_path = path.parent / f".{path.name}.tmp"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"failed_at": datetime.now().isoformat(), "error": error}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not mark {year} round {round_number} {session_type} as failed: {e}")
+
+    def recently_failed(self, year: int, round_number: int, session_type: str) -> bool:
+        """Whether a session failed to ingest less than retry_seconds ago."""
+        path = self.path(year, round_number, session_type).with_name(FAILED_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                failed_at = datetime.fromisoformat(json.load(f)["failed_at"])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not read failure marker {path}: {e}")
+            return False
+        return datetime.now() - failed_at < timedelta(seconds=self.retry_seconds)
+
+    def read(
+        self,
+        season: int,
+        rounds: Optional[Sequence[int]] = None,
+        session_types: Optional[Sequence[str]] = None,
+        drivers: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """
+        Read stored laps, pushing the filters down to the Parquet scan.
+
+        Partition filters (season, rounds, session types) skip whole files;
+        the driver filter skips row groups. Only the requested columns are
+        decoded, and categorical columns stay categorical.
+
+        Args:
+            season: Season year
+            rounds: Rounds to include (all stored rounds if None)
+            session_types: Session types to include, e.g. ["R"] (all if None)
+            drivers: 3-letter driver codes to include (all if None)
+            columns: Lap columns to return; partition keys are always included
+
+        Returns:
+            DataFrame of laps sorted by round, session, driver and lap (those selected)
+        """
+        import pandas as pd
+        import pyarrow.dataset as ds
+
+        keys = list(PARTITION_COLUMNS)
+        selected = keys + [column for column in (columns or LAP_COLUMNS) if column not in keys]
+        season_dir = self.root / f"season={season}"
+        if not season_dir.exists():
+            return pd.DataFrame(columns=selected)
+
+        expression = ds.field("season") == season
+        if rounds is not None:
+            expression &= ds.field("round").isin(list(rounds))
+        if session_types is not None:
+            expression &= ds.field("session").isin(list(session_types))
+        if drivers is not None:
+            expression &= ds.field("driver").isin([driver.upper() for driver in drivers])
+
+        with span("laps read", season=season):
+            dataset = ds.dataset(self.root, format="parquet", partitioning=_partitioning(), schema=self._dataset_schema())
+            table = dataset.to_table(columns=selected, filter=expression)
+        # Nullable pandas dtypes, so missing lap times stay int32 instead of becoming float
+        frame = table.to_pandas(types_mapper=_nullable_types().get)
+        order = keys[1:] + [column for column in ("driver", "lap_number") if column in frame]
+        return frame.sort_values(order, kind="stable", ignore_index=True)
+
+    def _dataset_schema(self):
+        import pyarrow as pa
+
+        schema = lap_schema()
+        for column, kind in PARTITION_COLUMNS.items():
+            schema = schema.append(pa.field(column, _arrow_type(kind)))
+        return schema
+
+    def sessions(self, season: int) -> list[tuple[int, str]]:
+        """(round, session type) pairs stored for a season."""
+        season_dir = self.root / f"season={season}"
+        stored = []
+        for path in season_dir.glob("round=*/session=*/laps.parquet"):
+            round_key, session_key = path.parent.parent.name, path.parent.name
+            stored.append((int(round_key.split("=", 1)[1]), session_key.split("=", 1)[1]))
+        return sorted(stored)
+
+
+lap_store = LapStore(LAP_STORE_DIR)
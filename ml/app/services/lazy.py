@@ -0,0 +1,42 @@
+"""Lazily initialized, process-wide resources."""
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Lazy:
+    """
+    A resource created on first use (or by an explicit warm-up) exactly once.
+
+    Keeps expensive setup - heavy imports, cache directories, database
+    engines - out of module import time so the app can answer /health
+    immediately after start.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self._factory = factory
+        self._value: Any = None
+        self._initialized = False
+        self._lock = threading.Lock()
+        self.init_seconds: Optional[float] = None
+
+    def get(self) -> Any:
+        """Return the resource, creating it on the first call."""
+        if self._initialized:
+            return self._value
+        with self._lock:
+            if not self._initialized:
+                start = time.perf_counter()
+                self._value = self._factory()
+                self.init_seconds = time.perf_counter() - start
+                self._initialized = True
+                logger.info(f"Initialized {self.name} in {self.init_seconds:.2f}s")
+        return self._value
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
@@ -0,0 +1,103 @@
+"""Prometheus metrics for the FastF1 and database hot paths."""
+from app.services.lazy import Lazy
+
+
+class LazyMetric:
+    """
+    A Prometheus metric created on first use.
+
+    prometheus_client is only imported when a metric is first recorded or
+    /metrics is scraped, keeping it out of app startup; all metrics are then
+    registered together. Attribute access (labels, inc, observe, ...) is
+    forwarded to the metric.
+    """
+
+    def __init__(self, kind: str, *args, **kwargs):
+        self._kind = kind
+        self._args = args
+        self._kwargs = kwargs
+        _all_metrics.append(self)
+
+    def create(self):
+        import prometheus_client
+        return getattr(prometheus_client, self._kind)(*self._args, **self._kwargs)
+
+    def __getattr__(self, attribute: str):
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        return getattr(prometheus_metrics.get()[self], attribute)
+
+
+_all_metrics: list[LazyMetric] = []
+prometheus_metrics = Lazy("Prometheus metrics", lambda: {metric: metric.create() for metric in _all_metrics})
+
+
+FIND_BEST_SESSION_SECONDS = LazyMetric(
+    "Histogram",
+    "fastf1_find_best_session_seconds",
+    "Time to pick the best session of a season, including discovery cache hits",
+)
+
+SESSIONS_PROBED = LazyMetric(
+    "Histogram",
+    "fastf1_sessions_probed",
+    "Sessions loaded per session discovery run",
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+SESSION_LOAD_SECONDS = LazyMetric(
+    "Histogram",
+    "fastf1_session_load_seconds",
+    "Latency of FastF1 session.load, by session type",
+    ["session_type"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80),
+)
+
+CACHE_REQUESTS = LazyMetric(
+    "Counter",
+    "fastf1_cache_requests_total",
+    "Cache lookups by cache (schedule, session, discovery, http) and result (hit, miss)",
+    ["cache", "result"],
+)
+
+TEAM_FALLBACKS = LazyMetric(
+    "Counter",
+    "fastf1_team_fallback_total",
+    "Team-name fallbacks for results without team names, by source (cached_sessions, driver_info, laps)",
+    ["source"],
+)
+
+LAPS_FALLBACK_SECONDS = LazyMetric(
+    "Histogram",
+    "fastf1_laps_fallback_seconds",
+    "Latency of the last-resort laps load used to recover team names",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80),
+)
+
+DB_UPSERT_SECONDS = LazyMetric(
+    "Histogram",
+    "db_upsert_seconds",
+    "Latency of a single upsert statement, by table",
+    ["table"],
+)
+
+SYNC_ROWS = LazyMetric(
+    "Histogram",
+    "sync_rows",
+    "Rows written per sync, by kind",
+    ["kind"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+
+
+def record_http_cache_response(response, *args, **kwargs):
+    """
+    requests response hook counting FastF1 HTTP cache hits and misses.
+
+    requests-cache runs hooks on both the raw and the cached response of a
+    miss; only the one carrying from_cache is counted.
+    """
+    from_cache = getattr(response, "from_cache", None)
+    if from_cache is not None:
+        CACHE_REQUESTS.labels(cache="http", result="hit" if from_cache else "miss").inc()
+    return response
@@ -0,0 +1,232 @@
+"""Race pace, stint and tyre degradation analytics over stored race laps."""
+import logging
+from typing import Optional
+import numpy as np
+import pandas as pd
+from app.config import RACE_PACE_FUEL_MS_PER_LAP
+from app.services.lap_store import lap_store
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Laps slower than this multiple of the race's median clean lap are treated as
+# outliers (traffic, incidents) and left out of pace figures
+PACE_OUTLIER_RATIO = 1.07
+# Minimum clean laps in a stint before a degradation slope is fitted
+MIN_STINT_LAPS = 3
+
+PACE_LAP_COLUMNS = [
+    "driver", "team", "lap_number", "stint", "lap_time_ms", "session_time_ms",
+    "compound", "tyre_life", "pit_in", "pit_out", "track_status", "position",
+    "is_accurate", "deleted",
+]
+
+
+def annotate_laps(laps: pd.DataFrame, fuel_ms_per_lap: float = RACE_PACE_FUEL_MS_PER_LAP) -> pd.DataFrame:
+    """
+    Add per-lap pace columns to race laps, one vectorized pass per column.
+
+    - fuel_corrected_ms: lap time minus the fuel effect of the laps still to run,
+      so laps across a race are comparable at an empty-tank equivalent
+    - gap_to_leader_ms: time behind the first car to complete the same lap
+    - clean: green-flag, accurate, non-pit laps within PACE_OUTLIER_RATIO of the
+      race's median, the laps used for pace and degradation figures
+
+    Args:
+        laps: Lap store rows (round, driver, lap_number, lap_time_ms, ...)
+        fuel_ms_per_lap: Lap time gained per lap of fuel burned
+
+    Returns:
+        Copy of laps with the added columns
+    """
+    laps = laps.copy()
+    lap_time = laps["lap_time_ms"].astype("float64")
+    lap_number = laps["lap_number"].astype("float64")
+    session_time = laps["session_time_ms"].astype("float64")
+    rounds = laps["round"]
+
+    race_laps = lap_number.groupby(rounds).transform("max")
+    laps["fuel_corrected_ms"] = lap_time - fuel_ms_per_lap * (race_laps - lap_number)
+    laps["gap_to_leader_ms"] = session_time - session_time.groupby([rounds, lap_number]).transform("min")
+
+    clean = (
+        laps["is_accurate"].fillna(False).astype(bool)
+        & ~laps["pit_in"].fillna(False).astype(bool)
+        & ~laps["pit_out"].fillna(False).astype(bool)
+        & ~laps["deleted"].fillna(False).astype(bool)
+        & (laps["track_status"].astype("string") == "1").fillna(False).astype(bool)
+        & (lap_number > 1)
+        & lap_time.notna()
+    )
+    median = lap_time.where(clean).groupby(rounds).transform("median")
+    laps["clean"] = clean & (lap_time <= median * PACE_OUTLIER_RATIO)
+    return laps
+
+
+def _with_team_ids(frame: pd.DataFrame) -> pd.DataFrame:
+    """Add driver_id and constructor_id as stored by the driver and team syncs."""
+    from app.services.fastf1_service import _map_distinct, normalize_constructor_id
+
+    frame["driver_id"] = frame["driver"].astype(str).str.lower()
+    frame["constructor_id"] = _map_distinct(frame["team"].astype(object), normalize_constructor_id)
+    return frame
+
+
+def stint_summary(laps: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (round, driver, stint): lap range, compound, pace and the
+    tyre degradation slope (ms per lap of tyre life, least squares over the
+    stint's clean fuel-corrected laps).
+
+    Slopes come from grouped sums (n, Σx, Σy, Σxy, Σx²), so every stint of a
+    season is fitted in one pass without a per-stint loop.
+    """
+    keys = ["round", "driver", "stint"]
+    all_laps = laps.groupby(keys, observed=True, sort=True)
+    stints = all_laps.agg(
+        team=("team", "first"),
+        compound=("compound", "first"),
+        start_lap=("lap_number", "min"),
+        end_lap=("lap_number", "max"),
+        laps=("lap_number", "size"),
+    )
+
+    clean = laps[laps["clean"]]
+    x = clean["tyre_life"].astype("float64")
+    y = clean["fuel_corrected_ms"]
+    sums = pd.DataFrame({"x": x, "y": y, "xy": x * y, "xx": x * x}).groupby(
+        [clean[key] for key in keys], observed=True
+    ).agg(["sum", "count"])
+    n = sums[("y", "count")]
+    sx, sy, sxy, sxx = (sums[(column, "sum")] for column in ("x", "y", "xy", "xx"))
+    denominator = n * sxx - sx * sx
+    slope = ((n * sxy - sx * sy) / denominator).where((denominator > 0) & (n >= MIN_STINT_LAPS))
+
+    pace = clean.groupby(keys, observed=True)["fuel_corrected_ms"].agg(["mean", "median", "min"])
+    stints = stints.join(pd.DataFrame({
+        "clean_laps": n,
+        "mean_pace_ms": pace["mean"],
+        "median_pace_ms": pace["median"],
+        "best_pace_ms": pace["min"],
+        "degradation_ms_per_lap": slope,
+    }))
+    stints["clean_laps"] = stints["clean_laps"].fillna(0).astype(int)
+    return _with_team_ids(stints.reset_index())
+
+
+def race_pace_summary(laps: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (round, driver): median clean fuel-corrected pace, its delta
+    to the round's fastest driver, laps completed, final position and gap.
+    """
+    keys = ["round", "driver"]
+    by_driver = laps.groupby(keys, observed=True, sort=True)
+    summary = by_driver.agg(
+        team=("team", "first"),
+        laps=("lap_number", "max"),
+        position=("position", "last"),
+        final_gap_ms=("gap_to_leader_ms", "last"),
+    )
+    clean = laps[laps["clean"]]
+    pace = clean.groupby(keys, observed=True)["fuel_corrected_ms"].agg(pace_ms="median", clean_laps="size")
+    summary = summary.join(pace)
+    fastest = summary["pace_ms"].groupby(level="round").transform("min")
+    summary["pace_delta_ms"] = summary["pace_ms"] - fastest
+    summary["pace_delta_pct"] = 100 * summary["pace_delta_ms"] / fastest
+    summary["clean_laps"] = summary["clean_laps"].fillna(0).astype(int)
+    return _with_team_ids(summary.reset_index())
+
+
+def season_pace_summary(race_pace: pd.DataFrame) -> pd.DataFrame:
+    """One row per driver: average pace deficit to the fastest driver across the rounds they raced."""
+    rated = race_pace[race_pace["pace_delta_pct"].notna()]
+    season = rated.groupby("driver", observed=True, sort=False).agg(
+        driver_id=("driver_id", "first"),
+        team=("team", "last"),
+        constructor_id=("constructor_id", "last"),
+        rounds=("round", "nunique"),
+        mean_pace_delta_pct=("pace_delta_pct", "mean"),
+        median_pace_delta_ms=("pace_delta_ms", "median"),
+    )
+    return season.sort_values("mean_pace_delta_pct").reset_index()
+
+
+def _records(frame: pd.DataFrame) -> list[dict]:
+    """Rows as plain Python values, with missing values as None and times rounded to the millisecond."""
+    frame = frame.copy()
+    for column in frame.columns:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            frame[column] = frame[column].astype(object)
+        elif column.endswith("_ms") or column.endswith("_pct") or column == "degradation_ms_per_lap":
+            frame[column] = frame[column].astype("float64").round(3 if column.endswith("_pct") else 1)
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [
+        {key: value.item() if isinstance(value, np.generic) else value for key, value in row.items()}
+        for row in frame.to_dict("records")
+    ]
+
+
+def season_race_pace(
+    season: int,
+    rounds: Optional[list[int]] = None,
+    drivers: Optional[list[str]] = None,
+    fuel_ms_per_lap: float = RACE_PACE_FUEL_MS_PER_LAP,
+    include_laps: bool = False,
+) -> dict:
+    """
+    Race pace and stint analytics for a season's races.
+
+    Race laps come from the lap store; requested races that are not stored yet
+    are ingested from FastF1 first (races that recently failed to load are
+    not retried). Team names are normalized as in the driver and
+    team syncs, and rows carry the matching driver_id and constructor_id.
+
+    Args:
+        season: Season year
+        rounds: Rounds to analyse (all started rounds if None)
+        drivers: 3-letter codes to return (all drivers if None); pace deltas
+            are still relative to the whole field
+        fuel_ms_per_lap: Fuel correction, in ms of lap time per lap of fuel
+        include_laps: Also return every lap with its fuel-corrected time and gap
+
+    Returns:
+        Dict with race_pace, season_pace and stints rows (and laps if requested)
+    """
+    from app.services.fastf1_service import ingest_season_laps
+
+    stored_rounds = {round_number for round_number, session in lap_store.sessions(season) if session == "R"}
+    missing = None if rounds is None else sorted(set(rounds) - stored_rounds)
+    if missing is None or missing:
+        ingested = ingest_season_laps(season, ["R"], rounds=missing)
+        if ingested["sessions"]:
+            logger.info(f"Ingested {ingested['sessions']} races of {season} for pace analytics")
+
+    laps = lap_store.read(season, rounds=rounds, session_types=["R"], columns=PACE_LAP_COLUMNS)
+    if laps.empty:
+        return {"rounds": [], "race_pace": [], "season_pace": [], "stints": [], "laps": [] if include_laps else None}
+
+    with span("race pace", season=season, laps=len(laps)):
+        laps = annotate_laps(laps, fuel_ms_per_lap)
+        race_pace = race_pace_summary(laps)
+        stints = stint_summary(laps)
+        season_pace = season_pace_summary(race_pace)
+
+    if drivers is not None:
+        codes = {driver.upper() for driver in drivers}
+        race_pace, stints, season_pace, laps = (
+            frame[frame["driver"].astype(str).isin(codes)] for frame in (race_pace, stints, season_pace, laps)
+        )
+
+    lap_rows = None
+    if include_laps:
+        lap_rows = _records(laps[[
+            "round", "driver", "team", "lap_number", "stint", "compound", "tyre_life", "position",
+            "lap_time_ms", "fuel_corrected_ms", "gap_to_leader_ms", "clean",
+        ]])
+    return {
+        "rounds": sorted(int(round_number) for round_number in laps["round"].unique()),
+        "race_pace": _records(race_pace),
+        "season_pace": _records(season_pace),
+        "stints": _records(stints),
+        "laps": lap_rows,
+    }
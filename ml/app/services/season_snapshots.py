@@ -0,0 +1,123 @@
+"""Versioned on-disk snapshots of each season's extracted drivers and teams."""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+from app.config import SEASON_SNAPSHOT_DIR
+from app.services.metrics import CACHE_REQUESTS
+from app.services.seasons import CURRENT_SEASON
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of the extracted records changes; older snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+METADATA_KEY = b"f1_snapshot"
+
+
+class SeasonSnapshotStore:
+    """
+    Parquet snapshots of extracted records, one file per (season, kind).
+
+    Each file carries its snapshot version, build time and the FastF1 session
+    the records were extracted from in the Parquet schema metadata. Completed
+    seasons are served from their snapshot once it exists; the current (and any
+    future) season is rebuilt on every request and its snapshot refreshed.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    def path(self, year: int, kind: str) -> Path:
+        return self.directory / str(year) / f"{kind}.v{SNAPSHOT_VERSION}.parquet"
+
+    @staticmethod
+    def is_final(year: int) -> bool:
+        """Whether a season is over, so its snapshot never needs rebuilding."""
+        return year < CURRENT_SEASON
+
+    def read(self, year: int, kind: str) -> Optional[tuple[list[dict], dict]]:
+        """
+        Load a snapshot.
+
+        Returns:
+            Tuple of (records, metadata), or None if there is no usable snapshot
+        """
+        import pyarrow.parquet as pq
+
+        path = self.path(year, kind)
+        if not path.exists():
+            return None
+        try:
+            table = pq.read_table(path)
+            metadata = json.loads((table.schema.metadata or {}).get(METADATA_KEY, b"{}"))
+            if metadata.get("version") != SNAPSHOT_VERSION:
+                logger.info(f"Ignoring {kind} snapshot with outdated version at {path}")
+                return None
+            # to_pylist keeps nullable integers as int/None rather than float/NaN
+            records = table.to_pylist()
+        except Exception as e:
+            logger.warning(f"Could not read {kind} snapshot {path}: {e}")
+            return None
+        return records, metadata
+
+    def write(self, year: int, kind: str, records: list[dict], source: dict) -> None:
+        """Write a snapshot atomically, recording the session it was built from."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.path(year, kind)
+        metadata = {
+            "version": SNAPSHOT_VERSION,
+            "season": year,
+            "kind": kind,
+            "rows": len(records),
+            "built_at": datetime.now().isoformat(),
+            "source": source,
+        }
+        # Types are inferred per column from the values, so an integer column
+        # with missing values stays int64 with nulls instead of becoming float
+        table = pa.Table.from_pylist(records)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: json.dumps(metadata)})
+        tmp_path = path.with_suffix(".tmp")
+        with self._lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                pq.write_table(table, tmp_path, compression="zstd")
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"Could not write {kind} snapshot {path}: {e}")
+
+    def get_or_build(self, year: int, kind: str, build: Callable[[], tuple[list[dict], dict]]) -> list[dict]:
+        """
+        Serve a completed season from its snapshot, otherwise build and store it.
+
+        Args:
+            year: Season the records belong to
+            kind: Record kind ("drivers" or "teams")
+            build: Returns (records, source session) from FastF1
+
+        Returns:
+            List of record dicts
+        """
+        if self.is_final(year):
+            with span("snapshot read", season=year, kind=kind):
+                snapshot = self.read(year, kind)
+            if snapshot is not None:
+                CACHE_REQUESTS.labels(cache="snapshot", result="hit").inc()
+                return snapshot[0]
+            CACHE_REQUESTS.labels(cache="snapshot", result="miss").inc()
+
+        records, source = build()
+        # An empty result is more likely a FastF1 outage than an empty season
+        if records:
+            with span("snapshot write", season=year, kind=kind, rows=len(records)):
+                self.write(year, kind, records, source)
+        return records
+
+
+season_snapshots = SeasonSnapshotStore(SEASON_SNAPSHOT_DIR)
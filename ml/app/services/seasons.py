@@ -0,0 +1,60 @@
+"""Season constants and season selection shared by sync routes and the FastF1 service."""
+from typing import Optional
+
+# Current season year
+CURRENT_SEASON = 2026
+
+# Confirmed 2026 F1 driver lineup (official race drivers only)
+# This is used to filter out test/reserve drivers from sessions
+# Updated based on official 2026 lineup - excludes MAG, ZHO, TSU, DOO
+CONFIRMED_2026_DRIVERS = {
+    # Alpine
+    "GAS",  # Pierre Gasly
+    "COL",  # Franco Colapinto
+    # Aston Martin
+    "ALO",  # Fernando Alonso
+    "STR",  # Lance Stroll
+    # Audi (formerly Sauber)
+    "BOR",  # Gabriel Bortoleto
+    "HUL",  # Nico Hulkenberg
+    # Cadillac
+    "PER",  # Sergio Pérez
+    "BOT",  # Valtteri Bottas
+    # Ferrari
+    "LEC",  # Charles Leclerc
+    "HAM",  # Lewis Hamilton
+    # Haas
+    "BEA",  # Oliver Bearman
+    "OCO",  # Esteban Ocon
+    # McLaren
+    "NOR",  # Lando Norris
+    "PIA",  # Oscar Piastri
+    # Mercedes
+    "RUS",  # George Russell
+    "ANT",  # Kimi Antonelli
+    # Racing Bulls
+    "LAW",  # Liam Lawson
+    "LIN",  # Arvid Lindblad (confirmed for 2026)
+    # Red Bull Racing
+    "VER",  # Max Verstappen
+    "HAD",  # Isack Hadjar
+    # Williams
+    "SAI",  # Carlos Sainz
+    "ALB",  # Alexander Albon
+}
+
+
+def resolve_seasons(seasons: Optional[list[int]] = None, season: Optional[int] = None) -> list[int]:
+    """
+    Determine which seasons a sync request covers.
+    
+    Args:
+        seasons: List of seasons. If None and season is None, only the current season.
+        season: Single season (takes precedence over seasons if provided).
+    """
+    if season is not None:
+        return [season]
+    if seasons is None:
+        # Default: only current season (most common use case)
+        return [CURRENT_SEASON]
+    return list(seasons)
@@ -0,0 +1,182 @@
+"""In-process cache of loaded FastF1 sessions and event schedules."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+import fastf1
+import pandas as pd
+from fastf1.core import Session
+from app.config import (
+    FASTF1_CACHE_DIR,
+    SESSION_CACHE_MAX_ENTRIES,
+    SESSION_CACHE_TTL_SECONDS,
+    TELEMETRY_SESSION_CACHE_ENTRIES,
+)
+from app.services.lazy import Lazy
+from app.services.metrics import CACHE_REQUESTS, SESSION_LOAD_SECONDS, record_http_cache_response
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry and per-key load locks.
+
+    Concurrent callers asking for the same missing key wait for a single load
+    instead of each running the loader. Loader exceptions are not cached.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get_fresh(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (hit, value) for a non-expired entry. Caller must hold self._lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, running loader once on a miss."""
+        with self._lock:
+            hit, value = self._get_fresh(key)
+            if hit:
+                CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have loaded it while we waited
+            with self._lock:
+                hit, value = self._get_fresh(key)
+            if hit:
+                CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+                return value
+
+            CACHE_REQUESTS.labels(cache=self.name, result="miss").inc()
+            try:
+                value = loader()
+            except BaseException:
+                # Nothing was cached, so don't keep a lock for the key around
+                with self._lock:
+                    if self._key_locks.get(key) is key_lock and key not in self._entries:
+                        del self._key_locks[key]
+                raise
+
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted_key, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted_key, None)
+                    logger.debug(f"Evicted {evicted_key} from {self.name} cache")
+            return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None, without loading it."""
+        with self._lock:
+            return self._get_fresh(key)[1]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+def _enable_fastf1_cache() -> str:
+    Path(FASTF1_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    fastf1.Cache.enable_cache(FASTF1_CACHE_DIR)
+    # Count HTTP cache hits/misses on FastF1's requests-cache session
+    cached_session = getattr(fastf1.Cache, "_requests_session_cached", None)
+    if cached_session is not None:
+        cached_session.hooks["response"].append(record_http_cache_response)
+    return FASTF1_CACHE_DIR
+
+
+# FastF1's on-disk HTTP cache, enabled before the first FastF1/Ergast request
+fastf1_cache = Lazy("FastF1 cache", _enable_fastf1_cache)
+
+schedule_cache = TTLCache("schedule", SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_TTL_SECONDS)
+session_cache = TTLCache("session", SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_TTL_SECONDS)
+discovery_cache = TTLCache("discovery", SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_TTL_SECONDS)
+telemetry_session_cache = TTLCache("telemetry_session", TELEMETRY_SESSION_CACHE_ENTRIES, SESSION_CACHE_TTL_SECONDS)
+
+
+def get_event_schedule(year: int) -> pd.DataFrame:
+    """Get the event schedule for a season, shared across all fetch functions."""
+    def _load() -> pd.DataFrame:
+        fastf1_cache.get()
+        with span("schedule fetch", season=year):
+            return fastf1.get_event_schedule(year)
+
+    return schedule_cache.get_or_load(year, _load)
+
+
+def load_session(year: int, event_name: str, session_type: str) -> Session:
+    """
+    Get a session loaded with results only (no laps, telemetry, weather or messages).
+
+    The loaded Session object is shared, so each session is loaded at most once
+    per TTL window regardless of how many fetch functions ask for it.
+    """
+    def _load() -> Session:
+        fastf1_cache.get()
+        with span("session load", season=year, event=event_name, session_type=session_type):
+            session = fastf1.get_session(year, event_name, session_type)
+            with SESSION_LOAD_SECONDS.labels(session_type=session_type).time():
+                session.load(weather=False, messages=False, telemetry=False, laps=False)
+        return session
+
+    return session_cache.get_or_load((year, event_name, session_type), _load)
+
+
+def load_session_laps(year: int, event_name: str, session_type: str) -> Session:
+    """
+    Get a session loaded with laps (no telemetry, weather or messages).
+    
+    Not kept in the session cache: lap tables are large, and callers persist
+    what they need to the lap store instead.
+    """
+    fastf1_cache.get()
+    with span("laps load", season=year, event=event_name, session_type=session_type):
+        session = fastf1.get_session(year, event_name, session_type)
+        with SESSION_LOAD_SECONDS.labels(session_type=session_type).time():
+            session.load(laps=True, telemetry=False, weather=False, messages=False)
+    return session
+
+
+def load_session_telemetry(year: int, event_name: str, session_type: str) -> Session:
+    """
+    Get a session loaded with laps and car telemetry (no weather or messages).
+    
+    Kept in a separate, smaller cache than results-only sessions, since each
+    holds the full car data of every driver.
+    """
+    def _load() -> Session:
+        fastf1_cache.get()
+        with span("telemetry load", season=year, event=event_name, session_type=session_type):
+            session = fastf1.get_session(year, event_name, session_type)
+            with SESSION_LOAD_SECONDS.labels(session_type=session_type).time():
+                session.load(laps=True, telemetry=True, weather=False, messages=False)
+        return session
+    
+    return telemetry_session_cache.get_or_load((year, event_name, session_type), _load)
+
+
+def cached_session(year: int, event_name: str, session_type: str) -> Optional[Session]:
+    """Return a session from the in-process cache if it is already loaded, without loading it."""
+    return session_cache.peek((year, event_name, session_type))
@@ -0,0 +1,139 @@
+"""Persistent index of which FastF1 sessions have driver and results data."""
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+import pandas as pd
+from app.config import SESSION_INDEX_PATH, SESSION_INDEX_RECENT_DAYS, SESSION_INDEX_RETRY_SECONDS
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+
+class SessionIndex:
+    """
+    On-disk index keyed by (year, event, session type).
+
+    Each entry records whether the session loaded with drivers and results, so
+    session discovery can skip sessions already known to be unusable and go
+    straight to the best one. Entries for events dated after the last index
+    build of a season are treated as stale and re-probed. Sessions of recent
+    events that lacked data are stored with a retry time, since results are
+    often published hours after the session.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: Optional[dict] = None
+
+    def _load(self) -> dict:
+        """Load the index from disk (once per process)."""
+        if self._data is None:
+            data = {"version": INDEX_VERSION, "seasons": {}}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                if stored.get("version") == INDEX_VERSION:
+                    data = stored
+                else:
+                    logger.info(f"Ignoring session index with outdated version at {self.path}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not read session index {self.path}: {e}")
+            self._data = data
+        return self._data
+
+    def _season(self, year: int) -> dict:
+        seasons = self._load()["seasons"]
+        return seasons.setdefault(str(year), {"built_at": None, "sessions": {}})
+
+    @staticmethod
+    def _key(event_name: str, session_type: str) -> str:
+        return f"{event_name}|{session_type}"
+
+    def lookup(self, year: int, event_name: str, session_type: str) -> Optional[dict]:
+        """Return the stored entry for a session, or None if it was never probed or is due a retry."""
+        with self._lock:
+            entry = self._season(year)["sessions"].get(self._key(event_name, session_type))
+        if entry is not None and entry.get("retry_after"):
+            if datetime.now() >= datetime.fromisoformat(entry["retry_after"]):
+                return None
+        return entry
+
+    def record(
+        self,
+        year: int,
+        event_name: str,
+        session_type: str,
+        has_drivers: bool,
+        has_results: bool,
+        event_date=None,
+    ) -> None:
+        """
+        Record the outcome of loading a session.
+
+        Sessions without drivers or results whose event is within
+        SESSION_INDEX_RECENT_DAYS (or undated) get a retry time instead of
+        being skipped for good.
+        """
+        entry = {
+            "has_drivers": bool(has_drivers),
+            "has_results": bool(has_results),
+        }
+        if not (has_drivers and has_results) and self._is_recent(event_date):
+            entry["retry_after"] = (datetime.now() + timedelta(seconds=SESSION_INDEX_RETRY_SECONDS)).isoformat()
+        with self._lock:
+            self._season(year)["sessions"][self._key(event_name, session_type)] = entry
+
+    @staticmethod
+    def _is_recent(event_date) -> bool:
+        if event_date is None or pd.isna(event_date):
+            return True
+        try:
+            event_date = pd.Timestamp(event_date).to_pydatetime().replace(tzinfo=None)
+        except Exception:
+            return True
+        return event_date >= datetime.now() - timedelta(days=SESSION_INDEX_RECENT_DAYS)
+
+    def needs_refresh(self, year: int, event_date) -> bool:
+        """
+        Check whether an event's entries must be re-probed.
+
+        True when the season has never been indexed, the event has no usable date,
+        or the event takes place after the last index build.
+        """
+        with self._lock:
+            built_at = self._season(year)["built_at"]
+        if built_at is None or event_date is None or pd.isna(event_date):
+            return True
+        try:
+            return pd.Timestamp(event_date).to_pydatetime() > datetime.fromisoformat(built_at)
+        except Exception:
+            return True
+
+    def mark_built(self, year: int) -> None:
+        """Stamp the season with the current build time and persist the index."""
+        with self._lock:
+            self._season(year)["built_at"] = datetime.now().isoformat()
+            self.save()
+
+    def save(self) -> None:
+        """Write the index to disk atomically."""
+        with self._lock:
+            data = self._load()
+            tmp_path = f"{self.path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"Could not write session index {self.path}: {e}")
+
+
+session_index = SessionIndex(SESSION_INDEX_PATH)
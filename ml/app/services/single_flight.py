@@ -0,0 +1,39 @@
+"""Single-flight coalescing of concurrent identical async operations."""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Runs at most one operation per key at a time.
+
+    Callers arriving while an operation with the same key is in flight await
+    its result (or exception) instead of starting their own. The shared task
+    is shielded, so a caller disconnecting does not cancel it for the others.
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for key, or join the in-flight run for the same key."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Coalescing {self.name} request onto in-flight run for {key}")
+        return await asyncio.shield(future)
+
+    def in_flight(self) -> int:
+        """Number of distinct operations currently running."""
+        return len(self._inflight)
+
+
+sync_flights = SingleFlight("sync")
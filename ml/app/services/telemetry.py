@@ -0,0 +1,203 @@
+"""Chart-ready telemetry traces: per-lap car data, downsampled and cached on disk."""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+import numpy as np
+from app.config import TELEMETRY_CACHE_DIR
+from app.services.downsampling import downsample
+from app.services.metrics import CACHE_REQUESTS
+from app.services.session_cache import get_event_schedule, load_session_telemetry
+from app.services.telemetry_arrays import StoredTelemetry, telemetry_arrays
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+TRACE_CACHE_VERSION = 1
+
+# Stored telemetry channels returned as traces
+TRACE_CHANNELS = ("speed", "throttle", "brake")
+TRACE_AXES = ("distance", "time")
+
+
+class LapNotFoundError(LookupError):
+    """The requested event, driver or lap has no telemetry."""
+
+
+class TraceCache:
+    """
+    On-disk cache of downsampled lap traces, one JSON file per
+    (session, driver, lap, resolution). A completed lap's telemetry never
+    changes, so entries do not expire.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory) / f"v{TRACE_CACHE_VERSION}"
+
+    def path(self, season: int, round_number: int, session_type: str, driver: str, lap: Optional[int],
+             points: int, method: str, axis: str) -> Path:
+        lap_key = lap if lap is not None else "all"
+        return (
+            self.directory / str(season) / f"{round_number}_{session_type}" / driver
+            / f"{lap_key}.{method}.{axis}.{points}.json"
+        )
+
+    def read(self, *key) -> Optional[dict]:
+        path = self.path(*key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read telemetry trace {path}: {e}")
+            return None
+
+    def write(self, trace: dict, *key) -> None:
+        path = self.path(*key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(trace, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write telemetry trace {path}: {e}")
+
+
+trace_cache = TraceCache(TELEMETRY_CACHE_DIR)
+
+
+def _event_name(season: int, round_number: int) -> str:
+    schedule = get_event_schedule(season)
+    events = schedule.loc[schedule["RoundNumber"] == round_number, "EventName"]
+    if events.empty:
+        raise LapNotFoundError(f"No round {round_number} in the {season} schedule")
+    return events.iloc[0]
+
+
+def stored_session_telemetry(season: int, round_number: int, session_type: str) -> StoredTelemetry:
+    """
+    A session's car telemetry as memory-mapped arrays, loading it from FastF1
+    and storing it on first use.
+    """
+    stored = telemetry_arrays.open(season, round_number, session_type)
+    if stored is not None:
+        CACHE_REQUESTS.labels(cache="telemetry_arrays", result="hit").inc()
+        return stored
+
+    CACHE_REQUESTS.labels(cache="telemetry_arrays", result="miss").inc()
+    session = load_session_telemetry(season, _event_name(season, round_number), session_type)
+    telemetry_arrays.write(season, round_number, session_type, session.laps, session.car_data)
+    stored = telemetry_arrays.open(season, round_number, session_type)
+    if stored is None:
+        raise LapNotFoundError(f"No telemetry stored for {season} round {round_number} {session_type}")
+    return stored
+
+
+def lap_channels(season: int, round_number: int, session_type: str, driver: str,
+                 lap: Optional[int] = None, channels: Optional[list[str]] = None) -> dict[str, np.ndarray]:
+    """
+    Read-only, zero-copy views of a lap's telemetry channels (or of the
+    driver's whole session with lap None), for analysis code.
+
+    Raises:
+        LapNotFoundError: The driver or lap has no stored telemetry
+    """
+    stored = stored_session_telemetry(season, round_number, session_type)
+    samples = stored.slice(driver, lap, channels)
+    if samples is None:
+        what = f"lap {lap}" if lap is not None else "laps"
+        raise LapNotFoundError(f"No {what} for {driver} in {season} round {round_number} {session_type}")
+    return samples
+
+
+def _axis_values(samples: dict[str, np.ndarray], axis: str) -> np.ndarray:
+    """Distance covered in metres (integrated from speed), or seconds since the first sample."""
+    session_time = samples["session_time_ms"]
+    seconds = (session_time - session_time[0]) / 1000.0
+    if axis == "time":
+        return seconds
+    speed = samples["speed"].astype(np.float64) / 3.6
+    # Trapezoidal integration of speed over time
+    step = np.diff(seconds) * (speed[1:] + speed[:-1]) / 2
+    return np.concatenate([[0.0], np.cumsum(step)])
+
+
+def _build_trace(season: int, round_number: int, session_type: str, driver: str, lap: Optional[int],
+                 points: int, method: str, axis: str) -> dict:
+    with span("telemetry slice", season=season, round=round_number, session_type=session_type, driver=driver):
+        stored = stored_session_telemetry(season, round_number, session_type)
+        samples = stored.slice(driver, lap, ["session_time_ms", *TRACE_CHANNELS])
+    count = len(samples["session_time_ms"]) if samples is not None else 0
+    if count == 0:
+        raise LapNotFoundError(f"No car data samples for {driver} in {season} round {round_number} {session_type}")
+
+    with span("telemetry downsample", samples=count, points=points, method=method):
+        x = _axis_values(samples, axis)
+        traces = {}
+        for channel in TRACE_CHANNELS:
+            trace_x, trace_y = downsample(x, samples[channel].astype(np.float64), points, method)
+            traces[channel] = {
+                "x": np.round(trace_x, 3).tolist(),
+                "y": np.round(trace_y, 1).tolist(),
+            }
+    info = stored.lap_info(driver, lap) if lap is not None else {"lap_time_ms": None, "compound": None}
+    return {
+        "season": season,
+        "round": round_number,
+        "session": session_type,
+        "driver": driver,
+        "lap": lap,
+        "method": method,
+        "axis": axis,
+        "points": points,
+        "samples": count,
+        **info,
+        "traces": traces,
+    }
+
+
+def cached_lap_traces(season: int, round_number: int, session_type: str, driver: str, lap: Optional[int] = None,
+                      points: int = 500, method: str = "lttb", axis: str = "distance") -> Optional[dict]:
+    """The cached trace for a lap and resolution, or None, without loading any telemetry."""
+    trace = trace_cache.read(season, round_number, session_type, driver.upper(), lap, points, method, axis)
+    if trace is not None:
+        CACHE_REQUESTS.labels(cache="telemetry", result="hit").inc()
+    return trace
+
+
+def get_lap_traces(season: int, round_number: int, session_type: str, driver: str, lap: Optional[int] = None,
+                   points: int = 500, method: str = "lttb", axis: str = "distance") -> dict:
+    """
+    Speed, throttle and brake traces of one lap, or of the driver's whole
+    session, each downsampled to about `points` samples.
+
+    Served from the on-disk trace cache when this resolution was built before,
+    otherwise built from the memory-mapped telemetry store, which loads the
+    session from FastF1 only the first time.
+
+    Args:
+        season: Season year
+        round_number: Round of the event
+        session_type: Session identifier, e.g. "R" or "Q"
+        driver: 3-letter driver code
+        lap: Lap number, or None for all of the driver's laps
+        points: Target samples per channel
+        method: "lttb" or "minmax"
+        axis: "distance" (metres) or "time" (seconds since the first sample)
+
+    Returns:
+        Dict with the lap's identity, lap time and per-channel x/y arrays
+    """
+    key = (season, round_number, session_type, driver.upper(), lap, points, method, axis)
+    trace = cached_lap_traces(*key)
+    if trace is not None:
+        return trace
+
+    CACHE_REQUESTS.labels(cache="telemetry", result="miss").inc()
+    trace = _build_trace(*key)
+    trace_cache.write(trace, *key)
+    return trace
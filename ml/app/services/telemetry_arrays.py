@@ -0,0 +1,230 @@
+"""Memory-mapped NumPy store of per-session car telemetry, with a lap index."""
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+import numpy as np
+import pandas as pd
+from app.config import TELEMETRY_ARRAY_DIR, TELEMETRY_ARRAY_OPEN_SESSIONS
+from app.services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Bump when TELEMETRY_CHANNELS or the index layout changes
+TELEMETRY_ARRAY_VERSION = 1
+INDEX_FILE = "index.json"
+
+# Channel -> (FastF1 car data column, stored dtype)
+TELEMETRY_CHANNELS = {
+    "session_time_ms": ("SessionTime", "int32"),
+    "speed": ("Speed", "float32"),
+    "throttle": ("Throttle", "float32"),
+    "brake": ("Brake", "bool"),
+    "rpm": ("RPM", "float32"),
+    "gear": ("nGear", "int8"),
+    "drs": ("DRS", "int8"),
+}
+
+
+def _channel_values(car_data: pd.DataFrame, channel: str) -> np.ndarray:
+    column, dtype = TELEMETRY_CHANNELS[channel]
+    values = car_data[column]
+    if channel == "session_time_ms":
+        values = (values.dt.total_seconds() * 1000).round()
+    return pd.to_numeric(values, errors="coerce").fillna(0).to_numpy().astype(dtype)
+
+
+class StoredTelemetry:
+    """
+    A stored session: one read-only memory map per channel holding every
+    driver's samples back to back, plus the index of driver and lap ranges.
+
+    Slices are views into the maps, so reading a lap copies nothing and the
+    pages are shared with other processes mapping the same files.
+    """
+
+    def __init__(self, directory: Path, index: dict):
+        self.directory = directory
+        self.index = index
+        self._channels: dict[str, np.ndarray] = {}
+
+    def channel(self, name: str) -> np.ndarray:
+        if name not in self._channels:
+            self._channels[name] = np.load(self.directory / f"{name}.npy", mmap_mode="r")
+        return self._channels[name]
+
+    def drivers(self) -> list[str]:
+        return list(self.index["drivers"])
+
+    def lap_range(self, driver: str, lap: Optional[int] = None) -> Optional[tuple[int, int]]:
+        """Sample range of one lap, or of all the driver's laps with lap None."""
+        entry = self.index["drivers"].get(driver)
+        if entry is None:
+            return None
+        if lap is None:
+            return (entry["start"], entry["end"]) if entry["laps"] else None
+        bounds = entry["laps"].get(str(lap))
+        return (bounds["start"], bounds["end"]) if bounds else None
+
+    def lap_info(self, driver: str, lap: int) -> dict:
+        """Lap time and compound recorded for a lap."""
+        bounds = self.index["drivers"].get(driver, {}).get("laps", {}).get(str(lap), {})
+        return {"lap_time_ms": bounds.get("lap_time_ms"), "compound": bounds.get("compound")}
+
+    def slice(self, driver: str, lap: Optional[int] = None, channels: Optional[list[str]] = None) -> Optional[dict[str, np.ndarray]]:
+        """
+        Zero-copy views of a lap's (or the driver's whole session's) channels.
+
+        Returns:
+            Dict of channel -> read-only array, or None if the driver or lap is not stored
+        """
+        bounds = self.lap_range(driver, lap)
+        if bounds is None:
+            return None
+        start, end = bounds
+        return {name: self.channel(name)[start:end] for name in (channels or TELEMETRY_CHANNELS)}
+
+
+class TelemetryArrayStore:
+    """
+    Per-session directories of fixed-dtype .npy channel files:
+
+        v1/<season>/<round>_<session>/index.json
+        v1/<season>/<round>_<session>/<channel>.npy
+
+    The index maps each driver to its sample range and each lap to a
+    sub-range, with lap time and compound. A session directory is complete
+    once it exists: it is written under a temporary name and renamed.
+    Opened sessions are kept in a small LRU so their maps are reused.
+    """
+
+    def __init__(self, directory: str, max_open: int):
+        self.root = Path(directory) / f"v{TELEMETRY_ARRAY_VERSION}"
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._open: OrderedDict[tuple[int, int, str], StoredTelemetry] = OrderedDict()
+
+    def path(self, season: int, round_number: int, session_type: str) -> Path:
+        return self.root / str(season) / f"{round_number}_{session_type}"
+
+    def open(self, season: int, round_number: int, session_type: str) -> Optional[StoredTelemetry]:
+        """Map a stored session, or return None if it is not stored."""
+        key = (season, round_number, session_type)
+        with self._lock:
+            stored = self._open.get(key)
+            if stored is not None:
+                self._open.move_to_end(key)
+                return stored
+
+        directory = self.path(season, round_number, session_type)
+        try:
+            with open(directory / INDEX_FILE, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read telemetry index in {directory}: {e}")
+            return None
+        if index.get("version") != TELEMETRY_ARRAY_VERSION:
+            return None
+
+        stored = StoredTelemetry(directory, index)
+        with self._lock:
+            self._open[key] = stored
+            while len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+        return stored
+
+    def write(self, season: int, round_number: int, session_type: str, laps: pd.DataFrame, car_data: dict) -> int:
+        """
+        Store a session's car data, one contiguous range per driver.
+
+        Args:
+            laps: Session laps (Driver, DriverNumber, LapNumber, LapStartTime, Time, LapTime, Compound)
+            car_data: Driver number -> FastF1 car data, as in Session.car_data
+
+        Returns:
+            Number of samples stored (0, and nothing written, if no driver has car data)
+        """
+        drivers = {}
+        frames = []
+        offset = 0
+        for (code, number), driver_laps in laps.groupby(["Driver", "DriverNumber"], sort=True, observed=True):
+            try:
+                samples = car_data[str(number)]
+            except KeyError:
+                continue
+            samples = samples.sort_values("SessionTime")
+            session_time = samples["SessionTime"].to_numpy()
+            starts = np.searchsorted(session_time, driver_laps["LapStartTime"].to_numpy(), side="left")
+            ends = np.searchsorted(session_time, driver_laps["Time"].to_numpy(), side="left")
+            lap_times = (driver_laps["LapTime"].dt.total_seconds() * 1000).round()
+            compounds = driver_laps["Compound"] if "Compound" in driver_laps else pd.Series(None, index=driver_laps.index)
+            lap_entries = {}
+            for lap_number, start, end, lap_time, compound in zip(
+                driver_laps["LapNumber"], starts, ends, lap_times, compounds
+            ):
+                if pd.isna(lap_number):
+                    continue
+                lap_entries[str(int(lap_number))] = {
+                    "start": offset + int(start),
+                    "end": offset + int(end),
+                    "lap_time_ms": int(lap_time) if pd.notna(lap_time) else None,
+                    "compound": compound if pd.notna(compound) else None,
+                }
+            drivers[str(code)] = {
+                "number": str(number),
+                "start": offset + int(starts.min()) if len(starts) else offset,
+                "end": offset + int(ends.max()) if len(ends) else offset,
+                "laps": lap_entries,
+            }
+            frames.append(samples)
+            offset += len(samples)
+
+        directory = self.path(season, round_number, session_type)
+        if offset == 0:
+            # An empty directory would count as a stored session and never be
+            # reloaded; leave nothing behind so a later request tries again
+            logger.warning(f"No car data matched the laps of {season} round {round_number} {session_type}; not stored")
+            return 0
+        tmp_directory = directory.with_name(f".{directory.name}.{uuid.uuid4().hex}.tmp")
+        with span("telemetry arrays write", season=season, round=round_number, session_type=session_type, samples=offset):
+            tmp_directory.mkdir(parents=True, exist_ok=True)
+            try:
+                combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+                    columns=[column for column, _ in TELEMETRY_CHANNELS.values()]
+                )
+                for channel in TELEMETRY_CHANNELS:
+                    np.save(tmp_directory / f"{channel}.npy", _channel_values(combined, channel))
+                index = {
+                    "version": TELEMETRY_ARRAY_VERSION,
+                    "season": season,
+                    "round": round_number,
+                    "session": session_type,
+                    "samples": offset,
+                    "channels": {channel: dtype for channel, (_, dtype) in TELEMETRY_CHANNELS.items()},
+                    "drivers": drivers,
+                }
+                with open(tmp_directory / INDEX_FILE, "w", encoding="utf-8") as f:
+                    json.dump(index, f, separators=(",", ":"))
+                try:
+                    os.rename(tmp_directory, directory)
+                except OSError:
+                    # Another worker stored the session first; keep its copy
+                    logger.info(f"Telemetry arrays for {season} round {round_number} {session_type} already stored")
+            finally:
+                shutil.rmtree(tmp_directory, ignore_errors=True)
+        return offset
+
+    def clear(self) -> None:
+        """Forget opened sessions; files on disk are kept."""
+        with self._lock:
+            self._open.clear()
+
+
+telemetry_arrays = TelemetryArrayStore(TELEMETRY_ARRAY_DIR, TELEMETRY_ARRAY_OPEN_SESSIONS)
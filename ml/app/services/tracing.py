@@ -0,0 +1,134 @@
+"""Tracing spans for the sync pipeline, exported to an in-process buffer."""
+import contextvars
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence
+from opentelemetry import trace
+from app.config import SERVICE_NAME, SERVICE_VERSION, TRACE_BUFFER_SIZE
+from app.services.lazy import Lazy
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import ReadableSpan
+    from opentelemetry.sdk.trace.export import SpanExportResult
+
+# Attributes copied from the enclosing span when a child does not set them
+INHERITED_ATTRIBUTES = ("season", "event")
+
+
+class RecentSpanExporter:
+    """
+    Keeps the most recent finished spans in memory, grouped into traces on read.
+
+    Implements the OpenTelemetry SpanExporter interface without subclassing
+    it, so the SDK is only imported once the first span is started.
+    """
+
+    def __init__(self, max_spans: int):
+        self._spans: deque["ReadableSpan"] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence["ReadableSpan"]) -> "SpanExportResult":
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        with self._lock:
+            self._spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def traces(self, limit: int = 20) -> list[dict]:
+        """The most recent traces, newest first, each with its spans in start order."""
+        with self._lock:
+            spans = list(self._spans)
+
+        by_trace: dict[int, list["ReadableSpan"]] = {}
+        for finished in spans:
+            by_trace.setdefault(finished.context.trace_id, []).append(finished)
+
+        traces = []
+        for trace_id, trace_spans in by_trace.items():
+            trace_spans.sort(key=lambda s: s.start_time)
+            span_ids = {s.context.span_id for s in trace_spans}
+            # The root is the span without a parent in the buffer (older spans may have been dropped)
+            root = next((s for s in trace_spans if s.parent is None or s.parent.span_id not in span_ids), trace_spans[0])
+            trace_start = trace_spans[0].start_time
+            trace_end = max(s.end_time for s in trace_spans)
+            traces.append({
+                "trace_id": format(trace_id, "032x"),
+                "name": root.name,
+                "start": _timestamp(trace_start),
+                "duration_ms": (trace_end - trace_start) / 1e6,
+                "spans": [_span_dict(s, trace_start) for s in trace_spans],
+            })
+
+        traces.sort(key=lambda t: t["start"], reverse=True)
+        return traces[:limit]
+
+
+def _timestamp(nanoseconds: int) -> str:
+    return datetime.fromtimestamp(nanoseconds / 1e9, tz=timezone.utc).isoformat()
+
+
+def _span_dict(finished: "ReadableSpan", trace_start: int) -> dict:
+    return {
+        "name": finished.name,
+        "span_id": format(finished.context.span_id, "016x"),
+        "parent_id": format(finished.parent.span_id, "016x") if finished.parent else None,
+        "offset_ms": (finished.start_time - trace_start) / 1e6,
+        "duration_ms": (finished.end_time - finished.start_time) / 1e6,
+        "status": finished.status.status_code.name,
+        "attributes": dict(finished.attributes or {}),
+    }
+
+
+span_exporter = RecentSpanExporter(TRACE_BUFFER_SIZE)
+
+
+def _create_tracer_provider():
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME, "service.version": SERVICE_VERSION})
+    )
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    return provider
+
+
+# Further processors (e.g. an OTLP exporter) can be attached to this provider
+tracer_provider = Lazy("tracer provider", _create_tracer_provider)
+tracer = Lazy("tracer", lambda: tracer_provider.get().get_tracer(__name__))
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[trace.Span]:
+    """
+    Run the enclosed block in a child span of the current span.
+
+    None-valued attributes are dropped; season and event default to the
+    enclosing span's values. Exceptions are recorded on the span and re-raised.
+    """
+    parent_attributes = getattr(trace.get_current_span(), "attributes", None) or {}
+    for key in INHERITED_ATTRIBUTES:
+        if attributes.get(key) is None and key in parent_attributes:
+            attributes[key] = parent_attributes[key]
+    with tracer.get().start_as_current_span(
+        name, attributes={k: v for k, v in attributes.items() if v is not None}
+    ) as current:
+        yield current
+
+
+def bind_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap fn to run in a copy of the caller's context, so spans started on a
+    worker thread attach to the caller's trace.
+    """
+    return functools.partial(contextvars.copy_context().run, fn)
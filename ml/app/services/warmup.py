@@ -0,0 +1,36 @@
+"""Optional background warm-up of lazily initialized resources."""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up() -> None:
+    """
+    Import the FastF1 service and initialize the FastF1 cache and database engines.
+
+    Each step is independent; a failure is logged and the resource is left to
+    initialize on first use instead.
+    """
+    start = time.perf_counter()
+    try:
+        import app.services.fastf1_service  # noqa: F401  (fastf1, pandas, numpy)
+        from app.services.session_cache import fastf1_cache
+        fastf1_cache.get()
+    except Exception as e:
+        logger.warning(f"FastF1 warm-up failed: {e}")
+    try:
+        from app.db import async_engine, engine
+        engine.get()
+        async_engine.get()
+    except Exception as e:
+        logger.warning(f"Database engine warm-up failed: {e}")
+    logger.info(f"Warm-up finished in {time.perf_counter() - start:.2f}s")
+
+
+def start_warm_up() -> threading.Thread:
+    """Run warm_up in a daemon thread so it never delays serving requests."""
+    thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
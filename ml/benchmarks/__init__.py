@@ -0,0 +1 @@
+"""Microbenchmarks for the ML service."""
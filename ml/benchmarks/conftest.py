@@ -0,0 +1,130 @@
+"""
+Shared fixtures for the benchmark suite.
+
+FastF1 and Ergast are replayed from benchmarks/fixtures, so the suite runs
+offline. Benchmarks that touch the database need a throwaway Postgres
+database in BENCH_DATABASE_URL; its public schema is recreated from the
+Prisma migrations and seeded from the fixtures. Without it they are skipped.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+# Must be set before app.config is imported
+_STATE_DIR = Path(tempfile.mkdtemp(prefix="f1-bench-"))
+os.environ["FASTF1_CACHE_DIR"] = str(_STATE_DIR / "fastf1")
+os.environ["SESSION_INDEX_PATH"] = str(_STATE_DIR / "session_index.json")
+os.environ["WARMUP_ON_STARTUP"] = "false"
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL")
+if BENCH_DATABASE_URL:
+    os.environ["DATABASE_URL"] = BENCH_DATABASE_URL
+
+import json
+import pytest
+from benchmarks.replay import Replay
+
+SEASON = 2024
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "backend" / "prisma" / "migrations"
+
+
+@pytest.fixture(scope="session")
+def replay():
+    """FastF1 and Ergast served from recorded fixtures for the whole session."""
+    with Replay().install() as active:
+        yield active
+
+
+def _seed_results(connection, replay: Replay, season: int) -> None:
+    """Insert circuits, races, drivers, constructors and race results for a replayed season."""
+    from sqlalchemy import text
+
+    season_dir = replay.season_dir(season)
+    final_standings = json.loads((season_dir / "ergast" / "driver_standings.json").read_text())["content"][-1]
+    constructor_of = {row["driverId"]: (row["constructorIds"][0], row["constructorNames"][0]) for row in final_standings}
+
+    for driver_id, (constructor_id, constructor_name) in constructor_of.items():
+        connection.execute(text("""
+            INSERT INTO constructors (id, constructor_id, name, nationality, updated_at)
+            VALUES (:id, :constructor_id, :name, '', NOW()) ON CONFLICT DO NOTHING
+        """), {"id": f"c_{constructor_id}", "constructor_id": constructor_id, "name": constructor_name})
+
+    schedule = replay.get_event_schedule(season)
+    for _, event in schedule[schedule["RoundNumber"] > 0].iterrows():
+        round_number = int(event["RoundNumber"])
+        race_id = f"{season}_{round_number}"
+        connection.execute(text("""
+            INSERT INTO circuits (id, circuit_id, name, location, country, updated_at)
+            VALUES (:id, :id, :location, :location, :country, NOW()) ON CONFLICT DO NOTHING
+        """), {"id": event["Location"], "location": event["Location"], "country": event["Country"]})
+        connection.execute(text("""
+            INSERT INTO races (id, season, round, race_name, circuit_id, date, updated_at)
+            VALUES (:id, :season, :round, :name, :circuit, :date, NOW())
+        """), {
+            "id": race_id, "season": season, "round": round_number, "name": event["EventName"],
+            "circuit": event["Location"], "date": event["EventDate"].to_pydatetime(),
+        })
+        session = replay.get_session(season, event["EventName"], "R")
+        for row in session.results.to_dict("records"):
+            # No code: the driver sync would otherwise replace these rows by code
+            # and trip the race_results foreign key
+            connection.execute(text("""
+                INSERT INTO drivers (id, driver_id, forename, surname, nationality, updated_at)
+                VALUES (:id, :driver_id, :forename, :surname, :nationality, NOW()) ON CONFLICT DO NOTHING
+            """), {
+                "id": f"d_{row['DriverId']}", "driver_id": row["DriverId"], "forename": row["FirstName"],
+                "surname": row["LastName"], "nationality": row["CountryCode"],
+            })
+            connection.execute(text("""
+                INSERT INTO race_results (id, race_id, driver_id, constructor_id, position, points, grid, status, updated_at)
+                VALUES (:id, :race_id, :driver_id, :constructor_id, :position, :points, :grid, :status, NOW())
+            """), {
+                "id": f"{race_id}_{row['DriverId']}", "race_id": race_id, "driver_id": f"d_{row['DriverId']}",
+                "constructor_id": f"c_{constructor_of[row['DriverId']][0]}", "position": row["Position"],
+                "points": row["Points"], "grid": row["GridPosition"], "status": row["Status"],
+            })
+
+
+@pytest.fixture(scope="session")
+def database(replay):
+    """Engine on a freshly migrated and seeded BENCH_DATABASE_URL database."""
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL is not set")
+    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
+    from app.db import engine
+
+    database_name = make_url(BENCH_DATABASE_URL).database or ""
+    if "bench" not in database_name and "test" not in database_name:
+        pytest.exit(f"Refusing to reset database {database_name!r}: name must contain 'bench' or 'test'")
+
+    bench_engine = engine.get()
+    with bench_engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+        for migration in sorted(MIGRATIONS_DIR.glob("*/migration.sql")):
+            connection.exec_driver_sql(migration.read_text())
+        _seed_results(connection, replay, SEASON)
+    return bench_engine
+
+
+@pytest.fixture
+def db_session(database):
+    """Session on the benchmark database, rolled back afterwards."""
+    from app.db import get_db_session
+
+    session = get_db_session()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def client(replay):
+    """Test client for the app, kept open so the async engine stays on one event loop."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,388 @@
+"""
+Offline replay of FastF1 and Ergast data from recorded fixtures.
+
+Fixtures live in benchmarks/fixtures/<season>/:
+
+    schedule.json                   event schedule (fastf1.get_event_schedule)
+    sessions/<round>_<type>.json    session drivers and results
+    ergast/driver_standings.json    Ergast driver standings, one table per round
+    ergast/constructor_standings.json
+
+Record a season from the live APIs (needs network access), from ml/:
+    python -m benchmarks.replay record 2024 --session-types R Q
+
+Inside `with Replay().install():` fastf1.get_event_schedule, fastf1.get_session
+and the service's Ergast client serve fixture data instead of the network.
+Laps and telemetry are not recorded: sessions loaded with laps=True get
+deterministic synthetic laps derived from their results, and telemetry=True
+adds synthetic 10 Hz car data following those laps.
+The persistent Ergast, snapshot, lap and telemetry stores are not cleared; benchmarks that
+need them cold remove their directories.
+"""
+import argparse
+import json
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator, Optional
+import numpy as np
+import pandas as pd
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+SCHEDULE_COLUMNS = ["RoundNumber", "Country", "Location", "EventName", "EventDate", "EventFormat"]
+RESULT_COLUMNS = [
+    "DriverNumber", "Abbreviation", "DriverId", "TeamName", "TeamId", "FirstName", "LastName",
+    "FullName", "CountryCode", "Position", "GridPosition", "Status", "Points",
+    "Laps", "Time", "Q1", "Q2", "Q3",
+]
+# Stored as ISO 8601 durations
+TIMEDELTA_COLUMNS = ["Time", "Q1", "Q2", "Q3"]
+DRIVER_STANDINGS_COLUMNS = [
+    "position", "points", "wins", "driverId", "driverNumber", "driverCode",
+    "givenName", "familyName", "constructorIds", "constructorNames",
+]
+CONSTRUCTOR_STANDINGS_COLUMNS = ["position", "points", "wins", "constructorId", "constructorName"]
+
+
+def _write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, default=str))
+
+
+def _read_json(path: Path):
+    return json.loads(path.read_text())
+
+
+def _session_path(season_dir: Path, round_number: int, session_type: str) -> Path:
+    return season_dir / "sessions" / f"{round_number:02d}_{session_type}.json"
+
+
+def _json_records(frame: pd.DataFrame, columns: list[str]) -> list[dict]:
+    frame = frame.reindex(columns=columns)
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def synthetic_laps(results: pd.DataFrame, session_type: str, seed: int) -> pd.DataFrame:
+    """
+    Laps in FastF1's column layout, consistent with a session's results.
+
+    Races get a one-stop strategy per driver with fuel burn-off,
+    tyre degradation and noise; qualifying gets an out, flying and in lap per
+    segment reached, the flying lap matching the recorded Q1/Q2/Q3 time.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    if session_type == "R":
+        winner = results[results["Position"] == 1]
+        total_laps = int(results["Laps"].max())
+        base = winner["Time"].iloc[0].total_seconds() / total_laps if not winner.empty else 90.0
+        for _, row in results.iterrows():
+            laps = int(row["Laps"]) if pd.notna(row["Laps"]) else 0
+            if laps == 0:
+                continue
+            lap_number = np.arange(1, laps + 1)
+            pit_lap = int(total_laps * rng.uniform(0.35, 0.6))
+            stint = np.where(lap_number <= pit_lap, 1, 2)
+            tyre_life = np.where(stint == 1, lap_number, lap_number - pit_lap)
+            degradation = np.where(stint == 1, 0.06, 0.03) * tyre_life
+            fuel = 0.035 * (total_laps - lap_number)
+            seconds = base - 0.035 * total_laps / 2 + 0.05 * (row["Position"] - 1) + fuel + degradation
+            seconds += rng.normal(0, 0.2, laps)
+            seconds += np.select([lap_number == 1, lap_number == pit_lap, lap_number == pit_lap + 1], [3.0, 3.0, 19.0], 0.0)
+            frames.append(pd.DataFrame({
+                "Driver": row["Abbreviation"],
+                "DriverNumber": row["DriverNumber"],
+                "Team": row["TeamName"],
+                "LapNumber": lap_number.astype(float),
+                "Stint": stint.astype(float),
+                "LapSeconds": seconds,
+                "Compound": np.where(stint == 1, "MEDIUM", "HARD"),
+                "TyreLife": tyre_life.astype(float),
+                "PitIn": lap_number == pit_lap,
+                "PitOut": lap_number == pit_lap + 1,
+                "IsAccurate": (lap_number > 1) & (lap_number != pit_lap) & (lap_number != pit_lap + 1),
+                "Start": 3600.0,
+            }))
+    else:
+        for index, row in results.reset_index(drop=True).iterrows():
+            for segment, column in enumerate(("Q1", "Q2", "Q3")):
+                if column not in results or pd.isna(row[column]):
+                    continue
+                flying = row[column].total_seconds()
+                frames.append(pd.DataFrame({
+                    "Driver": row["Abbreviation"],
+                    "DriverNumber": row["DriverNumber"],
+                    "Team": row["TeamName"],
+                    "LapNumber": np.arange(3 * segment + 1, 3 * segment + 4, dtype=float),
+                    "Stint": float(segment + 1),
+                    "LapSeconds": [flying * 1.35, flying, flying * 1.45],
+                    "Compound": "SOFT",
+                    "TyreLife": [1.0, 2.0, 3.0],
+                    "PitIn": [False, False, True],
+                    "PitOut": [True, False, False],
+                    "IsAccurate": [False, True, False],
+                    "Start": 3600.0 + 1200.0 * segment + 25.0 * (index % 8),
+                }))
+    if not frames:
+        return pd.DataFrame(columns=["Driver", "Team"])
+
+    laps = pd.concat(frames, ignore_index=True)
+    driver = laps.groupby("Driver", sort=False)
+    end = laps["Start"] + driver["LapSeconds"].cumsum()
+    lap_time = pd.to_timedelta(laps["LapSeconds"], unit="s")
+    laps["Time"] = pd.to_timedelta(end, unit="s")
+    laps["LapStartTime"] = laps["Time"] - lap_time
+    laps["LapTime"] = lap_time
+    for number, share in enumerate((0.31, 0.38, 0.31), start=1):
+        laps[f"Sector{number}Time"] = lap_time * share
+    laps["PitInTime"] = laps["Time"].where(laps["PitIn"])
+    laps["PitOutTime"] = (laps["LapStartTime"] + pd.Timedelta(seconds=20)).where(laps["PitOut"])
+    laps["FreshTyre"] = True
+    laps["TrackStatus"] = "1"
+    laps["Deleted"] = False
+    best_so_far = laps["LapSeconds"].where(laps["IsAccurate"]).groupby(laps["Driver"]).cummin()
+    laps["IsPersonalBest"] = laps["IsAccurate"] & (laps["LapSeconds"] == best_so_far)
+    laps["Position"] = end.groupby(laps["LapNumber"]).rank(method="first") if session_type == "R" else np.nan
+    return laps.drop(columns=["LapSeconds", "PitIn", "PitOut", "Start"])
+
+
+def synthetic_car_data(laps: pd.DataFrame, seed: int, hz: float = 10.0) -> pd.DataFrame:
+    """
+    Car data in FastF1's column layout for one driver's laps: speed oscillates
+    through a fixed sequence of corners per lap, throttle follows speed and the
+    brake is on while the car decelerates hard.
+    """
+    rng = np.random.default_rng(seed)
+    start = laps["LapStartTime"].min().total_seconds()
+    end = laps["Time"].max().total_seconds()
+    session_time = np.arange(start, end, 1.0 / hz)
+    starts = laps["LapStartTime"].dt.total_seconds().to_numpy()
+    durations = laps["LapTime"].dt.total_seconds().to_numpy()
+    lap_index = np.clip(np.searchsorted(starts, session_time, side="right") - 1, 0, len(starts) - 1)
+    phase = (session_time - starts[lap_index]) / durations[lap_index]
+    speed = 205 + 95 * np.sin(2 * np.pi * 9 * phase) * np.cos(2 * np.pi * 2 * phase) + rng.normal(0, 2, len(phase))
+    speed = np.clip(speed, 70, 340)
+    deceleration = -np.gradient(speed) * hz
+    return pd.DataFrame({
+        "SessionTime": pd.to_timedelta(session_time, unit="s"),
+        "Time": pd.to_timedelta(session_time - start, unit="s"),
+        "RPM": (6000 + 18 * speed).round(),
+        "Speed": speed.round(1),
+        "nGear": np.clip((speed // 45) + 1, 1, 8).astype(int),
+        "Throttle": np.clip((speed - 90) / 1.6 - deceleration, 0, 100).round(),
+        "Brake": deceleration > 25,
+        "DRS": 0,
+        "Source": "car",
+    })
+
+
+class _CarData(dict):
+    """Driver number -> car data, synthesized on first access."""
+
+    def __init__(self, laps: pd.DataFrame, seed: int):
+        super().__init__()
+        self._laps = laps
+        self._seed = seed
+
+    def __missing__(self, driver_number: str) -> pd.DataFrame:
+        laps = self._laps[self._laps["DriverNumber"] == driver_number]
+        if laps.empty:
+            raise KeyError(driver_number)
+        self[driver_number] = synthetic_car_data(laps, self._seed + int(driver_number))
+        return self[driver_number]
+
+
+def save_schedule(season_dir: Path, schedule: pd.DataFrame) -> None:
+    """Write an event schedule fixture."""
+    _write_json(season_dir / "schedule.json", _json_records(schedule, SCHEDULE_COLUMNS))
+
+
+def save_session(season_dir: Path, round_number: int, event_name: str, session_type: str,
+                 drivers: list[str], results: pd.DataFrame) -> None:
+    """Write a session fixture (drivers and results)."""
+    _write_json(_session_path(season_dir, round_number, session_type), {
+        "event": event_name,
+        "session_type": session_type,
+        "drivers": [str(d) for d in drivers],
+        "results": _json_records(results, RESULT_COLUMNS),
+    })
+
+
+def save_standings(season_dir: Path, name: str, rounds: list[int], tables: list[pd.DataFrame], columns: list[str]) -> None:
+    """Write an Ergast standings fixture: one table per round."""
+    _write_json(season_dir / "ergast" / f"{name}.json", {
+        "rounds": rounds,
+        "content": [_json_records(table, columns) for table in tables],
+    })
+
+
+class ReplaySession:
+    """Stands in for a loaded fastf1.core.Session."""
+
+    def __init__(self, year: int, data: dict):
+        self.year = year
+        self.event = data["event"]
+        self.name = data["session_type"]
+        self.drivers = data["drivers"]
+        self.results = pd.DataFrame(data["results"])
+        for column in TIMEDELTA_COLUMNS:
+            if column in self.results:
+                self.results[column] = pd.to_timedelta(self.results[column])
+        self.laps = pd.DataFrame(columns=["Driver", "Team"])
+        self._seed = zlib.crc32(f"{year}|{self.event}|{self.name}".encode())
+
+    def load(self, laps: bool = True, telemetry: bool = True, **kwargs) -> None:
+        """Results are already in memory; laps and car data are synthesized on the first load that asks for them."""
+        if (laps or telemetry) and self.laps.empty:
+            self.laps = synthetic_laps(self.results, self.name, self._seed)
+        if telemetry and not hasattr(self, "car_data"):
+            self.car_data = _CarData(self.laps, self._seed)
+
+
+class ReplayErgast:
+    """Stands in for fastf1.ergast.Ergast for the standings endpoints."""
+
+    def __init__(self, replay: "Replay"):
+        self._replay = replay
+
+    def _standings(self, name: str, season: int, round: Optional[int] = None) -> Optional[SimpleNamespace]:
+        """Like Ergast: the latest round's standings, or the given round's."""
+        path = self._replay.season_dir(season) / "ergast" / f"{name}.json"
+        if not path.exists():
+            return None
+        data = _read_json(path)
+        rounds = [int(r) for r in data["rounds"]]
+        if round is not None and int(round) not in rounds:
+            return SimpleNamespace(description=pd.DataFrame({"season": [], "round": []}), content=[])
+        index = len(rounds) - 1 if round is None else rounds.index(int(round))
+        return SimpleNamespace(
+            description=pd.DataFrame({"season": [season], "round": [rounds[index]]}),
+            content=[pd.DataFrame(data["content"][index])],
+        )
+
+    def get_driver_standings(self, season: int, round: Optional[int] = None, **kwargs) -> Optional[SimpleNamespace]:
+        return self._standings("driver_standings", season, round)
+
+    def get_constructor_standings(self, season: int, round: Optional[int] = None, **kwargs) -> Optional[SimpleNamespace]:
+        return self._standings("constructor_standings", season, round)
+
+
+class Replay:
+    """Serves recorded fixtures in place of the FastF1 and Ergast network APIs."""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR):
+        self.fixtures_dir = Path(fixtures_dir)
+        self._sessions: dict[tuple[int, str, str], dict] = {}
+
+    def season_dir(self, year: int) -> Path:
+        return self.fixtures_dir / str(year)
+
+    def seasons(self) -> list[int]:
+        """Seasons with a recorded schedule."""
+        return sorted(int(p.parent.name) for p in self.fixtures_dir.glob("*/schedule.json"))
+
+    def get_event_schedule(self, year: int, **kwargs) -> pd.DataFrame:
+        path = self.season_dir(year) / "schedule.json"
+        if not path.exists():
+            return pd.DataFrame(columns=SCHEDULE_COLUMNS)
+        schedule = pd.DataFrame(_read_json(path))
+        schedule["EventDate"] = pd.to_datetime(schedule["EventDate"])
+        return schedule
+
+    def _session_data(self, year: int, event_name: str, session_type: str) -> dict:
+        key = (year, event_name, session_type)
+        if key not in self._sessions:
+            schedule = self.get_event_schedule(year)
+            event = schedule[schedule["EventName"] == event_name]
+            path = None
+            if not event.empty:
+                path = _session_path(self.season_dir(year), int(event["RoundNumber"].iloc[0]), session_type)
+            if path is None or not path.exists():
+                raise ValueError(f"No recorded session {year} {event_name} {session_type}")
+            self._sessions[key] = _read_json(path)
+        return self._sessions[key]
+
+    def get_session(self, year: int, event_name: str, session_type: str) -> ReplaySession:
+        return ReplaySession(year, self._session_data(year, event_name, session_type))
+
+    @contextmanager
+    def install(self) -> Iterator["Replay"]:
+        """Route FastF1 and Ergast calls to the fixtures, clearing in-process caches on entry and exit."""
+        import fastf1
+        import app.services.fastf1_service as fastf1_service
+        from app.services.lazy import Lazy
+
+        patches = [
+            (fastf1, "get_event_schedule", self.get_event_schedule),
+            (fastf1, "get_session", self.get_session),
+            (fastf1_service, "ergast_client", Lazy("replay Ergast client", lambda: ReplayErgast(self))),
+        ]
+        originals = [(target, name, getattr(target, name)) for target, name, _ in patches]
+        reset_caches()
+        for target, name, replacement in patches:
+            setattr(target, name, replacement)
+        try:
+            yield self
+        finally:
+            for target, name, original in originals:
+                setattr(target, name, original)
+            reset_caches()
+
+
+def reset_caches() -> None:
+    """Drop the service's in-process caches: sessions, schedules, discovery, Ergast and open telemetry maps."""
+    from app.services.ergast_cache import ergast_cache
+    from app.services.session_cache import discovery_cache, schedule_cache, session_cache, telemetry_session_cache
+    from app.services.telemetry_arrays import telemetry_arrays
+
+    for cache in (schedule_cache, session_cache, discovery_cache, telemetry_session_cache, ergast_cache, telemetry_arrays):
+        cache.clear()
+
+
+def record(season: int, session_types: list[str], fixtures_dir: Path = FIXTURES_DIR) -> None:
+    """Capture a season's schedule, sessions and Ergast standings from the live APIs."""
+    import fastf1
+    from fastf1.ergast import Ergast
+    from app.services.fastf1_service import fetch_standings_rounds
+    from app.services.session_cache import fastf1_cache
+
+    fastf1_cache.get()
+    season_dir = Path(fixtures_dir) / str(season)
+    schedule = fastf1.get_event_schedule(season)
+    save_schedule(season_dir, schedule)
+
+    for _, event in schedule.iterrows():
+        if int(event["RoundNumber"]) == 0:
+            continue
+        for session_type in session_types:
+            try:
+                session = fastf1.get_session(season, event["EventName"], session_type)
+                session.load(laps=False, telemetry=False, weather=False, messages=False)
+            except Exception as e:
+                print(f"skipped {event['EventName']} {session_type}: {e}")
+                continue
+            save_session(season_dir, int(event["RoundNumber"]), event["EventName"], session_type,
+                         session.drivers, session.results)
+            print(f"recorded {event['EventName']} {session_type}")
+
+    ergast = Ergast()
+    for name, fetch, columns in (
+        ("driver_standings", ergast.get_driver_standings, DRIVER_STANDINGS_COLUMNS),
+        ("constructor_standings", ergast.get_constructor_standings, CONSTRUCTOR_STANDINGS_COLUMNS),
+    ):
+        results = fetch_standings_rounds(fetch, season)
+        rounds = [int(r) for result in results for r in result.description["round"]]
+        save_standings(season_dir, name, rounds, [df for result in results for df in result.content], columns)
+        print(f"recorded {name} for {len(rounds)} rounds")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="capture a season from the live APIs")
+    record_parser.add_argument("season", type=int)
+    record_parser.add_argument("--session-types", nargs="+", default=["R", "Q"])
+    args = parser.parse_args()
+    record(args.season, args.session_types)
@@ -0,0 +1,126 @@
+"""
+Microbenchmark: Ergast standings extraction, iterrows vs vectorized.
+
+Builds synthetic multi-season Ergast standings responses and compares the
+previous row-by-row extraction with driver_standings_records /
+constructor_standings_records.
+
+Usage (from ml/):
+    python -m benchmarks.standings_extraction --seasons 10 --repeat 5
+"""
+import argparse
+import timeit
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+from app.services.fastf1_service import (
+    constructor_standings_records,
+    driver_standings_records,
+    normalize_constructor_id,
+)
+
+TEAM_NAMES = [
+    "Red Bull", "Ferrari", "Mercedes", "McLaren", "Aston Martin",
+    "Alpine F1 Team", "Williams", "Haas F1 Team", "RB F1 Team", "Sauber",
+]
+
+
+def make_result(rounds: int, entities: int, constructors: bool, seed: int) -> SimpleNamespace:
+    """Build an object shaped like an Ergast multi-response for one season."""
+    rng = np.random.default_rng(seed)
+    content = []
+    for _ in range(rounds):
+        frame = pd.DataFrame({
+            "position": np.arange(1, entities + 1),
+            "points": np.sort(rng.integers(0, 400, entities))[::-1].astype(float),
+            "wins": rng.integers(0, 5, entities),
+        })
+        if constructors:
+            frame["constructorId"] = [f"team_{i}" for i in range(entities)]
+            frame["constructorName"] = [TEAM_NAMES[i % len(TEAM_NAMES)] for i in range(entities)]
+        else:
+            frame["driverId"] = [f"Driver_{i}" for i in range(entities)]
+        content.append(frame)
+    description = pd.DataFrame({"round": [str(r) for r in range(1, rounds + 1)]})
+    return SimpleNamespace(description=description, content=content)
+
+
+def legacy_driver_records(result, season: int) -> list[dict]:
+    """Row-by-row extraction as previously done in fetch_driver_standings."""
+    standings_data = []
+    for i, standings_df in enumerate(result.content):
+        if standings_df.empty:
+            continue
+        round_num = int(result.description.iloc[i]['round'])
+        for _, row in standings_df.iterrows():
+            standings_data.append({
+                "season": season,
+                "round": round_num,
+                "driver_id": str(row['driverId']).lower(),
+                "position": int(row['position']),
+                "points": float(row['points']),
+                "wins": int(row['wins']),
+            })
+    return standings_data
+
+
+def legacy_constructor_records(result, season: int) -> list[dict]:
+    """Row-by-row extraction as previously done in fetch_constructor_standings."""
+    standings_data = []
+    for i, standings_df in enumerate(result.content):
+        if standings_df.empty:
+            continue
+        round_num = int(result.description.iloc[i]['round'])
+        for _, row in standings_df.iterrows():
+            constructor_name = str(row.get('constructorName', row.get('constructorId', '')))
+            standings_data.append({
+                "season": season,
+                "round": round_num,
+                "constructor_id": normalize_constructor_id(constructor_name),
+                "position": int(row['position']),
+                "points": float(row['points']),
+                "wins": int(row['wins']),
+            })
+    return standings_data
+
+
+def run(seasons: int, rounds: int, repeat: int) -> None:
+    """Time both implementations over all synthetic seasons and print a summary."""
+    first_season = 2026 - seasons + 1
+    driver_results = {
+        year: make_result(rounds, 20, constructors=False, seed=year) for year in range(first_season, 2027)
+    }
+    constructor_results = {
+        year: make_result(rounds, 10, constructors=True, seed=year) for year in range(first_season, 2027)
+    }
+
+    cases = [
+        ("driver", legacy_driver_records, driver_standings_records, driver_results),
+        ("constructor", legacy_constructor_records, constructor_standings_records, constructor_results),
+    ]
+    print(f"{seasons} season(s) x {rounds} rounds, best of {repeat}")
+    for name, legacy, vectorized, results in cases:
+        # Same records either way
+        for year, result in results.items():
+            assert legacy(result, year) == vectorized(result, year), f"{name} records differ for {year}"
+
+        legacy_time = min(timeit.repeat(
+            lambda: [legacy(r, y) for y, r in results.items()], number=1, repeat=repeat
+        ))
+        vectorized_time = min(timeit.repeat(
+            lambda: [vectorized(r, y) for y, r in results.items()], number=1, repeat=repeat
+        ))
+        print(
+            f"{name:<12} iterrows {legacy_time * 1000:8.1f} ms   "
+            f"vectorized {vectorized_time * 1000:8.1f} ms   "
+            f"speedup {legacy_time / vectorized_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.seasons, args.rounds, args.repeat)
@@ -0,0 +1,188 @@
+"""Benchmarks for the HTTP endpoints, end to end through the app."""
+import time
+from benchmarks.conftest import SEASON
+from benchmarks.replay import reset_caches
+
+ROUNDS = 3
+
+
+def _post(client, path: str, payload: dict) -> dict:
+    response = client.post(path, json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_health(benchmark, client):
+    response = benchmark(client.get, "/health")
+    assert response.status_code == 200
+
+
+def test_info(benchmark, client):
+    response = benchmark(client.get, "/api/sync/info")
+    assert response.status_code == 200
+
+
+def test_metrics(benchmark, client):
+    response = benchmark(client.get, "/metrics")
+    assert response.status_code == 200
+
+
+def test_drivers_debug(benchmark, client):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/drivers/debug", {"season": SEASON, "filter_confirmed": False}),
+        setup=reset_caches, rounds=ROUNDS,
+    )
+    assert body["drivers_count"] == 20
+
+
+def test_sync_drivers(benchmark, client, database):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/drivers", {"season": SEASON, "filter_confirmed": False}),
+        setup=reset_caches, rounds=ROUNDS,
+    )
+    assert body["success"] and body["drivers_synced"] == 20
+
+
+def test_sync_teams(benchmark, client, database):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/teams", {"season": SEASON}), setup=reset_caches, rounds=ROUNDS,
+    )
+    assert body["success"] and body["teams_synced"] == 10
+
+
+def test_sync_lineups(benchmark, client, database):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/lineups", {"season": SEASON}), setup=reset_caches, rounds=ROUNDS,
+    )
+    assert body["success"] and body["drivers_synced"] == 20 and body["constructors_synced"] == 10
+
+
+def test_sync_standings(benchmark, client, database):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/standings", {"season": SEASON}), rounds=ROUNDS,
+    )
+    assert body["success"] and body["driver_standings_synced"] == 20 * 24
+
+
+def test_sync_standings_unchanged_without_ergast(client, database, monkeypatch):
+    from app.services import fastf1_service
+
+    def unavailable(season):
+        raise ConnectionError("Ergast unavailable")
+
+    monkeypatch.setattr(fastf1_service, "fetch_driver_standings", unavailable)
+    monkeypatch.setattr(fastf1_service, "fetch_constructor_standings", unavailable)
+    _post(client, "/api/sync/standings", {"season": SEASON})
+    # Standings calculated from unchanged race results are kept, which is not a failure
+    body = _post(client, "/api/sync/standings", {"season": SEASON})
+    assert body["success"], body["message"]
+    assert body["driver_standings_synced"] == body["constructor_standings_synced"] == 0
+    assert len(body["errors"]) == 2
+
+
+def test_sync_results(benchmark, client, database):
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/results", {"season": SEASON}), setup=reset_caches, rounds=ROUNDS,
+    )
+    assert body["success"] and body["races_synced"] == 24, body["errors"]
+
+
+def test_sync_results_unchanged(client, database):
+    _post(client, "/api/sync/results", {"season": SEASON})
+    body = _post(client, "/api/sync/results", {"season": SEASON})
+    assert body["race_results_synced"] == body["qualifying_results_synced"] == 0
+
+
+def _stored_results(database, table: str, round_number: int) -> set:
+    from sqlalchemy import text
+
+    with database.connect() as connection:
+        return set(connection.execute(text(f"""
+            SELECT t.id, t.driver_id, t.constructor_id FROM {table} t JOIN races r ON r.id = t.race_id
+            WHERE r.season = :season AND r.round = :round
+        """), {"season": SEASON, "round": round_number}).fetchall())
+
+
+def test_sync_results_failed_session(client, database, monkeypatch):
+    import fastf1
+    from app.services.session_cache import get_event_schedule
+
+    _post(client, "/api/sync/results", {"season": SEASON})
+    event_name = get_event_schedule(SEASON)["EventName"].iloc[-1]
+    race_rows = _stored_results(database, "race_results", 24)
+    qualifying_rows = _stored_results(database, "qualifying_results", 24)
+    assert race_rows and qualifying_rows
+
+    get_session = fastf1.get_session
+
+    def failing_race(year, name, session_type, *args, **kwargs):
+        if name == event_name and session_type == "R":
+            raise ValueError("race data unavailable")
+        return get_session(year, name, session_type, *args, **kwargs)
+
+    reset_caches()
+    monkeypatch.setattr(fastf1, "get_session", failing_race)
+    body = _post(client, "/api/sync/results", {"season": SEASON})
+    assert any(event_name in error for error in body["errors"])
+    # The failed race keeps its stored rows; its qualifying session still syncs
+    assert _stored_results(database, "race_results", 24) == race_rows
+    assert _stored_results(database, "qualifying_results", 24) == qualifying_rows
+
+
+def test_laps(benchmark, client):
+    _post(client, "/api/laps/ingest", {"season": SEASON})
+    response = benchmark(client.get, f"/api/laps/{SEASON}", params={"driver": "VER", "round": [1, 2]})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["count"] > 0 and {lap["round"] for lap in body["laps"]} == {1, 2}
+
+
+def test_telemetry(benchmark, client):
+    response = benchmark(client.get, f"/api/telemetry/{SEASON}/1/R/VER", params={"lap": 5, "points": 300})
+    assert response.status_code == 200, response.text
+    assert set(response.json()["traces"]) == {"speed", "throttle", "brake"}
+    assert client.get(f"/api/telemetry/{SEASON}/1/R/VER", params={"lap": 999}).status_code == 404
+
+
+def test_race_pace(benchmark, client):
+    _post(client, "/api/laps/ingest", {"season": SEASON})
+    response = benchmark(client.get, f"/api/analytics/{SEASON}/race-pace", params={"round": [1, 2], "driver": "VER"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["rounds"] == [1, 2] and {row["driver"] for row in body["stints"]} == {"VER"}
+
+
+def _run_job(client, payload: dict) -> dict:
+    response = client.post("/api/sync/jobs/drivers", json=payload)
+    assert response.status_code == 202, response.text
+    job_id = response.json()["job_id"]
+    while True:
+        job = client.get(f"/api/sync/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+
+
+def test_driver_sync_job(benchmark, client, database):
+    job = benchmark.pedantic(
+        _run_job, args=(client, {"season": SEASON, "filter_confirmed": False}), setup=reset_caches, rounds=ROUNDS,
+    )
+    assert job["status"] == "succeeded", job["error"]
+
+
+def test_driver_sync_job_fetches_on_executor(client, database):
+    from app.services.fastf1_executor import fastf1_executor
+
+    submitted = fastf1_executor.stats()["submitted"]
+    job = _run_job(client, {"season": SEASON, "filter_confirmed": False})
+    assert job["status"] == "succeeded", job["error"]
+    assert fastf1_executor.stats()["submitted"] == submitted + 1
+    assert job["progress"]["seasons_done"] == 1
+
+
+def test_sync_drivers_unchanged(benchmark, client, database):
+    _post(client, "/api/sync/drivers", {"season": SEASON, "filter_confirmed": False})
+    body = benchmark.pedantic(
+        _post, args=(client, "/api/sync/drivers", {"season": SEASON, "filter_confirmed": False}), rounds=ROUNDS,
+    )
+    assert body["drivers_unchanged"] == 20 and body["drivers_inserted"] == body["drivers_updated"] == 0
@@ -0,0 +1,75 @@
+"""Tests for the bounded FastF1 executor: backends, queue limit and stats."""
+import asyncio
+import pickle
+import threading
+import pytest
+from app.services.fastf1_executor import BACKEND_PROCESS, BACKEND_THREAD, ExecutorBusyError, FastF1Executor
+
+
+@pytest.fixture
+def blocked_executor():
+    """A one-worker, no-queue thread executor whose worker is held until the test ends."""
+    executor = FastF1Executor(BACKEND_THREAD, max_workers=1, max_queue=0)
+    release = threading.Event()
+    running = executor.submit(release.wait)
+    yield executor
+    release.set()
+    running.result(timeout=5)
+    executor.shutdown()
+
+
+def test_process_backend_runs_calls():
+    executor = FastF1Executor(BACKEND_PROCESS, max_workers=1, max_queue=0)
+    try:
+        assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(executor.run(divmod, 1, 0))
+    finally:
+        executor.shutdown()
+    stats = executor.stats()
+    assert stats["backend"] == BACKEND_PROCESS
+    assert (stats["submitted"], stats["completed"], stats["failed"], stats["in_flight"]) == (2, 1, 1, 0)
+
+
+def test_process_backend_fetch_is_picklable(monkeypatch):
+    from app.api.routes import sync
+    from app.schemas.driver import DriverSyncRequest
+    from app.services.jobs import Job
+
+    job = Job("drivers", "drivers:test", {}, seasons_total=1)
+    monkeypatch.setattr(sync.fastf1_executor, "backend", BACKEND_PROCESS)
+    fetch = sync._driver_sync_steps(DriverSyncRequest(season=2024), job)[0]
+    # The job (and its lock) stays behind; only the request goes to the worker
+    assert pickle.loads(pickle.dumps(fetch)).args[1] is None
+
+
+def test_full_queue_is_rejected(blocked_executor):
+    with pytest.raises(ExecutorBusyError):
+        blocked_executor.submit(sum, [1])
+    stats = blocked_executor.stats()
+    assert (stats["in_flight"], stats["running"], stats["queued"]) == (1, 1, 0)
+    assert (stats["submitted"], stats["rejected"]) == (1, 1)
+
+
+def test_queued_calls_are_counted():
+    executor = FastF1Executor(BACKEND_THREAD, max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        first = executor.submit(release.wait)
+        second = executor.submit(sum, [1, 2])
+        assert (executor.stats()["running"], executor.stats()["queued"]) == (1, 1)
+        release.set()
+        assert first.result(timeout=5) and second.result(timeout=5) == 3
+    finally:
+        release.set()
+        executor.shutdown()
+    assert executor.stats()["completed"] == 2
+
+
+def test_sync_endpoint_returns_503_when_busy(client, blocked_executor, monkeypatch):
+    from app.api.routes import sync
+
+    monkeypatch.setattr(sync, "fastf1_executor", blocked_executor)
+    response = client.post("/api/sync/teams", json={"season": 2024})
+    assert response.status_code == 503
+    assert "busy" in response.json()["detail"]
@@ -0,0 +1,179 @@
+"""Benchmarks for the FastF1 fetch path, replayed from fixtures."""
+import shutil
+import pytest
+from app.services.fastf1_service import (
+    fetch_current_season_drivers,
+    fetch_current_season_teams,
+    get_season_constructor_lineup,
+    get_season_driver_lineup,
+    sync_drivers,
+)
+from app.services.metrics import TEAM_FALLBACKS
+from app.services.season_snapshots import season_snapshots
+from app.services.session_cache import get_event_schedule, load_session
+from benchmarks.conftest import SEASON
+from benchmarks.replay import reset_caches
+
+ROUNDS = 5
+
+
+def test_fetch_current_season_drivers(benchmark, replay):
+    drivers = benchmark.pedantic(
+        fetch_current_season_drivers, args=(SEASON,), kwargs={"filter_confirmed": False},
+        setup=reset_caches, rounds=ROUNDS,
+    )
+    assert len(drivers) == 20
+    assert all(driver["current_team"] for driver in drivers)
+
+
+def test_fetch_current_season_drivers_cached(benchmark, replay):
+    fetch_current_season_drivers(SEASON, filter_confirmed=False)
+    drivers = benchmark(fetch_current_season_drivers, SEASON, filter_confirmed=False)
+    assert len(drivers) == 20
+
+
+def test_fetch_current_season_teams(benchmark, replay):
+    teams = benchmark.pedantic(fetch_current_season_teams, args=(SEASON,), setup=reset_caches, rounds=ROUNDS)
+    assert len(teams) == 10
+
+
+def test_sync_drivers(benchmark, replay):
+    result = benchmark.pedantic(
+        sync_drivers, kwargs={"seasons": [SEASON], "filter_confirmed": False, "parallel": False},
+        setup=reset_caches, rounds=ROUNDS,
+    )
+    assert len(result["drivers"]) == 20
+
+
+def _blank_race_team_names():
+    """Cache the final round's race without team names, next to its qualifying session."""
+    reset_caches()
+    event_name = get_event_schedule(SEASON)["EventName"].iloc[-1]
+    load_session(SEASON, event_name, "R").results["TeamName"] = ""
+    load_session(SEASON, event_name, "Q")
+
+
+def test_fetch_current_season_drivers_team_fallback(benchmark, replay):
+    drivers = benchmark.pedantic(
+        fetch_current_season_drivers, args=(SEASON,), kwargs={"filter_confirmed": False},
+        setup=_blank_race_team_names, rounds=ROUNDS,
+    )
+    assert all(driver["current_team"] for driver in drivers)
+    assert TEAM_FALLBACKS.labels(source="cached_sessions")._value.get() > 0
+    assert TEAM_FALLBACKS.labels(source="laps")._value.get() == 0
+
+
+def test_fetch_current_season_teams_team_fallback(benchmark, replay):
+    teams = benchmark.pedantic(
+        fetch_current_season_teams, args=(SEASON,), setup=_blank_race_team_names, rounds=ROUNDS,
+    )
+    assert len(teams) == 10
+
+
+def _cold_lineup():
+    """No snapshots and no in-process caches."""
+    reset_caches()
+    shutil.rmtree(season_snapshots.directory, ignore_errors=True)
+
+
+def test_get_season_driver_lineup_build(benchmark, replay):
+    lineup = benchmark.pedantic(get_season_driver_lineup, args=(SEASON,), setup=_cold_lineup, rounds=ROUNDS)
+    assert len(lineup) == 20
+    assert season_snapshots.read(SEASON, "drivers")[1]["source"]["session_type"] == "R"
+
+
+def test_get_season_driver_lineup_snapshot(benchmark, replay):
+    expected = get_season_driver_lineup(SEASON)
+    lineup = benchmark.pedantic(get_season_driver_lineup, args=(SEASON,), setup=reset_caches, rounds=ROUNDS)
+    assert lineup == expected
+
+
+def test_get_season_constructor_lineup_snapshot(benchmark, replay):
+    expected = get_season_constructor_lineup(SEASON)
+    lineup = benchmark.pedantic(get_season_constructor_lineup, args=(SEASON,), setup=reset_caches, rounds=ROUNDS)
+    assert lineup == expected and len(lineup) == 10
+
+
+def test_session_index_retries_recent_empty_sessions(tmp_path):
+    from datetime import datetime, timedelta
+    from app.services.session_index import SessionIndex
+
+    index = SessionIndex(str(tmp_path / "index.json"))
+    index.record(SEASON, "Old Grand Prix", "R", True, False, datetime.now() - timedelta(days=30))
+    index.record(SEASON, "New Grand Prix", "R", True, False, datetime.now().date())
+    assert index.lookup(SEASON, "Old Grand Prix", "R") == {"has_drivers": True, "has_results": False}
+    assert index.lookup(SEASON, "New Grand Prix", "R")["retry_after"]
+    # Once the retry time passes the entry is treated as never probed
+    index._season(SEASON)["sessions"]["New Grand Prix|R"]["retry_after"] = datetime.now().isoformat()
+    assert index.lookup(SEASON, "New Grand Prix", "R") is None
+
+
+def test_teams_from_laps_leaves_cached_session(replay):
+    from app.services.fastf1_service import _teams_from_laps
+
+    reset_caches()
+    event_name = get_event_schedule(SEASON)["EventName"].iloc[-1]
+    cached = load_session(SEASON, event_name, "R")
+    teams = _teams_from_laps(SEASON, event_name, "R")
+    assert len(teams) == 20
+    # The shared session is not reloaded with laps under other readers
+    assert load_session(SEASON, event_name, "R") is cached and cached.laps.empty
+
+
+def _substring_alias(team_name_lower: str):
+    """The substring checks the alias regex replaced."""
+    rules = [
+        (lambda n: "red bull" in n, "Red Bull Racing"),
+        (lambda n: "ferrari" in n, "Ferrari"),
+        (lambda n: "mercedes" in n, "Mercedes"),
+        (lambda n: "mclaren" in n, "McLaren"),
+        (lambda n: "aston martin" in n, "Aston Martin"),
+        (lambda n: "alpine" in n, "Alpine"),
+        (lambda n: "williams" in n, "Williams"),
+        (lambda n: "haas" in n, "Haas F1 Team"),
+        (lambda n: "racing bulls" in n or "rb" == n or "alphatauri" in n, "Racing Bulls"),
+        (lambda n: "sauber" in n or "audi" in n, "Audi"),
+        (lambda n: "cadillac" in n, "Cadillac"),
+    ]
+    return next((canonical for matches, canonical in rules if matches(team_name_lower)), None)
+
+
+def test_team_alias_parity():
+    from app.services.fastf1_service import _TEAM_ALIAS_CANONICAL, _TEAM_ALIAS_PATTERN
+
+    names = [
+        "oracle red bull", "scuderia\nferrari hp", "team\nmercedes", "x mclaren", "aston\nmartin", "bwt alpine\n",
+        "atlassian williams", "moneygram haas", "visa racing bulls", "rb", "rb\n", "\nrb", "scuderia alphatauri",
+        "stake\nsauber", "audi\nrevolut", "cadillac", "ferrari\nred bull", "unknown", "", "\n",
+    ]
+    for name in names:
+        match = _TEAM_ALIAS_PATTERN.match(name)
+        assert (_TEAM_ALIAS_CANONICAL[match.lastgroup] if match else None) == _substring_alias(name), repr(name)
+
+
+def test_ttl_cache_failed_load_releases_key_lock():
+    from app.services.session_cache import TTLCache
+
+    cache = TTLCache("test", max_entries=2, ttl_seconds=60)
+
+    def failing_load():
+        raise ValueError("session unavailable")
+
+    for key in range(5):
+        with pytest.raises(ValueError):
+            cache.get_or_load(key, failing_load)
+    assert not cache._key_locks
+    assert cache.get_or_load(0, lambda: "loaded") == "loaded"
+
+
+def test_season_snapshot_round_trip_with_nulls(tmp_path):
+    from app.services.season_snapshots import SeasonSnapshotStore
+
+    store = SeasonSnapshotStore(str(tmp_path))
+    records = [
+        {"driver_id": "ham", "driver_number": 44, "team": "Mercedes"},
+        {"driver_id": "new", "driver_number": None, "team": None},
+    ]
+    store.write(2020, "drivers", records, {"event": "Abu Dhabi Grand Prix", "session_type": "R"})
+    stored, _ = store.read(2020, "drivers")
+    assert stored == records and type(stored[0]["driver_number"]) is int
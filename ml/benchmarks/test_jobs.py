@@ -0,0 +1,159 @@
+"""Tests for background jobs and their coalescing with sync requests."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from app.schemas.lineup import LineupSyncResponse
+from app.services.jobs import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobManager
+from app.services.single_flight import SingleFlight
+from benchmarks.conftest import SEASON
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _job(client, job_id: str) -> dict:
+    return client.get(f"/api/sync/jobs/{job_id}").json()
+
+
+def test_job_and_requests_share_one_fetch(client, monkeypatch, caplog):
+    from app.api.routes import sync
+
+    calls = []
+    release = threading.Event()
+
+    def fetch(request, job=None):
+        calls.append(request.season)
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(sync, "_fetch_teams", fetch)
+    caplog.set_level("INFO", logger="app.services.single_flight")
+    try:
+        job_id = client.post("/api/sync/jobs/teams", json={"season": SEASON}).json()["job_id"]
+        _wait_for(lambda: calls)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            requests = [pool.submit(client.post, "/api/sync/teams", json={"season": SEASON}) for _ in range(2)]
+            _wait_for(lambda: sum("Coalescing" in r.message for r in caplog.records) == 2)
+            release.set()
+            responses = [request.result(timeout=5) for request in requests]
+    finally:
+        release.set()
+
+    _wait_for(lambda: _job(client, job_id)["status"] != "running")
+    job = _job(client, job_id)
+    assert calls == [SEASON]
+    assert job["status"] == "succeeded"
+    assert all(response.status_code == 200 and response.json() == job["result"] for response in responses)
+
+
+def _run_manager(scenario, max_workers: int = 1, history_size: int = 10):
+    """Run scenario(manager) on a fresh JobManager inside its own event loop."""
+    async def main():
+        return await scenario(JobManager(max_workers, history_size, SingleFlight("test")))
+
+    return asyncio.run(main())
+
+
+async def _until_finished(*jobs) -> None:
+    while any(job.is_active for job in jobs):
+        await asyncio.sleep(0)
+
+
+def test_job_manager_deduplicates_active_jobs():
+    async def scenario(manager):
+        release = asyncio.Event()
+        runs = []
+
+        async def run(job):
+            runs.append(job.id)
+            await release.wait()
+            return {"ok": True}
+
+        first, created = manager.submit("drivers", {"seasons": [SEASON]}, run)
+        again, created_again = manager.submit("drivers", {"seasons": [SEASON]}, run)
+        other, created_other = manager.submit("drivers", {"seasons": [SEASON - 1]}, run)
+        release.set()
+        await _until_finished(first, other)
+        after, created_after = manager.submit("drivers", {"seasons": [SEASON]}, run)
+        await _until_finished(after)
+        return first, again, other, after, (created, created_again, created_other, created_after), runs
+
+    first, again, other, after, created, runs = _run_manager(scenario, max_workers=2)
+    assert again is first and other is not first and after is not first
+    assert created == (True, False, True, True)
+    assert runs == [first.id, other.id, after.id]
+
+
+def test_job_manager_status_transitions():
+    async def scenario(manager):
+        release = asyncio.Event()
+
+        async def run(job):
+            await release.wait()
+            job.add_rows(3)
+            return LineupSyncResponse(success=True, message="done", drivers_synced=2, constructors_synced=1)
+
+        first, _ = manager.submit("lineups", {"season": SEASON}, run)
+        second, _ = manager.submit("lineups", {"season": SEASON - 1}, run)
+        assert first.status == second.status == JOB_QUEUED
+        await asyncio.sleep(0)
+        # One worker: the second job waits for the first
+        assert (first.status, second.status) == (JOB_RUNNING, JOB_QUEUED)
+        assert first.started_at is not None and second.started_at is None
+        release.set()
+        await _until_finished(first, second)
+        return first, second, manager.list()
+
+    first, second, listed = _run_manager(scenario)
+    assert first.status == second.status == JOB_SUCCEEDED
+    assert first.result == {
+        "success": True, "message": "done", "drivers_synced": 2, "constructors_synced": 1, "errors": None,
+    }
+    assert first.to_dict()["progress"]["rows_written"] == 3
+    assert first.finished_at <= second.started_at
+    assert listed == [second, first]
+
+
+def test_job_manager_captures_failures():
+    async def scenario(manager):
+        async def database_error(job):
+            raise HTTPException(status_code=500, detail="Database error: connection refused")
+
+        async def fetch_error(job):
+            raise ValueError("schedule unavailable")
+
+        failed, _ = manager.submit("results", {"season": SEASON}, database_error)
+        errored, _ = manager.submit("teams", {"seasons": [SEASON]}, fetch_error)
+        await _until_finished(failed, errored)
+        # A failed job no longer blocks an identical submit
+        retried, created = manager.submit("results", {"season": SEASON}, database_error)
+        await _until_finished(retried)
+        return failed, errored, retried, created
+
+    failed, errored, retried, created = _run_manager(scenario)
+    assert failed.status == errored.status == JOB_FAILED
+    assert failed.error == "Database error: connection refused"
+    assert errored.error == "schedule unavailable" and errored.result is None
+    assert created and retried is not failed and failed.finished_at is not None
+
+
+def test_job_manager_prunes_finished_jobs():
+    async def scenario(manager):
+        async def run(job):
+            return {}
+
+        jobs = []
+        for season in range(2000, 2005):
+            job, _ = manager.submit("results", {"season": season}, run)
+            await _until_finished(job)
+            jobs.append(job)
+        return jobs, manager.list()
+
+    jobs, listed = _run_manager(scenario, history_size=3)
+    assert listed == list(reversed(jobs[-3:]))
@@ -0,0 +1,75 @@
+"""Benchmarks for lap ingestion and reads from the Parquet lap store."""
+import shutil
+import pytest
+from app.services.fastf1_service import ingest_season_laps
+from app.services.lap_store import lap_store
+from benchmarks.conftest import SEASON
+from benchmarks.replay import reset_caches
+
+ROUNDS = 3
+EVENTS = 24
+
+
+def _cold_lap_store():
+    reset_caches()
+    shutil.rmtree(lap_store.root, ignore_errors=True)
+
+
+@pytest.fixture
+def stored_laps(replay):
+    """Race and qualifying laps of the replayed season, in the lap store."""
+    ingest_season_laps(SEASON, ["R", "Q"])
+
+
+def test_ingest_season_laps(benchmark, replay):
+    result = benchmark.pedantic(
+        ingest_season_laps, args=(SEASON, ["R"]), setup=_cold_lap_store, rounds=ROUNDS,
+    )
+    assert result["sessions"] == EVENTS and not result["errors"]
+    assert lap_store.sessions(SEASON) == [(round_number, "R") for round_number in range(1, EVENTS + 1)]
+
+
+def test_ingest_season_laps_stored(benchmark, stored_laps):
+    result = benchmark(ingest_season_laps, SEASON, ["R", "Q"])
+    assert result["skipped"] == 2 * EVENTS and result["sessions"] == 0
+
+
+def test_read_driver_laps(benchmark, stored_laps):
+    laps = benchmark(lap_store.read, SEASON, session_types=["R"], drivers=["VER"])
+    assert set(laps["driver"]) == {"VER"} and laps["round"].nunique() == EVENTS
+    assert str(laps["lap_time_ms"].dtype) == "Int32" and str(laps["team"].dtype) == "category"
+
+
+def test_read_event_lap_times(benchmark, stored_laps):
+    laps = benchmark(lap_store.read, SEASON, rounds=[1], session_types=["R"], columns=["driver", "lap_time_ms"])
+    assert list(laps.columns) == ["season", "round", "session", "driver", "lap_time_ms"]
+    assert set(laps["round"]) == {1}
+
+
+def test_ingest_rounds_and_failed_sessions(replay, monkeypatch):
+    import app.services.fastf1_service as fastf1_service
+
+    _cold_lap_store()
+    try:
+        assert ingest_season_laps(SEASON, ["R"], rounds=[1, 2])["sessions"] == 2
+        assert lap_store.sessions(SEASON) == [(1, "R"), (2, "R")]
+
+        loads = []
+
+        def failing_load(year, event_name, session_type):
+            loads.append(event_name)
+            raise ValueError("laps unavailable")
+
+        monkeypatch.setattr(fastf1_service, "load_session_laps", failing_load)
+        assert ingest_season_laps(SEASON, ["R"], rounds=[3])["errors"]
+        # The failure is remembered: the next ingest does not reload the session
+        assert ingest_season_laps(SEASON, ["R"], rounds=[3])["errors"]
+        assert len(loads) == 1 and lap_store.recently_failed(SEASON, 3, "R")
+        assert set(lap_store.read(SEASON)["round"]) == {1, 2}
+    finally:
+        _cold_lap_store()
+
+
+def test_read_without_driver_column(stored_laps):
+    laps = lap_store.read(SEASON, rounds=[2], session_types=["R"], columns=["lap_number", "lap_time_ms"])
+    assert list(laps.columns) == ["season", "round", "session", "lap_number", "lap_time_ms"] and len(laps)
@@ -0,0 +1,52 @@
+"""Benchmarks for race pace and stint analytics over the lap store."""
+import shutil
+import numpy as np
+import pytest
+from app.services.fastf1_service import ingest_season_laps, normalize_constructor_id
+from app.services.lap_store import lap_store
+from app.services.race_pace import PACE_LAP_COLUMNS, annotate_laps, season_race_pace, stint_summary
+from benchmarks.conftest import SEASON
+from benchmarks.replay import reset_caches
+
+EVENTS = 24
+
+
+@pytest.fixture
+def race_laps(replay):
+    """Race laps of the replayed season, in the lap store."""
+    ingest_season_laps(SEASON, ["R"])
+
+
+def test_season_race_pace(benchmark, race_laps):
+    result = benchmark(season_race_pace, SEASON)
+    assert result["rounds"] == list(range(1, EVENTS + 1)) and result["laps"] is None
+    fastest = [row for row in result["race_pace"] if row["pace_delta_ms"] == 0]
+    assert len(fastest) == EVENTS
+    assert all(row["constructor_id"] == normalize_constructor_id(row["team"]) for row in result["season_pace"])
+    assert all(row["driver_id"] == row["driver"].lower() for row in result["season_pace"])
+
+
+def test_season_race_pace_laps(benchmark, race_laps):
+    result = benchmark(season_race_pace, SEASON, rounds=[1], drivers=["ver"], include_laps=True)
+    assert {lap["driver"] for lap in result["laps"]} == {"VER"}
+    assert all(lap["gap_to_leader_ms"] >= 0 for lap in result["laps"] if lap["gap_to_leader_ms"] is not None)
+    assert {row["driver"] for row in result["race_pace"]} == {"VER"}
+
+
+def test_degradation_slope(race_laps):
+    laps = annotate_laps(lap_store.read(SEASON, rounds=[1], session_types=["R"], columns=PACE_LAP_COLUMNS))
+    stints = stint_summary(laps)
+    # Grouped least squares agrees with a per-stint polyfit
+    row = stints.dropna(subset=["degradation_ms_per_lap"]).iloc[0]
+    stint = laps[laps["clean"] & (laps["driver"] == row["driver"]) & (laps["stint"] == row["stint"])]
+    expected = np.polyfit(stint["tyre_life"].astype(float), stint["fuel_corrected_ms"], 1)[0]
+    assert row["degradation_ms_per_lap"] == pytest.approx(expected)
+
+
+def test_season_race_pace_ingests_requested_rounds(replay):
+    reset_caches()
+    shutil.rmtree(lap_store.root, ignore_errors=True)
+    result = season_race_pace(SEASON, rounds=[1])
+    assert result["rounds"] == [1]
+    # Only the requested race is loaded from FastF1
+    assert lap_store.sessions(SEASON) == [(1, "R")]
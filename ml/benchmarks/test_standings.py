@@ -0,0 +1,161 @@
+"""Benchmarks for the standings calculators, Ergast record conversion and the Ergast cache."""
+import shutil
+import pytest
+from app.services.ergast_cache import ergast_cache
+from app.services.fastf1_service import (
+    calculate_constructor_standings_from_results,
+    calculate_driver_standings_from_results,
+    constructor_standings_records,
+    driver_standings_records,
+    fetch_constructor_standings,
+    fetch_driver_standings,
+    fetch_standings_rounds,
+)
+from benchmarks.conftest import SEASON
+from benchmarks.replay import ReplayErgast, reset_caches
+
+ROUNDS = 24
+
+
+@pytest.fixture(scope="module")
+def ergast(replay):
+    return ReplayErgast(replay)
+
+
+def _final_round(standings: list[dict], id_key: str) -> dict:
+    last = max(row["round"] for row in standings)
+    return {row[id_key]: row["points"] for row in standings if row["round"] == last}
+
+
+def test_driver_standings_records(benchmark, ergast):
+    results = fetch_standings_rounds(ergast.get_driver_standings, SEASON)
+    records = benchmark(driver_standings_records, results, SEASON)
+    assert len(records) == 20 * ROUNDS
+
+
+def test_constructor_standings_records(benchmark, ergast):
+    results = fetch_standings_rounds(ergast.get_constructor_standings, SEASON)
+    records = benchmark(constructor_standings_records, results, SEASON)
+    assert len(records) == 10 * ROUNDS
+
+
+def test_calculate_driver_standings(benchmark, db_session, ergast):
+    standings = benchmark(calculate_driver_standings_from_results, db_session, SEASON)
+    expected = driver_standings_records(ergast.get_driver_standings(season=SEASON), SEASON)
+    assert _final_round(standings, "driver_id") == _final_round(expected, "driver_id")
+
+
+def test_calculate_driver_standings_incremental(benchmark, db_session):
+    stored = [
+        row for row in calculate_driver_standings_from_results(db_session, SEASON)
+        if row["round"] < ROUNDS
+    ]
+    standings = benchmark(calculate_driver_standings_from_results, db_session, SEASON, stored)
+    assert {row["round"] for row in standings} == {ROUNDS}
+
+
+def test_calculate_constructor_standings(benchmark, db_session, ergast):
+    standings = benchmark(calculate_constructor_standings_from_results, db_session, SEASON)
+    expected = ergast.get_constructor_standings(season=SEASON).content[-1]
+    assert _final_round(standings, "constructor_id") == dict(zip(expected["constructorId"], expected["points"]))
+
+
+def _cold_ergast_cache():
+    reset_caches()
+    shutil.rmtree(ergast_cache.directory, ignore_errors=True)
+
+
+def test_fetch_driver_standings_uncached(benchmark, replay):
+    standings = benchmark.pedantic(fetch_driver_standings, args=(SEASON,), setup=_cold_ergast_cache, rounds=5)
+    assert len(standings) == 20 * ROUNDS
+    assert {row["round"] for row in standings} == set(range(1, ROUNDS + 1))
+
+
+def test_fetch_driver_standings_cached(benchmark, replay):
+    fetch_driver_standings(SEASON)
+    standings = benchmark.pedantic(fetch_driver_standings, args=(SEASON,), setup=reset_caches, rounds=5)
+    assert len(standings) == 20 * ROUNDS
+    assert ergast_cache.path("driver_standings", SEASON).exists()
+
+
+def test_fetch_constructor_standings_cached(benchmark, replay):
+    fetch_constructor_standings(SEASON)
+    standings = benchmark(fetch_constructor_standings, SEASON)
+    assert len(standings) == 10 * ROUNDS
+
+
+def test_store_standings_incremental(db_session):
+    from sqlalchemy import text
+    from app.api.routes.sync import _store_standings
+
+    # Start from no stored standings and results last changed an hour ago (rolled back with the session)
+    db_session.execute(text("DELETE FROM driver_standings WHERE season = :season"), {"season": SEASON})
+    db_session.execute(text("""
+        UPDATE race_results SET updated_at = NOW() - INTERVAL '1 hour'
+        WHERE race_id IN (SELECT id FROM races WHERE season = :season)
+    """), {"season": SEASON})
+    fallback = {"driver_standings": [], "constructor_standings": [], "errors": []}
+    first = _store_standings(db_session, SEASON, fallback)
+    assert first["driver_synced"] == 20 * ROUNDS and first["driver_source"] == "race_results"
+    # Nothing changed since: no round is recalculated
+    assert _store_standings(db_session, SEASON, fallback)["driver_synced"] == 0
+
+    # A points change in round 20 recalculates rounds 20 onward from the stored round 19 totals
+    db_session.execute(text(
+        "UPDATE driver_standings SET updated_at = updated_at - INTERVAL '1 minute' WHERE season = :season"
+    ), {"season": SEASON})
+    db_session.execute(text("""
+        UPDATE race_results SET points = points + 10, updated_at = NOW()
+        WHERE race_id = :race_id AND position = 20
+    """), {"race_id": f"{SEASON}_20"})
+    assert _store_standings(db_session, SEASON, fallback)["driver_synced"] == 20 * (ROUNDS - 19)
+    stored = db_session.execute(text(
+        "SELECT round, driver_id, points FROM driver_standings WHERE season = :season"
+    ), {"season": SEASON}).fetchall()
+    expected = calculate_driver_standings_from_results(db_session, SEASON)
+    assert {(row.round, row.driver_id): row.points for row in stored} == {
+        (row["round"], row["driver_id"]): row["points"] for row in expected
+    }
+    # The recalculated rounds count as current again
+    assert _store_standings(db_session, SEASON, fallback)["driver_synced"] == 0
+
+
+def test_store_standings_ignores_other_source_ids(db_session, replay):
+    from sqlalchemy import text
+    from app.api.routes.sync import _store_standings
+
+    # Ergast standings keyed by Ergast ids, then drivers re-keyed by FastF1
+    # abbreviations as a FastF1 driver sync stores them
+    db_session.execute(text("DELETE FROM driver_standings WHERE season = :season"), {"season": SEASON})
+    _store_standings(db_session, SEASON, {
+        "driver_standings": fetch_driver_standings(SEASON),
+        "constructor_standings": fetch_constructor_standings(SEASON),
+        "errors": [],
+    })
+    schedule = replay.get_event_schedule(SEASON)
+    event_name = schedule.loc[schedule["RoundNumber"] == 1, "EventName"].iloc[0]
+    results = replay.get_session(SEASON, event_name, "R").results
+    for driver_id, code in zip(results["DriverId"], results["Abbreviation"]):
+        # Drivers stored by an earlier driver sync may already use the code
+        db_session.execute(
+            text("UPDATE drivers SET driver_id = id WHERE driver_id = :code"), {"code": code.lower()}
+        )
+        db_session.execute(
+            text("UPDATE drivers SET driver_id = :code WHERE id = :id"),
+            {"code": code.lower(), "id": f"d_{driver_id}"},
+        )
+
+    # The Ergast rows are no baseline for code-keyed standings: every round is calculated
+    fallback = {"driver_standings": [], "constructor_standings": [], "errors": []}
+    first = _store_standings(db_session, SEASON, fallback)
+    assert first["driver_synced"] == 20 * ROUNDS
+    stored = db_session.execute(text(
+        "SELECT round, driver_id, points FROM driver_standings WHERE season = :season AND driver_id = 'ver'"
+    ), {"season": SEASON}).fetchall()
+    expected = calculate_driver_standings_from_results(db_session, SEASON)
+    assert {row.round: row.points for row in stored} == {
+        row["round"]: row["points"] for row in expected if row["driver_id"] == "ver"
+    }
+    # ... and once they are stored, nothing is recalculated
+    second = _store_standings(db_session, SEASON, fallback)
+    assert second["driver_synced"] == 0 and second["unchanged"] > 0
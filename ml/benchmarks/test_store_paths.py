@@ -0,0 +1,289 @@
+"""Offline checks of the sync store paths against a recording stand-in for the database session."""
+from types import SimpleNamespace
+import json
+import pytest
+from app.api.routes import sync
+
+
+class StubResult:
+    """The parts of a SQLAlchemy result the store paths read."""
+
+    def __init__(self, rows=(), rowcount=None):
+        self.rows = [dict(row) for row in rows]
+        self.rowcount = len(self.rows) if rowcount is None else rowcount
+
+    def fetchone(self):
+        return tuple(self.rows[0].values())
+
+    def mappings(self):
+        return StubMappings(self.rows)
+
+    def __iter__(self):
+        return iter(SimpleNamespace(_mapping=row) for row in self.rows)
+
+
+class StubMappings(list):
+    def all(self):
+        return list(self)
+
+
+class RecordingSession:
+    """
+    Records every statement with its parameters and answers it with the first
+    canned result whose SQL fragment it contains (a callable gets the parameters).
+    """
+
+    def __init__(self, answers=None):
+        self.answers = answers or {}
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql, params = str(statement), params or {}
+        self.statements.append((sql, params))
+        for fragment, answer in self.answers.items():
+            if fragment in sql:
+                return answer(params) if callable(answer) else answer
+        return StubResult()
+
+    def executed(self, fragment: str) -> list[dict]:
+        """Parameters of the statements containing fragment, in order."""
+        return [params for sql, params in self.statements if fragment in sql]
+
+
+@pytest.fixture
+def batch_size(monkeypatch):
+    monkeypatch.setattr(sync, "DB_UPSERT_BATCH_SIZE", 2)
+    return 2
+
+
+def _driver(driver_id: str, code: str, **fields) -> dict:
+    return {"driver_id": driver_id, "code": code, "forename": driver_id.title(), "surname": "Driver",
+            "nationality": "Dutch", "permanent_number": 1, **fields}
+
+
+def _upsert_answer(params):
+    return StubResult([{"upserted_count": len(json.loads(params["rows"])), "replaced_count": 1}])
+
+
+def test_driver_upserts_are_batched(batch_size):
+    db = RecordingSession({"DELETE FROM drivers d": _upsert_answer})
+    drivers = [_driver(f"D{n}", code) for n, code in enumerate(["VER", "HAM", "1", "LEC", "NOR"])]
+    assert sync._upsert_drivers(db, drivers) == (5, 0, 0, 3)
+
+    batches = db.executed("DELETE FROM drivers d")
+    assert [len(json.loads(batch["rows"])) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in json.loads(batch["rows"])]
+    # Fetch order is kept across batches; ids are lowercased and only 3-letter codes replace rows
+    assert [row["driver_id"] for row in rows] == ["d0", "d1", "d2", "d3", "d4"]
+    assert [row["lookup_code"] for row in rows] == ["VER", "HAM", None, "LEC", "NOR"]
+    # Every batch protects all drivers of the sync from replacement by code
+    assert {batch["synced_ids"] for batch in batches} == {json.dumps(["d0", "d1", "d2", "d3", "d4"])}
+
+
+def test_driver_upserts_collapse_duplicate_ids():
+    db = RecordingSession({"DELETE FROM drivers d": _upsert_answer})
+    drivers = [_driver("VER", "VER", nationality="Belgian"), _driver("ver", "VER", nationality="Dutch")]
+    assert sync._upsert_drivers(db, drivers)[0] == 1
+    [batch] = db.executed("DELETE FROM drivers d")
+    assert [row["nationality"] for row in json.loads(batch["rows"])] == ["Dutch"]
+
+
+def _written(params):
+    return StubResult(rowcount=len(json.loads(params["rows"])))
+
+
+def _standing(id_column: str, entity_id: str, round_number: int, points: float) -> dict:
+    return {"season": 2024, "round": round_number, id_column: entity_id, "position": 1, "points": points, "wins": 0}
+
+
+def test_standings_fallback_starts_from_unchanged_rounds(monkeypatch):
+    from app.services import fastf1_service
+
+    unchanged = {
+        "driver_standings": [_standing("driver_id", "ver", 1, 25)],
+        "constructor_standings": [_standing("constructor_id", "red_bull", 1, 43), _standing("constructor_id", "red_bull", 2, 87)],
+    }
+    calculated = {}
+
+    def calculator(table, id_column, entity_id):
+        def calculate(db, season, baseline):
+            calculated[table] = baseline
+            last_round = max(row["round"] for row in baseline)
+            return [_standing(id_column, entity_id, last_round + 1, 50)]
+        return calculate
+
+    monkeypatch.setattr(fastf1_service, "calculate_driver_standings_from_results", calculator("driver_standings", "driver_id", "ver"))
+    monkeypatch.setattr(
+        fastf1_service, "calculate_constructor_standings_from_results",
+        calculator("constructor_standings", "constructor_id", "red_bull"),
+    )
+    db = RecordingSession({
+        "FROM driver_standings s": StubResult(unchanged["driver_standings"]),
+        "FROM constructor_standings s": StubResult(unchanged["constructor_standings"]),
+        "jsonb_to_recordset": _written,
+    })
+    fetched = {"driver_standings": [], "constructor_standings": [], "errors": ["Ergast driver standings unavailable"]}
+    stored = sync._store_standings(db, 2024, fetched)
+
+    assert calculated == unchanged
+    assert db.executed("FROM driver_standings s") == db.executed("FROM constructor_standings s") == [{"season": 2024}]
+    # Each baseline is keyed by the source ids of its own entity table
+    assert "JOIN drivers src ON rr.driver_id = src.id" in next(sql for sql, _ in db.statements if "FROM driver_standings s" in sql)
+    assert stored == {
+        "driver_source": "race_results", "constructor_source": "race_results",
+        "driver_synced": 1, "constructor_synced": 1, "unchanged": 3,
+    }
+    assert [json.loads(params["rows"])[0]["round"] for params in db.executed("jsonb_to_recordset")] == [2, 3]
+
+
+def test_standings_unchanged_rows_count_as_synced():
+    stored = {"driver_source": "race_results", "constructor_source": "race_results",
+              "driver_synced": 0, "constructor_synced": 0, "unchanged": 48}
+    response = sync._standings_response(2024, {"errors": []}, stored)
+    assert response.success and response.message.endswith("; 48 stored rows unchanged")
+
+
+def test_standings_upserts_are_batched(batch_size):
+    db = RecordingSession({"jsonb_to_recordset": _written})
+    standings = [_standing("constructor_id", team, 1, 10) for team in ["mclaren", "ferrari", "red_bull"]]
+    assert sync._upsert_standings(db, "constructor_standings", "constructor_id", standings) == 3
+
+    [(sql, first), (_, second)] = db.statements
+    assert "INSERT INTO constructor_standings" in sql and "ON CONFLICT (season, round, constructor_id)" in sql
+    rows = json.loads(first["rows"]) + json.loads(second["rows"])
+    assert [row["entity_id"] for row in rows] == ["mclaren", "ferrari", "red_bull"]
+    assert len({row["id"] for row in rows}) == 3
+
+
+def test_ergast_standings_skip_the_fallback(monkeypatch):
+    from app.services import fastf1_service
+
+    def calculate(db, season, baseline):
+        raise AssertionError("race-results fallback used")
+
+    monkeypatch.setattr(fastf1_service, "calculate_driver_standings_from_results", calculate)
+    monkeypatch.setattr(fastf1_service, "calculate_constructor_standings_from_results", calculate)
+    db = RecordingSession({"jsonb_to_recordset": _written})
+    fetched = {
+        "driver_standings": [_standing("driver_id", "max_verstappen", n, 25 * n) for n in (1, 2)],
+        "constructor_standings": [_standing("constructor_id", "red_bull", 1, 43)],
+        "errors": [],
+    }
+    stored = sync._store_standings(db, 2024, fetched)
+
+    assert stored["driver_source"] == stored["constructor_source"] == "ergast"
+    assert (stored["driver_synced"], stored["constructor_synced"], stored["unchanged"]) == (2, 1, 0)
+    # One statement per table, no stored-standings read
+    assert len(db.statements) == 2
+
+
+def _stored_driver(driver_id: str, code: str, **fields) -> dict:
+    stored = {field: None for field in sync.DRIVER_FINGERPRINT_FIELDS}
+    stored.update(_driver(driver_id, code), driver_championships=0, constructor_championships=0, is_active=True)
+    return {"id": f"id_{driver_id}", **stored, **fields}
+
+
+def test_unchanged_drivers_are_not_written():
+    stored = [_stored_driver("ver", "VER"), _stored_driver("ham", "HAM", current_team="Mercedes")]
+    db = RecordingSession({
+        "FROM drivers WHERE driver_id = ANY": StubResult(stored),
+        "DELETE FROM drivers d": _upsert_answer,
+    })
+    # NumPy-style floats from pandas match the stored integers
+    drivers = [_driver("VER", "VER", permanent_number=1.0), _driver("HAM", "HAM", current_team="Ferrari"), _driver("NOR", "NOR")]
+    assert sync._upsert_drivers(db, drivers) == (1, 1, 1, 1)
+
+    assert db.executed("FROM drivers WHERE driver_id = ANY") == [{"keys": ["ham", "nor", "ver"]}]
+    [batch] = db.executed("DELETE FROM drivers d")
+    assert [row["driver_id"] for row in json.loads(batch["rows"])] == ["ham", "nor"]
+    # The unchanged driver is still protected from replacement by code
+    assert json.loads(batch["synced_ids"]) == ["ham", "nor", "ver"]
+
+
+def test_unchanged_drivers_skip_the_upsert():
+    db = RecordingSession({"FROM drivers WHERE driver_id = ANY": StubResult([_stored_driver("ver", "VER")])})
+    assert sync._upsert_drivers(db, [_driver("VER", "VER")]) == (0, 0, 1, 0)
+    assert not db.executed("DELETE FROM drivers d")
+
+
+def test_unchanged_teams_are_not_written():
+    stored = [
+        {"id": "id_ferrari", "constructor_id": "ferrari", "name": "Ferrari", "nationality": "Italian"},
+        {"id": "id_mclaren", "constructor_id": "mclaren", "name": "McLaren", "nationality": "British"},
+    ]
+    db = RecordingSession({"FROM constructors WHERE constructor_id = ANY": StubResult(stored)})
+    teams = [
+        {"constructor_id": "ferrari", "name": "Ferrari", "nationality": "Italian"},
+        {"constructor_id": "mclaren", "name": "McLaren F1 Team", "nationality": "British"},
+        {"constructor_id": "audi", "name": "Audi", "nationality": "German"},
+    ]
+    assert sync._store_teams(db, teams) == (1, 1, 1, [])
+
+    upserts = db.executed("INSERT INTO constructors")
+    # Changed teams keep their stored id
+    assert {row["constructor_id"]: row["id"] == "id_mclaren" for row in upserts} == {"mclaren": True, "audi": False}
+
+
+def _stored_result(race_id: str, driver_id: str, own: bool = True) -> dict:
+    return {"id": sync._result_id(race_id, driver_id) if own else f"ergast_{driver_id}", "race_id": race_id, "driver_id": driver_id}
+
+
+def test_replace_results_reuses_rows_and_deletes_only_own_stale_rows():
+    stored = [
+        _stored_result("r1", "ver"),
+        _stored_result("r1", "ham", own=False),
+        _stored_result("r1", "sar"),
+        _stored_result("r1", "bot"),
+        _stored_result("r1", "zho", own=False),
+    ]
+    db = RecordingSession({"SELECT id, race_id, driver_id": StubResult(stored), "jsonb_to_recordset": _written})
+    rows = [{"id": sync._result_id("r1", driver), "race_id": "r1", "driver_id": driver, "position": n}
+            for n, driver in enumerate(["ver", "ham", "nor"], start=1)]
+    written = sync._replace_results(
+        db, "race_results", sync.RACE_RESULT_BATCH_UPSERT_QUERY, rows, ["r1"], skipped=[("r1", "bot")],
+    )
+
+    assert written == 3
+    assert db.executed("SELECT id, race_id, driver_id") == [{"race_ids": ["r1"]}]
+    # A row stored by the Ergast sync is updated in place
+    [upsert] = db.executed("jsonb_to_recordset")
+    assert [row["id"] for row in json.loads(upsert["rows"])] == [rows[0]["id"], "ergast_ham", rows[2]["id"]]
+    # Only this service's row of a driver no longer classified goes; the skipped record's row stays
+    assert db.executed("DELETE FROM race_results") == [{"ids": [sync._result_id("r1", "sar")]}]
+
+
+def test_result_rows_skip_unknown_races_and_teams():
+    results = [
+        {"round": 1, "code": "VER", "constructor_id": "red_bull", "position": 1},
+        {"round": 1, "code": "BOT", "constructor_id": "kick_sauber", "position": 15},
+        {"round": 9, "code": "HAM", "constructor_id": "mercedes", "position": 2},
+    ]
+    errors, skipped = [], []
+    rows = sync._result_rows(
+        results, {1: "r1"}, {"VER": "ver", "BOT": "bot", "HAM": "ham"}, {"red_bull": "c_rbr", "mercedes": "c_merc"},
+        ("position",), errors, skipped,
+    )
+
+    assert rows == [{"id": sync._result_id("r1", "ver"), "race_id": "r1", "driver_id": "ver", "constructor_id": "c_rbr", "position": 1}]
+    assert len(errors) == 2 and "BOT in round 1" in errors[0]
+    # Only records of a known race protect a stored row from cleanup
+    assert skipped == [("r1", "bot")]
+
+
+def test_resolve_driver_ids_reuses_stored_drivers():
+    stored = [
+        {"id": "id_ver", "driver_id": "max_verstappen", "code": "VER"},
+        {"id": "id_ham", "driver_id": "ham", "code": "HAM"},
+        {"id": "id_lec", "driver_id": "charles", "code": "LEC"},
+    ]
+    db = RecordingSession({"SELECT id, driver_id, UPPER(code)": StubResult(stored), "jsonb_to_recordset": _written})
+    results = [
+        {"code": code, "driver_id": code.lower(), "ergast_driver_id": ergast_id, "forename": code, "surname": code,
+         "nationality": "", "permanent_number": None}
+        for code, ergast_id in [("VER", "max_verstappen"), ("HAM", "hamilton"), ("LEC", ""), ("BEA", "bearman")]
+    ]
+    ids = sync._resolve_driver_ids(db, results)
+
+    assert {code: ids[code] for code in ("VER", "HAM", "LEC")} == {"VER": "id_ver", "HAM": "id_ham", "LEC": "id_lec"}
+    [insert] = db.executed("jsonb_to_recordset")
+    assert [(row["id"], row["code"]) for row in json.loads(insert["rows"])] == [(ids["BEA"], "BEA")]
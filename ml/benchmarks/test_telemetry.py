@@ -0,0 +1,83 @@
+"""Benchmarks for telemetry downsampling and the lap trace cache."""
+import shutil
+import numpy as np
+import pytest
+from app.services.downsampling import lttb_indices, min_max_indices
+from app.services.session_cache import load_session_telemetry
+from app.services.telemetry import _event_name, get_lap_traces, lap_channels, stored_session_telemetry, trace_cache
+from app.services.telemetry_arrays import TELEMETRY_CHANNELS, telemetry_arrays
+from benchmarks.conftest import SEASON
+from benchmarks.replay import reset_caches
+
+ROUNDS = 3
+SAMPLES = 500_000
+POINTS = 1000
+
+
+@pytest.fixture(scope="module")
+def channel():
+    rng = np.random.default_rng(0)
+    x = np.arange(SAMPLES, dtype=np.float64)
+    return x, 200 + 100 * np.sin(x / 700) + rng.normal(0, 3, SAMPLES)
+
+
+def test_lttb(benchmark, channel):
+    indices = benchmark(lttb_indices, *channel, POINTS)
+    assert len(indices) == POINTS and indices[0] == 0 and indices[-1] == SAMPLES - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_min_max(benchmark, channel):
+    x, y = channel
+    indices = benchmark(min_max_indices, y, POINTS)
+    assert len(indices) <= POINTS and np.all(np.diff(indices) > 0)
+    assert y[indices].max() == y.max() and y[indices].min() == y.min()
+
+
+def _cold_traces():
+    reset_caches()
+    shutil.rmtree(trace_cache.directory, ignore_errors=True)
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_get_session_traces_uncached(benchmark, replay, method):
+    trace = benchmark.pedantic(
+        get_lap_traces, args=(SEASON, 1, "R", "VER"), kwargs={"points": POINTS, "method": method},
+        setup=_cold_traces, rounds=ROUNDS,
+    )
+    assert trace["samples"] > 10 * POINTS
+    assert all(len(channel["x"]) <= POINTS for channel in trace["traces"].values())
+
+
+def test_get_lap_traces_cached(benchmark, replay):
+    get_lap_traces(SEASON, 1, "R", "VER", 10, points=200)
+    trace = benchmark.pedantic(
+        get_lap_traces, args=(SEASON, 1, "R", "VER", 10), kwargs={"points": 200},
+        setup=reset_caches, rounds=ROUNDS,
+    )
+    assert trace["lap_time_ms"] and len(trace["traces"]["speed"]["x"]) == 200
+
+
+def _cold_arrays():
+    reset_caches()
+    shutil.rmtree(telemetry_arrays.root, ignore_errors=True)
+
+
+def test_store_session_telemetry(benchmark, replay):
+    stored = benchmark.pedantic(stored_session_telemetry, args=(SEASON, 1, "R"), setup=_cold_arrays, rounds=ROUNDS)
+    assert len(stored.drivers()) == 20 and stored.index["samples"] > 20 * 10 * POINTS
+
+
+def test_lap_channels_mapped(benchmark, replay):
+    stored_session_telemetry(SEASON, 1, "R")
+    samples = benchmark.pedantic(lap_channels, args=(SEASON, 1, "R", "VER", 10), setup=reset_caches, rounds=ROUNDS)
+    assert set(samples) == set(TELEMETRY_CHANNELS)
+    assert isinstance(samples["speed"], np.memmap) and not samples["speed"].flags.writeable
+
+
+def test_store_without_car_data_is_not_written(replay):
+    _cold_arrays()
+    session = load_session_telemetry(SEASON, _event_name(SEASON, 1), "R")
+    assert telemetry_arrays.write(SEASON, 1, "R", session.laps, {}) == 0
+    assert telemetry_arrays.open(SEASON, 1, "R") is None
+    assert not telemetry_arrays.path(SEASON, 1, "R").exists()
@@ -0,0 +1,93 @@
+"""Tests for sync tracing: span attributes, context propagation and the /traces output."""
+import threading
+import uuid
+import pytest
+from app.services.tracing import RecentSpanExporter, bind_context, span, span_exporter
+
+
+def _trace(name: str) -> dict:
+    """The most recent buffered trace whose root span is name."""
+    return next(trace for trace in span_exporter.traces(limit=1000) if trace["name"] == name)
+
+
+def _spans(trace: dict) -> dict[str, dict]:
+    return {s["name"]: s for s in trace["spans"]}
+
+
+def test_children_inherit_season_and_event():
+    root = f"sync {uuid.uuid4().hex}"
+    with span(root, season=2024, rows=None):
+        with span("session load", event="Bahrain Grand Prix", session_type="R"):
+            with span("extract", season=None):
+                pass
+        with span("other season", season=2023):
+            pass
+
+    spans = _spans(_trace(root))
+    assert spans[root]["attributes"] == {"season": 2024}
+    assert spans["session load"]["attributes"] == {"season": 2024, "event": "Bahrain Grand Prix", "session_type": "R"}
+    # Only season and event are inherited, and only when not set
+    assert spans["extract"]["attributes"] == {"season": 2024, "event": "Bahrain Grand Prix"}
+    assert spans["other season"]["attributes"] == {"season": 2023}
+
+
+def test_span_records_exceptions():
+    root = f"failing sync {uuid.uuid4().hex}"
+    with pytest.raises(ValueError):
+        with span(root):
+            raise ValueError("session load failed")
+    assert _spans(_trace(root))[root]["status"] == "ERROR"
+
+
+def test_bind_context_keeps_worker_spans_in_trace():
+    root = f"threaded sync {uuid.uuid4().hex}"
+
+    def work():
+        with span("worker load"):
+            pass
+
+    with span(root, season=2024):
+        thread = threading.Thread(target=bind_context(work))
+        thread.start()
+        thread.join()
+
+    spans = _spans(_trace(root))
+    assert spans["worker load"]["parent_id"] == spans[root]["span_id"]
+    assert spans["worker load"]["attributes"] == {"season": 2024}
+
+
+def test_traces_endpoint(client):
+    root = f"endpoint sync {uuid.uuid4().hex}"
+    with span(root, season=2024):
+        with span("db upsert", table="drivers", rows=20):
+            pass
+
+    response = client.get("/api/sync/traces", params={"limit": 1})
+    assert response.status_code == 200
+    [trace] = response.json()
+    assert trace["name"] == root and len(trace["trace_id"]) == 32 and trace["duration_ms"] >= 0
+    parent, child = trace["spans"]
+    assert parent["parent_id"] is None and parent["offset_ms"] == 0
+    assert child["name"] == "db upsert" and child["parent_id"] == parent["span_id"]
+    assert child["attributes"] == {"season": 2024, "table": "drivers", "rows": 20}
+    assert child["offset_ms"] >= 0 and child["status"] == "UNSET"
+
+
+def test_exporter_keeps_recent_spans_only():
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    exporter = RecentSpanExporter(max_spans=1)
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer(__name__)
+    parent = tracer.start_span("sync")
+    child = tracer.start_span("session load", context=trace.set_span_in_context(parent))
+    parent.end()
+    child.end()
+
+    # The parent was pushed out of the buffer; its child stands in as the root
+    [only] = exporter.traces()
+    assert only["name"] == "session load" and len(only["spans"]) == 1
+    assert only["spans"][0]["parent_id"] == format(parent.get_span_context().span_id, "016x")